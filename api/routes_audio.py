@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile
@@ -51,7 +52,8 @@ async def list_audio_diaries(limit: int = Query(default=30, ge=1, le=365)):
 async def get_audio_profile(limit: int = Query(default=30, ge=3, le=365)):
     from services.audio_query_service import get_audio_profile_payload
 
-    return get_audio_profile_payload(limit=int(limit))
+    # DB read + profile aggregation are blocking; run them in a worker thread.
+    return await asyncio.to_thread(get_audio_profile_payload, limit=int(limit))
 
 
 @router.get("/api/diary/audio/detail")
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 from pydantic import BaseModel
@@ -25,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 _MODEL_UNAVAILABLE_REPLY = "模型暂时不可用，请稍后重试"
+_CHAT_PROVIDERS = frozenset({"deepseek", "qwen"})
+# Session titles that should be replaced by one derived from the first user message.
+_PLACEHOLDER_TITLES = frozenset({"", "新对话", "历史对话"})
 MAX_VOICE_CHAT_UPLOAD_BYTES = env_int("DIARY_MAX_AUDIO_UPLOAD_MB", 25) * 1024 * 1024
 
 
@@ -103,6 +107,19 @@ def _ensure_session(session_id: Optional[int], first_user_text: str) -> int:
     return create_chat_session(title=title, summary="聊天会话")
 
 
+@lru_cache(maxsize=1)
+def _chat_config() -> Tuple[float, bool, Optional[str]]:
+    """Env-driven chat defaults, read once per process. Call `_chat_config.cache_clear()` to reload."""
+    default_provider = (
+        env_str("CHAT_PREFERRED_PROVIDER") or env_str("CLOUD_DEFAULT_PROVIDER") or ""
+    ).strip().lower()
+    return (
+        env_float("CHAT_TIMEOUT_S", 70.0),
+        env_bool("CHAT_FORCE_CLOUD", False),
+        default_provider if default_provider in _CHAT_PROVIDERS else None,
+    )
+
+
 def _chat_with_bot(
     *,
     bot: Any,
@@ -131,14 +148,8 @@ async def _run_chat_pipeline(
     force_cloud: bool,
     force_local: bool,
 ) -> ChatResponse:
-    chat_timeout_s = env_float("CHAT_TIMEOUT_S", 70.0)
-    default_force_cloud = env_bool("CHAT_FORCE_CLOUD", False)
-    default_provider = (
-        env_str("CHAT_PREFERRED_PROVIDER") or env_str("CLOUD_DEFAULT_PROVIDER") or ""
-    ).strip().lower()
-    preferred_provider = preferred_provider or (
-        default_provider if default_provider in {"deepseek", "qwen"} else None
-    )
+    chat_timeout_s, default_force_cloud, default_provider = _chat_config()
+    preferred_provider = preferred_provider or default_provider
     force_cloud = bool(force_cloud or (default_force_cloud and not force_local))
 
     try:
@@ -275,7 +286,7 @@ async def chat(req: ChatRequest, request: Request):
             text=out.reply,
             meta_json={"source": "api_chat", "has_debug": bool(req.debug)},
         )
-        if existing_session and str(existing_session.get("title") or "").strip() in {"", "新对话", "历史对话"}:
+        if existing_session and str(existing_session.get("title") or "").strip() in _PLACEHOLDER_TITLES:
             update_chat_session(session_id, title=_derive_session_title(req.text), updated_at=None)
         else:
             update_chat_session(session_id, updated_at=None)
@@ -319,7 +330,7 @@ async def voice_chat(
         text=transcript,
         mode="chat",
         debug=debug,
-        preferred_provider=preferred_provider if preferred_provider in {"deepseek", "qwen"} else None,
+        preferred_provider=preferred_provider if preferred_provider in _CHAT_PROVIDERS else None,
         force_cloud=force_cloud,
         force_local=force_local,
     )
@@ -342,7 +353,7 @@ async def voice_chat(
             text=reply,
             meta_json={"source": "voice_chat"},
         )
-        if existing_session and str(existing_session.get("title") or "").strip() in {"", "新对话", "历史对话"}:
+        if existing_session and str(existing_session.get("title") or "").strip() in _PLACEHOLDER_TITLES:
             update_chat_session(session_id, title=_derive_session_title(transcript))
         else:
             update_chat_session(session_id)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
-from core.settings import env_int, env_str
-from storage.db_core import connect
+from core.settings import env_float, env_int, env_str
+from storage.db_core import read_connection
+from storage.repo_jobs import block_job_status_counts
 from storage.repo_entries import (
     delete_entry,
     get_entry,
@@ -59,6 +63,27 @@ class ReanalyzeDiaryRequest(BaseModel):
     job_timeout_s: Optional[int] = None
 
 
+class DiaryListItem(BaseModel):
+    entry_id: int
+    date: str
+    created_at: str
+    preview: str
+    size_bytes: int
+    analysis_ready: bool
+    analysis_status: str
+    analysis_summary: str
+    analysis_error: str
+
+
+class DiaryListResponse(BaseModel):
+    ok: bool = True
+    count: int
+    items: List[DiaryListItem]
+    # Cursor for the next page (pass back as before/before_id); None when this page is short.
+    next_before: Optional[str] = None
+    next_before_id: Optional[int] = None
+
+
 class AnalyzeLatestRequest(BaseModel):
     entry_limit: int = 60
     job_limit: int = 300
@@ -68,16 +93,40 @@ class AnalyzeLatestRequest(BaseModel):
     job_timeout_s: int = 180
 
 
-@router.get("/api/diary/list")
-async def list_diaries(request: Request, limit: int = Query(default=30, ge=1, le=365)):
-    rows = list_recent_entries_overview(
+@lru_cache(maxsize=1)
+def _analysis_defaults() -> Tuple[str, int, int]:
+    """(provider, max_attempts, job_timeout_s) for queued analysis, read from env once per process."""
+    provider = normalize_provider(
+        env_str("DIARY_SAVE_PREFERRED_PROVIDER") or env_str("CLOUD_DEFAULT_PROVIDER", "deepseek") or "deepseek"
+    )
+    return (
+        provider,
+        env_int("DIARY_ANALYZE_MAX_ATTEMPTS", 8),
+        env_int("DIARY_ANALYZE_JOB_TIMEOUT_S", 180),
+    )
+
+
+# response_model lets FastAPI serialize the list straight to JSON bytes via pydantic-core
+# instead of jsonable_encoder + json.dumps over up to 365 dicts.
+@router.get("/api/diary/list", response_model=DiaryListResponse)
+async def list_diaries(
+    request: Request,
+    limit: int = Query(default=30, ge=1, le=365),
+    before: Optional[str] = Query(default=None, max_length=64),
+    before_id: Optional[int] = Query(default=None, ge=1),
+):
+    # The overview query joins entries/jobs/analysis; keep it off the event loop.
+    rows = await asyncio.to_thread(
+        list_recent_entries_overview,
         limit=int(limit),
-        max_attempts=env_int("DIARY_ANALYZE_MAX_ATTEMPTS", 8),
+        max_attempts=_analysis_defaults()[1],
+        before=before,
+        before_id=before_id,
     )
     items = []
     for r in rows:
         created_at = str(r.get("created_at") or "")
-        text = str(r.get("raw_text") or "")
+        text = str(r.get("raw_text_head") or "")
         preview = " ".join(text.strip().split())[:80]
         items.append(
             {
@@ -85,7 +134,7 @@ async def list_diaries(request: Request, limit: int = Query(default=30, ge=1, le
                 "date": created_at[:10] if len(created_at) >= 10 else "",
                 "created_at": created_at,
                 "preview": preview,
-                "size_bytes": len(text.encode("utf-8")),
+                "size_bytes": int(r.get("size_bytes") or 0),
                 "analysis_ready": bool(r.get("analysis_ready")),
                 "analysis_status": str(r.get("analysis_status") or "idle"),
                 "analysis_summary": str(r.get("analysis_summary") or ""),
@@ -93,17 +142,36 @@ async def list_diaries(request: Request, limit: int = Query(default=30, ge=1, le
             }
         )
 
-    return {"ok": True, "count": len(items), "items": items}
+    next_before: Optional[str] = None
+    next_before_id: Optional[int] = None
+    if len(items) >= int(limit):
+        next_before = items[-1]["created_at"]
+        next_before_id = items[-1]["entry_id"]
+    return {
+        "ok": True,
+        "count": len(items),
+        "items": items,
+        "next_before": next_before,
+        "next_before_id": next_before_id,
+    }
 
 
 @router.get("/api/diary/read")
-async def read_diary(request: Request, date: str = Query(...)):
+async def read_diary(request: Request, response: Response, date: str = Query(...)):
     diaries_path = diaries_dir(request)
     file_path = safe_diary_path(diaries_path, date)
-    if not file_path.exists():
+    try:
+        st = await asyncio.to_thread(file_path.stat)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": f"diary not found: {date}"})
 
-    text = file_path.read_text(encoding="utf-8", errors="ignore")
+    # Unchanged file (same mtime + size) => 304 from one stat(), without reading it again.
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if etag in (t.strip() for t in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    text = await asyncio.to_thread(file_path.read_text, encoding="utf-8", errors="ignore")
+    response.headers["ETag"] = etag
     return {"ok": True, "date": date, "file": str(file_path), "text": text}
 
 
@@ -136,14 +204,12 @@ async def update_diary_entry(req: UpdateDiaryRequest, request: Request):
     file_path: Optional[Path] = None
     backup_warning = ""
     try:
-        file_path = rewrite_daily_backup_from_db(request=request, date_str=date_str)
+        file_path = await asyncio.to_thread(rewrite_daily_backup_from_db, request=request, date_str=date_str)
     except Exception as e:
         backup_warning = f"daily backup rewrite failed: {type(e).__name__}: {e}"
         logger.warning(backup_warning)
 
-    provider = normalize_provider(env_str("DIARY_SAVE_PREFERRED_PROVIDER") or env_str("CLOUD_DEFAULT_PROVIDER", "deepseek") or "deepseek")
-    max_attempts = env_int("DIARY_ANALYZE_MAX_ATTEMPTS", 8)
-    job_timeout_s = env_int("DIARY_ANALYZE_JOB_TIMEOUT_S", 180)
+    provider, max_attempts, job_timeout_s = _analysis_defaults()
     queue_entry_analysis(
         base_dir=Path(getattr(request.app.state, "base_dir", Path(__file__).resolve().parent)),
         entry_id=int(req.id),
@@ -152,6 +218,7 @@ async def update_diary_entry(req: UpdateDiaryRequest, request: Request):
         job_timeout_s=job_timeout_s,
         force_reanalyze=True,
     )
+    _invalidate_status_cache()
     detail = get_entry_detail_payload(int(req.id)) or {}
     return {
         "ok": True,
@@ -176,7 +243,9 @@ async def delete_diary_entry(request: Request, id: int = Query(..., ge=1)):
         raise HTTPException(status_code=404, detail={"code": "NOT_FOUND", "message": f"entry not found: {id}"})
     date_str = date_from_created_at(str(entry.get("created_at") or ""))
     delete_entry(int(id))
-    file_path = rewrite_daily_backup_from_db(request=request, date_str=date_str)
+    _invalidate_status_cache()
+    # Rewriting the day's .txt backup reads every entry of that day; keep the file I/O off the loop.
+    file_path = await asyncio.to_thread(rewrite_daily_backup_from_db, request=request, date_str=date_str)
     remaining = list_entries_by_date(date_str)
     return {
         "ok": True,
@@ -198,10 +267,11 @@ async def reanalyze_diary_entry(req: ReanalyzeDiaryRequest, request: Request):
         base_dir=Path(getattr(request.app.state, "base_dir", Path(__file__).resolve().parent)),
         entry_id=int(req.id),
         preferred_provider=provider,
-        max_attempts=int(req.max_attempts or env_int("DIARY_ANALYZE_MAX_ATTEMPTS", 8)),
-        job_timeout_s=int(req.job_timeout_s or env_int("DIARY_ANALYZE_JOB_TIMEOUT_S", 180)),
+        max_attempts=int(req.max_attempts or _analysis_defaults()[1]),
+        job_timeout_s=int(req.job_timeout_s or _analysis_defaults()[2]),
         force_reanalyze=bool(req.force_reanalyze),
     )
+    _invalidate_status_cache()
     detail = get_entry_detail_payload(int(req.id)) or {}
     return {
         "ok": True,
@@ -219,7 +289,9 @@ async def reanalyze_diary_entry(req: ReanalyzeDiaryRequest, request: Request):
 @router.post("/api/diary/analyze_latest")
 async def analyze_latest(req: AnalyzeLatestRequest, request: Request):
     base_dir = Path(getattr(request.app.state, "base_dir", Path(__file__).resolve().parent))
-    queued = queue_latest_analysis(
+    # The backfill walks entries and writes blocks/jobs; run it off the event loop.
+    queued = await asyncio.to_thread(
+        queue_latest_analysis,
         base_dir=base_dir,
         entry_limit=req.entry_limit,
         job_limit=req.job_limit,
@@ -228,6 +300,7 @@ async def analyze_latest(req: AnalyzeLatestRequest, request: Request):
         max_attempts=req.max_attempts,
         job_timeout_s=req.job_timeout_s,
     )
+    _invalidate_status_cache()
     return {
         "ok": True,
         "queued": bool(queued.get("queued", False)),
@@ -237,26 +310,51 @@ async def analyze_latest(req: AnalyzeLatestRequest, request: Request):
     }
 
 
+# "gen" is bumped on every invalidation; a fetch that started before one does not store its result.
+_status_cache: dict = {"t": 0.0, "v": None, "gen": 0}
+# asyncio.Lock binds to the loop it is first contended on; keep one per running loop.
+_status_lock: dict = {"loop": None, "lock": None}
+
+
+def _get_status_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    if _status_lock["loop"] is not loop:
+        _status_lock["loop"] = loop
+        _status_lock["lock"] = asyncio.Lock()
+    return _status_lock["lock"]
+
+
+def _invalidate_status_cache() -> None:
+    """Drop cached job counts so the next poll reflects jobs just queued or deleted."""
+    _status_cache["v"] = None
+    _status_cache["gen"] += 1
+
+
+def _fetch_job_stats() -> dict:
+    return block_job_status_counts(read_connection())
+
+
 @router.get("/api/diary/analyze_status")
 async def analyze_status():
-    conn = connect()
-    try:
-        rows = conn.execute("SELECT status, COUNT(*) AS n FROM block_jobs GROUP BY status").fetchall()
-        stats = {"pending": 0, "running": 0, "done": 0, "failed": 0, "skipped": 0, "total": 0}
-        for r in rows:
-            s = str(r["status"])
-            n = int(r["n"])
-            if s in stats:
-                stats[s] = n
-            stats["total"] += n
-        return {"ok": True, "stats": stats}
-    finally:
-        conn.close()
+    # Polled by the UI every few seconds; collapse concurrent pollers into one query per TTL window.
+    ttl_s = env_float("DIARY_ANALYZE_STATUS_TTL_S", 2.0)
+    if ttl_s > 0 and _status_cache["v"] is not None and time.monotonic() - _status_cache["t"] < ttl_s:
+        return {"ok": True, "stats": dict(_status_cache["v"])}
+    async with _get_status_lock():
+        if ttl_s > 0 and _status_cache["v"] is not None and time.monotonic() - _status_cache["t"] < ttl_s:
+            return {"ok": True, "stats": dict(_status_cache["v"])}
+        gen = _status_cache["gen"]
+        stats = await asyncio.to_thread(_fetch_job_stats)
+        if _status_cache["gen"] == gen:
+            _status_cache["t"] = time.monotonic()
+            _status_cache["v"] = stats
+    return {"ok": True, "stats": dict(stats)}
 
 
 @router.post("/api/diary/save")
 async def save_diary(req: SaveDiaryRequest, request: Request):
     """保存日记：写 txt 备份 + 增量写 SQLite，并在后台触发分析。"""
+    text = (req.text or "").strip()
     logger.info(f"保存日记: 长度={len(req.text)}")
 
     # 1) 先做 ingest，避免输入非法时先写入 txt 造成文件/数据库状态分裂
@@ -269,7 +367,7 @@ async def save_diary(req: SaveDiaryRequest, request: Request):
         raise RuntimeError("ingest 未就绪：请确认存在 pipeline/ingest.py（ingest_entry）")
 
     try:
-        ingest_res = await ingest_entry(text=req.text, source="api")
+        ingest_res = await ingest_entry(text=text, source="api")
     except InputError as e:
         # 空文本 / 超长等可解释错误
         msg = str(e)
@@ -278,37 +376,48 @@ async def save_diary(req: SaveDiaryRequest, request: Request):
 
     # 3) ingest 成功后再写 txt 备份；备份失败不影响主库成功写入
     ts = utc_now_iso()
-    file_path: Optional[Path] = None
-    backup_warning = ""
-    try:
-        file_path = append_daily_backup_entry(
-            request=request,
-            date_str=date_str,
-            created_at=ts,
-            text=req.text,
-        )
-    except Exception as e:
-        backup_warning = f"daily backup append failed: {type(e).__name__}: {e}"
-        logger.warning(backup_warning)
+
+    async def _append_backup() -> tuple[Optional[Path], str]:
+        try:
+            path = await asyncio.to_thread(
+                append_daily_backup_entry,
+                request=request,
+                date_str=date_str,
+                created_at=ts,
+                text=text,
+            )
+            return path, ""
+        except Exception as e:
+            warning = f"daily backup append failed: {type(e).__name__}: {e}"
+            logger.warning(warning)
+            return None, warning
 
     entry_id = ingest_res.get("entry_id")
 
-    provider = normalize_provider(env_str("DIARY_SAVE_PREFERRED_PROVIDER") or env_str("CLOUD_DEFAULT_PROVIDER", "deepseek") or "deepseek")
-    max_attempts = env_int("DIARY_ANALYZE_MAX_ATTEMPTS", 8)
-    job_timeout_s = env_int("DIARY_ANALYZE_JOB_TIMEOUT_S", 180)
+    provider, max_attempts, job_timeout_s = _analysis_defaults()
     base_dir = Path(getattr(request.app.state, "base_dir", Path(__file__).resolve().parent))
     queued_blocks = int(ingest_res.get("queued_blocks", 0) or 0)
     analysis_queued = bool(entry_id) and queued_blocks > 0
-    if analysis_queued:
-        queue_entry_analysis(
-            base_dir=base_dir,
-            entry_id=int(entry_id),
-            preferred_provider=provider,
-            max_attempts=max_attempts,
-            job_timeout_s=job_timeout_s,
-            force_reanalyze=False,
-        )
-    detail = get_entry_detail_payload(int(entry_id)) or {}
+
+    def _enqueue_and_load_detail() -> dict:
+        if analysis_queued:
+            queue_entry_analysis(
+                base_dir=base_dir,
+                entry_id=int(entry_id),
+                preferred_provider=provider,
+                max_attempts=max_attempts,
+                job_timeout_s=job_timeout_s,
+                force_reanalyze=False,
+            )
+        return get_entry_detail_payload(int(entry_id)) or {}
+
+    # 4) txt 备份与 SQLite 入队/详情读取互不依赖，并发执行
+    (file_path, backup_warning), detail = await asyncio.gather(
+        _append_backup(),
+        asyncio.to_thread(_enqueue_and_load_detail),
+    )
+    if queued_blocks > 0:
+        _invalidate_status_cache()
 
     return {
         "ok": True,
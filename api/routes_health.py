@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
 import json
@@ -9,11 +10,11 @@ from typing import Any, Dict
 
 from fastapi import APIRouter
 
-from storage.db_core import connect, get_db_path
+from storage.db_core import get_db_path, read_snapshot
+from storage.repo_jobs import block_job_status_counts
 
 router = APIRouter()
 
-JOB_STATUSES = ("pending", "running", "failed", "done", "skipped")
 COUNT_TABLES = {"entries", "entry_blocks"}
 
 
@@ -25,16 +26,7 @@ def _count_table(conn: sqlite3.Connection, table: str) -> int:
 
 
 def _job_counts(conn: sqlite3.Connection) -> Dict[str, int]:
-    counts: Dict[str, int] = {status: 0 for status in JOB_STATUSES}
-    counts["total"] = 0
-    rows = conn.execute("SELECT status, COUNT(*) AS n FROM block_jobs GROUP BY status").fetchall()
-    for row in rows:
-        status = str(row["status"] or "")
-        n = int(row["n"] or 0)
-        if status in counts:
-            counts[status] = n
-        counts["total"] += n
-    return counts
+    return block_job_status_counts(conn)
 
 
 def _latest_rollup(conn: sqlite3.Connection) -> Dict[str, Any]:
@@ -125,15 +117,12 @@ def _audio_status() -> Dict[str, Any]:
 
 def build_health_summary() -> Dict[str, Any]:
     db_path = Path(get_db_path()).expanduser().resolve()
-    conn = connect()
-    try:
+    with read_snapshot() as conn:
         entries_count = _count_table(conn, "entries")
         blocks_count = _count_table(conn, "entry_blocks")
         jobs = _job_counts(conn)
         latest_rollup = _latest_rollup(conn)
         fts = _fts_status(conn)
-    finally:
-        conn.close()
 
     context_pack = _context_pack_status()
     return {
@@ -157,4 +146,4 @@ def build_health_summary() -> Dict[str, Any]:
 
 @router.get("/api/health")
 async def health_summary():
-    return build_health_summary()
+    return await asyncio.to_thread(build_health_summary)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections import Counter
+import asyncio
 
 from fastapi import APIRouter, Query, Request
 
-from storage.repo_entries import list_recent_entry_summaries
-from storage.db_core import connect
+from storage.repo_entries import count_recent_analysis_topics
+from storage.db_core import read_snapshot
+from storage.repo_jobs import block_job_status_counts
 
 router = APIRouter()
 
@@ -47,41 +48,26 @@ async def routes_info(request: Request):
     }
 
 
+def _fetch_overview_counts() -> tuple:
+    with read_snapshot() as conn:
+        entries_count = int(conn.execute("SELECT COUNT(*) AS n FROM entries").fetchone()["n"])
+        latest_row = conn.execute(
+            "SELECT id, created_at FROM entries ORDER BY created_at DESC LIMIT 1"
+        ).fetchone()
+        return entries_count, latest_row, block_job_status_counts(conn)
+
+
 @router.get("/api/dashboard/overview")
 async def dashboard_overview(limit: int = Query(default=90, ge=10, le=365)):
     del limit
 
-    recent = list_recent_entry_summaries(24)
-    topic_counter: Counter[str] = Counter()
-    for row in recent:
-        for topic in (row.get("topics") or []):
-            t = str(topic or "").strip()
-            if t:
-                topic_counter[t] += 1
-
-    focus_lines = [topic for topic, _count in topic_counter.most_common(6)]
+    # Topic counting runs in SQLite (JSON1); no per-row json.loads in Python.
+    top_topics = await asyncio.to_thread(count_recent_analysis_topics, 24, 6)
+    focus_lines = [topic for topic, _count in top_topics]
     if not focus_lines:
         focus_lines = ["最近还没有足够的分析结果。"]
 
-    conn = connect()
-    try:
-        entries_count = int(conn.execute("SELECT COUNT(*) AS n FROM entries").fetchone()["n"])
-        latest_row = conn.execute(
-            "SELECT id, created_at FROM entries ORDER BY created_at DESC LIMIT 1"
-        ).fetchone()
-        job_rows = conn.execute(
-            "SELECT status, COUNT(*) AS n FROM block_jobs GROUP BY status"
-        ).fetchall()
-    finally:
-        conn.close()
-
-    analysis_jobs = {"pending": 0, "running": 0, "done": 0, "failed": 0, "skipped": 0, "total": 0}
-    for row in job_rows:
-        status = str(row["status"] or "")
-        count = int(row["n"] or 0)
-        if status in analysis_jobs:
-            analysis_jobs[status] = count
-        analysis_jobs["total"] += count
+    entries_count, latest_row, analysis_jobs = await asyncio.to_thread(_fetch_overview_counts)
 
     latest_entry = {
         "entry_id": int(latest_row["id"]) if latest_row else None,
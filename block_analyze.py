@@ -1,7 +1,6 @@
 # block_analyze.py
 from __future__ import annotations
 
-import json
 import os
 import re
 from dataclasses import dataclass
@@ -9,6 +8,7 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from llm.ollama_client import OllamaClient
 from pipeline.analysis_quality import attach_analysis_quality
+from utils.json_extract import extract_json_span as _extract_json_object, dumps_json, first_json_object, loads_json
 
 from core.settings import (
     MAX_BLOCK_CHARS,
@@ -19,7 +19,7 @@ from core.settings import (
 )
 
 # Back-compat exports used by scripts (do not rename).
-PROMPT_VERSION = f"{PROMPT_VERSION_BLOCK}:staged_v1"
+PROMPT_VERSION = f"{PROMPT_VERSION_BLOCK}:staged_v2"
 
 
 # Keep generation short to reduce idle-time analysis latency.
@@ -36,8 +36,12 @@ class AnalysisValidationError(RuntimeError):
     pass
 
 
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+_NUM_RE = re.compile(r"(-?\d+(?:\.\d+)?)")
+
+
 def _count_cjk(text: str) -> int:
-    return len(re.findall(r"[\u4e00-\u9fff]", str(text or "")))
+    return len(_CJK_RE.findall(str(text or "")))
 
 
 def _extract_latin_words(text: str) -> List[str]:
@@ -211,14 +215,15 @@ def _looks_like_noise_block(text: str) -> bool:
     return False
 
 
-def _extract_json_object(s: str) -> str:
-    if not s:
-        return s
-    start = s.find("{")
-    end = s.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        return s.strip()
-    return s[start : end + 1].strip()
+def _load_first_json_object(raw: str) -> Optional[Any]:
+    """Fast path: decode the first balanced object; None sends the caller to the repair chain."""
+    cand = first_json_object(raw)
+    if cand is None:
+        return None
+    try:
+        return loads_json(cand)
+    except ValueError:
+        return None
 
 
 def _repair_json_common_issues(s: str) -> str:
@@ -316,19 +321,63 @@ def _repair_json_missing_commas(s: str) -> str:
 
 
 def _try_repair_json_lines(s: str) -> str:
-    s = s.replace("\r\n", "\n")
-    cleaned: List[str] = []
-    for line in s.split("\n"):
-        ls = line.lstrip()
-        if not ls:
-            continue
-        if ls.startswith("{") or ls.startswith("}"):
-            cleaned.append(line)
-            continue
-        if ls.startswith('"') and '":' in ls:
-            cleaned.append(line)
-            continue
-    return "\n".join(cleaned).strip()
+    # Keep only structural lines (braces / `"key": ...` members); a "\r" left by "\r\n" is JSON whitespace.
+    return "\n".join(
+        line
+        for line in s.split("\n")
+        if (ls := line.lstrip()) and (ls[0] in "{}" or (ls[0] == '"' and '":' in ls))
+    ).strip()
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.S | re.I)
+_DANGLING_TAIL_RE = re.compile(r'(?:,\s*"(?:[^"\\]|\\.)*"\s*:\s*|[,:\s]+)$')
+
+
+def _close_truncated_json(s: str) -> str:
+    """Close an object cut off between values: drop a dangling key, add missing closers.
+
+    Output cut off inside a string is returned unchanged: closing it would accept truncated
+    content (e.g. half a summary) as a valid answer, so that case is left to the model repair.
+    """
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    for ch in s:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+    if in_string or not stack:
+        return s
+    s = _DANGLING_TAIL_RE.sub("", s)
+    return s + "".join(reversed(stack))
+
+
+def _local_repair_json(raw: str) -> str:
+    """
+    Offline fixes for shallow formatting failures, tried before asking the model to repair its output:
+    markdown fences, Python-style single quotes, and truncated objects.
+    """
+    s = str(raw or "").strip()
+    m = _FENCE_RE.search(s)
+    if m:
+        s = m.group(1).strip()
+    start = s.find("{")
+    if start == -1:
+        return s
+    s = s[start:]
+    if '"' not in s and "'" in s:
+        s = s.replace("'", '"')
+    return _close_truncated_json(s)
 
 
 def _coerce_signal(v: Any) -> int | None:
@@ -341,7 +390,11 @@ def _coerce_signal(v: Any) -> int | None:
             return None
         return int(round(v)) if 0.0 <= v <= 10.0 else None
     if isinstance(v, str):
-        m = re.search(r"(-?\d+(?:\.\d+)?)", v)
+        s = v.strip()
+        if s.isdecimal():  # common "7": skip the regex scan
+            num = int(s)
+            return num if num <= 10 else None
+        m = _NUM_RE.search(s)
         if not m:
             return None
         try:
@@ -352,6 +405,20 @@ def _coerce_signal(v: Any) -> int | None:
     return None
 
 
+_REQUIRED_KEYS = ("summary_1_3", "signals", "facts", "todos", "topics", "open_insight")
+_SIGNAL_KEYS = ("mood", "stress", "sleep", "exercise", "social", "work")
+_STR_LIST_KEYS = ("facts", "todos", "topics", "evidence_spans", "psychological_themes", "tensions", "needs", "patterns", "memory_candidates")
+
+
+def _coerce_str_list(v: Any, _scalar: tuple = (str, int, float)) -> List[str]:
+    """Scalars as strings, blanks dropped; a list that is already clean strings is returned as-is."""
+    if type(v) is not list:
+        return []
+    if all(type(x) is str and x.strip() for x in v):
+        return v
+    return [s for x in v if isinstance(x, _scalar) and (s := str(x)).strip()]
+
+
 def _normalize(obj: Dict[str, Any]) -> Dict[str, Any]:
     obj.setdefault("evidence_spans", [])
     obj.setdefault("reflection_depth", None)
@@ -364,17 +431,11 @@ def _normalize(obj: Dict[str, Any]) -> Dict[str, Any]:
 
     sig = obj.get("signals")
     if isinstance(sig, dict):
-        for k in ("mood", "stress", "sleep", "exercise", "social", "work"):
+        for k in _SIGNAL_KEYS:
             sig[k] = _coerce_signal(sig.get(k))
 
-    for k in ("facts", "todos", "topics", "evidence_spans", "psychological_themes", "tensions", "needs", "patterns", "memory_candidates"):
-        v = obj.get(k)
-        if v is None:
-            obj[k] = []
-        elif isinstance(v, list):
-            obj[k] = [str(x) for x in v if isinstance(x, (str, int, float)) and str(x).strip()]
-        else:
-            obj[k] = []
+    for k in _STR_LIST_KEYS:
+        obj[k] = _coerce_str_list(obj.get(k))
 
     if "summary_1_3" in obj and obj["summary_1_3"] is not None and not isinstance(obj["summary_1_3"], str):
         obj["summary_1_3"] = str(obj["summary_1_3"])
@@ -394,8 +455,7 @@ def _normalize(obj: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _validate(obj: Dict[str, Any]) -> None:
-    required = ["summary_1_3", "signals", "facts", "todos", "topics", "open_insight"]
-    missing = [k for k in required if k not in obj]
+    missing = [k for k in _REQUIRED_KEYS if k not in obj]
     if missing:
         raise AnalysisValidationError(f"missing keys: {missing}")
 
@@ -408,7 +468,7 @@ def _validate(obj: Dict[str, Any]) -> None:
     if not isinstance(signals, dict):
         raise AnalysisValidationError("signals must be an object")
 
-    for k in ("mood", "stress", "sleep", "exercise", "social", "work"):
+    for k in _SIGNAL_KEYS:
         if k not in signals:
             raise AnalysisValidationError(f"missing signals.{k}")
         v = signals.get(k)
@@ -417,8 +477,9 @@ def _validate(obj: Dict[str, Any]) -> None:
         if not isinstance(v, int) or v < 0 or v > 10:
             raise AnalysisValidationError(f"signals.{k} must be int 0-10 or null")
 
-    for k in ("facts", "todos", "topics", "evidence_spans", "psychological_themes", "tensions", "needs", "patterns", "memory_candidates"):
-        if not isinstance(obj.get(k), list) or any(not isinstance(x, str) for x in obj.get(k, [])):
+    for k in _STR_LIST_KEYS:
+        lst = obj.get(k)
+        if not isinstance(lst, list) or not all(isinstance(x, str) for x in lst):
             raise AnalysisValidationError(f"{k} must be an array of strings")
 
     rd = obj.get("reflection_depth")
@@ -517,19 +578,21 @@ def _validate_evidence_obj(obj: Dict[str, Any], *, raw_text: str) -> None:
 
 def _parse_evidence_or_raise(raw: str, *, raw_text: str) -> Dict[str, Any]:
     candidates = _build_evidence_candidates(raw_text)
-    cand = _extract_json_object(raw)
-    try:
-        obj = json.loads(cand)
-    except Exception:
-        repaired = _repair_json_common_issues(cand)
+    obj = _load_first_json_object(raw)
+    if obj is None:
+        cand = _extract_json_object(raw)
         try:
-            obj = json.loads(repaired)
-        except Exception as e:
-            repaired_lines = _try_repair_json_lines(repaired)
+            obj = loads_json(cand)
+        except Exception:
+            repaired = _repair_json_common_issues(cand)
             try:
-                obj = json.loads(repaired_lines)
-            except Exception as e2:
-                raise AnalysisValidationError(f"non-JSON evidence output: {e2}") from e2
+                obj = loads_json(repaired)
+            except Exception as e:
+                repaired_lines = _try_repair_json_lines(repaired)
+                try:
+                    obj = loads_json(repaired_lines)
+                except Exception as e2:
+                    raise AnalysisValidationError(f"non-JSON evidence output: {e2}") from e2
     if not isinstance(obj, dict):
         raise AnalysisValidationError("evidence top-level must be an object")
     obj = _normalize_evidence_obj(obj, raw_text=raw_text, candidates=candidates)
@@ -563,19 +626,21 @@ def _validate_deep_obj(obj: Dict[str, Any]) -> None:
 
 
 def _parse_deep_or_raise(raw: str, *, raw_text: str) -> Dict[str, Any]:
-    cand = _extract_json_object(raw)
-    try:
-        obj = json.loads(cand)
-    except Exception:
-        repaired = _repair_json_common_issues(cand)
+    obj = _load_first_json_object(raw)
+    if obj is None:
+        cand = _extract_json_object(raw)
         try:
-            obj = json.loads(repaired)
-        except Exception as e:
-            repaired_lines = _try_repair_json_lines(repaired)
+            obj = loads_json(cand)
+        except Exception:
+            repaired = _repair_json_common_issues(cand)
             try:
-                obj = json.loads(repaired_lines)
-            except Exception as e2:
-                raise AnalysisValidationError(f"non-JSON deep output: {e2}") from e2
+                obj = loads_json(repaired)
+            except Exception as e:
+                repaired_lines = _try_repair_json_lines(repaired)
+                try:
+                    obj = loads_json(repaired_lines)
+                except Exception as e2:
+                    raise AnalysisValidationError(f"non-JSON deep output: {e2}") from e2
     if not isinstance(obj, dict):
         raise AnalysisValidationError("deep top-level must be an object")
     obj = _normalize_deep_obj(obj)
@@ -618,10 +683,10 @@ def _build_evidence_messages(*, title: str | None, raw_text: str) -> List[Dict[s
         "If the diary block is mainly Chinese, all non-candidate text must be in Chinese. "
         "Select evidence by candidate id only."
     )
-    header = f"TITLE: {(title or '').strip()}\n" if (title or "").strip() else ""
+    header = f"TITLE: {title}\n" if title else ""
     user = (
         "Build evidence selection from the DIARY BLOCK.\n"
-        f"TEMPLATE: {json.dumps(template, ensure_ascii=False)}\n\n"
+        f"TEMPLATE: {dumps_json(template)}\n\n"
         "Rules:\n"
         "- evidence_ids: choose 1-4 ids from the candidate list only.\n"
         "- Never rewrite candidate text. Never output long quotes manually.\n"
@@ -630,9 +695,9 @@ def _build_evidence_messages(*, title: str | None, raw_text: str) -> List[Dict[s
         "- entry_shape: single_thread, multi_thread, or mixed.\n"
         "- Do not summarize the whole diary.\n"
         "- Do not translate the diary.\n\n"
-        f"CANDIDATES:\n{json.dumps(candidates, ensure_ascii=False)}\n\n"
+        f"CANDIDATES:\n{dumps_json(candidates)}\n\n"
         "DIARY BLOCK:\n"
-        f"{header}{raw_text.strip()}\n"
+        f"{header}{raw_text}\n"
     )
     return [{"role": "system", "content": sys}, {"role": "user", "content": user}]
 
@@ -668,10 +733,10 @@ def _build_deep_messages(*, title: str | None, raw_text: str, evidence_obj: Dict
         "Use the evidence units as anchors. "
         "If the diary block is mainly Chinese, all analysis text must be in Chinese."
     )
-    header = f"TITLE: {(title or '').strip()}\n" if (title or "").strip() else ""
+    header = f"TITLE: {title}\n" if title else ""
     user = (
         "Use the evidence units to produce a deep but grounded reading.\n"
-        f"TEMPLATE: {json.dumps(template, ensure_ascii=False)}\n\n"
+        f"TEMPLATE: {dumps_json(template)}\n\n"
         "Rules:\n"
         "- main_threads: 1-2 major threads only, concrete and short.\n"
         "- core_conflict: one concise sentence naming the main inner or situational conflict.\n"
@@ -684,9 +749,9 @@ def _build_deep_messages(*, title: str | None, raw_text: str, evidence_obj: Dict
         "- Do not translate the diary.\n"
         "- Do not output final database fields like signals/facts/todos.\n\n"
         f"{mode_guidance}"
-        f"EVIDENCE REFS:\n{json.dumps(_evidence_refs(evidence_obj), ensure_ascii=False)}\n\n"
+        f"EVIDENCE REFS:\n{dumps_json(_evidence_refs(evidence_obj))}\n\n"
         "DIARY BLOCK:\n"
-        f"{header}{raw_text.strip()}\n"
+        f"{header}{raw_text}\n"
     )
     return [{"role": "system", "content": sys}, {"role": "user", "content": user}]
 
@@ -744,10 +809,10 @@ def _build_normalize_messages(*, title: str | None, raw_text: str, evidence_obj:
         "Only keep English words that already appear in the diary block as product names, acronyms, or quoted evidence."
     )
 
-    header = f"TITLE: {(title or '').strip()}\n" if (title or "").strip() else ""
+    header = f"TITLE: {title}\n" if title else ""
     user = (
         "Normalize the evidence and deep analysis into the final schema.\n"
-        f"TEMPLATE: {json.dumps(template, ensure_ascii=False)}\n\n"
+        f"TEMPLATE: {dumps_json(template)}\n\n"
         "Guidance:\n"
         "- summary_1_3: 1-2 sentences, grounded, concise, mention the actual concern or event.\n"
         "- open_insight: 1-2 sentences only, grounded, specific, derived from evidence + deep analysis.\n"
@@ -769,10 +834,10 @@ def _build_normalize_messages(*, title: str | None, raw_text: str, evidence_obj:
         "- BAD generic examples: '这篇主要在记录当天在做的事', '这篇不是单纯记流水'.\n"
         "- GOOD direction: point to the exact concern, exact conflict, exact trigger, and exact evidence.\n"
         f"{mode_guidance}"
-        f"EVIDENCE REFS:\n{json.dumps(_evidence_refs(evidence_obj), ensure_ascii=False)}\n\n"
-        f"DEEP ANALYSIS JSON:\n{json.dumps(deep_obj, ensure_ascii=False)}\n\n"
+        f"EVIDENCE REFS:\n{dumps_json(_evidence_refs(evidence_obj))}\n\n"
+        f"DEEP ANALYSIS JSON:\n{dumps_json(deep_obj)}\n\n"
         "DIARY BLOCK:\n"
-        f"{header}{raw_text.strip()}\n"
+        f"{header}{raw_text}\n"
     )
 
     return [{"role": "system", "content": sys}, {"role": "user", "content": user}]
@@ -788,7 +853,7 @@ def _build_fix_messages(*, raw_text: str, bad_output: str, template_obj: Dict[st
     )
     user = (
         f"STAGE: {stage_name}\n"
-        f"TEMPLATE: {json.dumps(template_obj, ensure_ascii=False)}\n\n"
+        f"TEMPLATE: {dumps_json(template_obj)}\n\n"
         + (f"PARSE ERROR:\n{parse_error}\n\n" if parse_error else "")
         + "SOURCE DIARY BLOCK:\n" + (raw_text or "")
         + "\n\nBAD OUTPUT:\n" + (bad_output or "")
@@ -797,23 +862,25 @@ def _build_fix_messages(*, raw_text: str, bad_output: str, template_obj: Dict[st
 
 
 def _parse_or_raise(raw: str) -> Dict[str, Any]:
-    cand = _extract_json_object(raw)
-    try:
-        obj = json.loads(cand)
-    except Exception:
-        repaired = _repair_json_common_issues(cand)
+    obj = _load_first_json_object(raw)
+    if obj is None:
+        cand = _extract_json_object(raw)
         try:
-            obj = json.loads(repaired)
-        except Exception as e:
-            repaired_commas = _repair_json_missing_commas(repaired)
+            obj = loads_json(cand)
+        except Exception:
+            repaired = _repair_json_common_issues(cand)
             try:
-                obj = json.loads(repaired_commas)
-            except Exception:
-                repaired_lines = _try_repair_json_lines(repaired_commas)
+                obj = loads_json(repaired)
+            except Exception as e:
+                repaired_commas = _repair_json_missing_commas(repaired)
                 try:
-                    obj = json.loads(repaired_lines)
-                except Exception as e2:
-                    raise AnalysisValidationError(f"non-JSON output: {e2}") from e2
+                    obj = loads_json(repaired_commas)
+                except Exception:
+                    repaired_lines = _try_repair_json_lines(repaired_commas)
+                    try:
+                        obj = loads_json(repaired_lines)
+                    except Exception as e2:
+                        raise AnalysisValidationError(f"non-JSON output: {e2}") from e2
 
     if not isinstance(obj, dict):
         raise AnalysisValidationError("top-level must be an object")
@@ -847,7 +914,7 @@ def _stage_prompt_version(stage: str) -> str:
 
 def _safe_stage_meta(*, title: str | None, raw_text: str, evidence_obj: Optional[Dict[str, Any]] = None, deep_obj: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     meta: Dict[str, Any] = {
-        "title": (title or "").strip() or None,
+        "title": title or None,
         "raw_chars": len(raw_text or ""),
     }
     if evidence_obj is not None:
@@ -894,19 +961,21 @@ async def _run_json_stage(
 ) -> Tuple[Dict[str, Any], int, str, str]:
     messages = build_messages()
     last_output = ""
+    last_res = None
     last_err: Optional[Exception] = None
     for attempt_idx in range(STAGE_GENERATE_ATTEMPTS):
         try:
             res = await stage_caller(stage_name, messages, {"type": "json_object"}, max_tokens)
             last_output = res.output
+            last_res = res
             parsed = parser(res.output)
             _record_stage_safe(
                 stage_recorder,
                 stage=stage_name,
                 prompt_version=_stage_prompt_version(stage_name),
                 status="ok",
-                input_json=json.dumps(input_meta, ensure_ascii=False),
-                output_json=json.dumps(parsed, ensure_ascii=False),
+                input_json=dumps_json(input_meta),
+                output_json=dumps_json(parsed),
                 error=None,
                 ms=res.ms,
                 model=res.model,
@@ -920,13 +989,33 @@ async def _run_json_stage(
                 stage=stage_name,
                 prompt_version=_stage_prompt_version(stage_name),
                 status="failed",
-                input_json=json.dumps(input_meta, ensure_ascii=False),
+                input_json=dumps_json(input_meta),
                 output_json=None,
                 error=f"attempt {attempt_idx + 1}/{STAGE_GENERATE_ATTEMPTS}: {type(first_err).__name__}: {first_err}",
                 ms=None,
                 model=None,
                 backend_override=None,
             )
+            local_output = _local_repair_json(last_output) if last_output else ""
+            if last_res is not None and local_output and local_output != last_output:
+                try:
+                    parsed_local = parser(local_output)
+                except Exception:
+                    parsed_local = None
+                if parsed_local is not None:
+                    _record_stage_safe(
+                        stage_recorder,
+                        stage=f"{stage_name}_local_repair",
+                        prompt_version=_stage_prompt_version(stage_name),
+                        status="ok",
+                        input_json=dumps_json(input_meta),
+                        output_json=dumps_json(parsed_local),
+                        error=None,
+                        ms=0,
+                        model=last_res.model,
+                        backend_override=_stage_backend_from_model(last_res.model),
+                    )
+                    return parsed_local, last_res.ms, last_res.model, local_output
             if last_output:
                 try:
                     fix_messages = _build_fix_messages(
@@ -943,8 +1032,8 @@ async def _run_json_stage(
                         stage=f"{stage_name}_repair",
                         prompt_version=_stage_prompt_version(f"{stage_name}_repair"),
                         status="ok",
-                        input_json=json.dumps(input_meta, ensure_ascii=False),
-                        output_json=json.dumps(parsed2, ensure_ascii=False),
+                        input_json=dumps_json(input_meta),
+                        output_json=dumps_json(parsed2),
                         error=None,
                         ms=res2.ms,
                         model=res2.model,
@@ -958,7 +1047,7 @@ async def _run_json_stage(
                         stage=f"{stage_name}_repair",
                         prompt_version=_stage_prompt_version(f"{stage_name}_repair"),
                         status="failed",
-                        input_json=json.dumps(input_meta, ensure_ascii=False),
+                        input_json=dumps_json(input_meta),
                         output_json=None,
                         error=f"attempt {attempt_idx + 1}/{STAGE_GENERATE_ATTEMPTS}: {type(second_err).__name__}: {second_err}",
                         ms=None,
@@ -994,6 +1083,8 @@ async def run_staged_block_analysis(
     fallback_stage_caller: Optional[StageCaller] = None,
     stage_recorder: Optional[StageRecorder] = None,
 ) -> BlockAnalyzeResult:
+    # Strip once here; the stage prompt builders take title/raw_text as already cleaned.
+    title = (title or "").strip()
     text = (raw_text or "").strip()
     if len(text) < MIN_BLOCK_CHARS:
         raise BlockInputError(f"block too short: {len(text)} chars")
@@ -1074,8 +1165,8 @@ async def run_staged_block_analysis(
                 stage="validate",
                 prompt_version=_stage_prompt_version("validate"),
                 status="rejected",
-                input_json=json.dumps(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj), ensure_ascii=False),
-                output_json=json.dumps(final_obj, ensure_ascii=False),
+                input_json=dumps_json(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj)),
+                output_json=dumps_json(final_obj),
                 error="analysis contains unsupported English output for Chinese diary",
                 ms=0,
                 model=normalize_model,
@@ -1090,8 +1181,8 @@ async def run_staged_block_analysis(
                 stage="validate",
                 prompt_version=_stage_prompt_version("validate"),
                 status="rejected",
-                input_json=json.dumps(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj), ensure_ascii=False),
-                output_json=json.dumps(final_obj, ensure_ascii=False),
+                input_json=dumps_json(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj)),
+                output_json=dumps_json(final_obj),
                 error="normalized analysis rejected by quality gate",
                 ms=0,
                 model=normalize_model,
@@ -1103,8 +1194,8 @@ async def run_staged_block_analysis(
             stage="final",
             prompt_version=_stage_prompt_version("final"),
             status="ok",
-            input_json=json.dumps(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj), ensure_ascii=False),
-            output_json=json.dumps(final_obj, ensure_ascii=False),
+            input_json=dumps_json(_safe_stage_meta(title=title, raw_text=text, evidence_obj=evidence_obj, deep_obj=deep_obj)),
+            output_json=dumps_json(final_obj),
             error=None,
             ms=evidence_ms + deep_ms + normalize_ms,
             model=normalize_model,
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
-import json
 import logging
 import os
 import re
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import xxhash  # type: ignore  # optional: faster non-cryptographic digests
+except Exception:  # pragma: no cover
+    xxhash = None
 
 try:
     from bot.generation_router import generate as routed_generate
@@ -20,8 +26,9 @@ from llm.ollama_client import OllamaClient
 from llm.providers import ProviderError, ProviderResult
 from services.chat_context_service import build_self_profile_pack, fallback_self_profile_answer
 from services.retrieval_service import build_context_pack, build_context_pack_text
+from utils.json_extract import dumps_json, loads_first_json_object
 
-ROUTE_PROMPT_VERSION = "phi_route_v1"
+ROUTE_PROMPT_VERSION = "phi_route_v2"
 ANSWER_PROMPT_VERSION = "grounded_answer_v1"
 
 # Per-model hard timeouts (seconds)
@@ -31,22 +38,73 @@ ANSWER_TIMEOUT_S = float(os.getenv("ANSWER_TIMEOUT_S", os.getenv("QWEN_TIMEOUT_S
 # Total request budget (seconds) to avoid hitting client-side curl max-time
 TOTAL_TIMEOUT_S = float(os.getenv("TOTAL_TIMEOUT_S", "70"))
 
+# In-process cache of parsed Phi routes (exact prompt reuse skips the routing round trip)
+ROUTE_CACHE_SIZE = int(os.getenv("PHI_ROUTE_CACHE_SIZE", "512"))
+ROUTE_CACHE_TTL_S = float(os.getenv("PHI_ROUTE_CACHE_TTL_S", "300"))
+ROUTE_CACHE_MAX_CHARS = int(os.getenv("PHI_ROUTE_CACHE_MAX_CHARS", "500"))
+
 # Output limits (Ollama num_predict)
 logger = logging.getLogger(__name__)
 
 
-def _extract_first_json_obj(text: str) -> str:
-    if not text:
-        return text
-    s = text.find("{")
-    e = text.rfind("}")
-    if s == -1 or e == -1 or e <= s:
-        return text.strip()
-    return text[s : e + 1].strip()
+_ZH_RE = re.compile(r"[\u4e00-\u9fff]")
+_TOKEN_RE = re.compile(r"[\u4e00-\u9fff]{1,6}|[a-z0-9]{2,}")
+
+# Priority order: when several topics appear, the earlier tag wins.
+_TOPICS = (
+    (r"\b(sleep|slept|insomnia|nap)\b|睡|失眠", "sleep"),
+    (r"\b(work|job|shift|meeting|deadline)\b|工作|上班|班", "work"),
+    (r"\b(gym|workout|run|running|exercise|training)\b|运动|健身|跑", "exercise"),
+    (r"\b(friend|friends|social|party|date)\b|朋友|社交|聚会|约会", "social"),
+    (r"\b(stress|anxious|anxiety|panic)\b|压力|焦虑", "stress"),
+)
+# One alternation with a named group per tag: a single scan of the text instead of one per topic.
+_TOPIC_RE = re.compile("|".join(f"(?P<{tag}>{pat})" for pat, tag in _TOPICS))
+_TOPIC_RANK = {tag: i for i, (_pat, tag) in enumerate(_TOPICS)}
+
+
+_STOPWORDS = frozenset(
+    {
+        "the", "a", "an", "to", "of", "and", "or", "is", "are", "was", "were", "in", "on", "for", "with",
+        "我", "你", "他", "她", "它", "我们", "你们", "他们", "什么", "怎么", "为什么", "是否", "今天", "昨天", "明天",
+    }
+)
+_FAST_TAGS = frozenset(tag for _pat, tag in _TOPICS)
+
+
+def _match_topic(t: str) -> str:
+    best = ""
+    best_rank = len(_TOPICS)
+    for m in _TOPIC_RE.finditer(t):
+        rank = _TOPIC_RANK[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m.lastgroup, rank
+            if rank == 0:
+                break
+    return best
+
+
+_PERSONAL_QUERY_PATTERNS = tuple(
+    re.compile(pat)
+    for pat in (
+        r"你觉得我.*(什么样|怎样).*(人|状态|类型)",
+        r"你有我哪些信息",
+        r"你知道我(什么|哪些)",
+        r"根据(我的)?日记",
+        r"我(是|像)什么样的人",
+        r"我.*(性格|特点|习惯|模式|变化|状态)",
+        r"我最近.*(怎么样|怎样|状态|变化)",
+        r"我是不是",
+        r"我.*(总是|经常).*(吗|么|呢|？|\?)",
+    )
+)
+_HINT_INFO_RE = re.compile(r"哪些信息|知道我(什么|哪些)")
+_HINT_TRAITS_RE = re.compile(r"什么样的人|性格|特点")
+_HINT_HABIT_RE = re.compile(r"我是不是|总是|经常")
 
 
 def _detect_lang(text: str) -> str:
-    return "zh" if re.search(r"[\u4e00-\u9fff]", text or "") else "en"
+    return "zh" if _ZH_RE.search(text or "") else "en"
 
 
 def _clamp_int(v: Any, lo: int, hi: int, default: int) -> int:
@@ -63,53 +121,14 @@ def _fallback_query(user_text: str) -> str:
     if not t:
         return ""
 
-    topic_map = [
-        (r"\b(sleep|slept|insomnia|nap)\b|睡|失眠", "sleep"),
-        (r"\b(work|job|shift|meeting|deadline)\b|工作|上班|班", "work"),
-        (r"\b(gym|workout|run|running|exercise|training)\b|运动|健身|跑", "exercise"),
-        (r"\b(friend|friends|social|party|date)\b|朋友|社交|聚会|约会", "social"),
-        (r"\b(stress|anxious|anxiety|panic)\b|压力|焦虑", "stress"),
-    ]
-    for pat, tag in topic_map:
-        if re.search(pat, t):
-            return tag
-
-    tokens = re.findall(r"[\u4e00-\u9fff]{1,6}|[a-z0-9]{2,}", t)
-    stop = {
-        "the",
-        "a",
-        "an",
-        "to",
-        "of",
-        "and",
-        "or",
-        "is",
-        "are",
-        "was",
-        "were",
-        "in",
-        "on",
-        "for",
-        "with",
-        "我",
-        "你",
-        "他",
-        "她",
-        "它",
-        "我们",
-        "你们",
-        "他们",
-        "什么",
-        "怎么",
-        "为什么",
-        "是否",
-        "今天",
-        "昨天",
-        "明天",
-    }
+    tag = _match_topic(t)
+    if tag:
+        return tag
+
+    tokens = _TOKEN_RE.findall(t)
     out: List[str] = []
     for tok in tokens:
-        if tok in stop:
+        if tok in _STOPWORDS:
             continue
         if tok not in out:
             out.append(tok)
@@ -119,93 +138,136 @@ def _fallback_query(user_text: str) -> str:
 
 
 def _is_fast_tag_query(q: str) -> bool:
-    return (q or "") in {"sleep", "work", "exercise", "social", "stress"}
+    return (q or "") in _FAST_TAGS
 
 
 def _looks_like_personal_diary_query(user_text: str) -> bool:
     t = (user_text or "").strip().lower()
     if not t:
         return False
-    patterns = [
-        r"你觉得我.*(什么样|怎样).*(人|状态|类型)",
-        r"你有我哪些信息",
-        r"你知道我(什么|哪些)",
-        r"根据(我的)?日记",
-        r"我(是|像)什么样的人",
-        r"我.*(性格|特点|习惯|模式|变化|状态)".replace(" ", ""),
-        r"我最近.*(怎么样|怎样|状态|变化)",
-        r"我是不是",
-        r"我.*(总是|经常).*(吗|么|呢|？|\?)",
-    ]
-    return any(re.search(pat, t) for pat in patterns)
+    return any(pat.search(t) for pat in _PERSONAL_QUERY_PATTERNS)
 
 
 def _personal_diary_query_hint(user_text: str) -> str:
     t = (user_text or "").strip().lower()
-    if re.search(r"哪些信息|知道我(什么|哪些)", t):
+    if _HINT_INFO_RE.search(t):
         return "个人信息 习惯 主题"
-    if re.search(r"什么样的人|性格|特点", t):
+    if _HINT_TRAITS_RE.search(t):
         return "性格 特点 习惯"
-    if re.search(r"我是不是|总是|经常", t):
+    if _HINT_HABIT_RE.search(t):
         return _fallback_query(user_text) or "近期 变化 模式"
     return _fallback_query(user_text) or "近期 记录 习惯"
 
 
-def _build_route_messages(user_text: str) -> List[Dict[str, str]]:
-    schema = {
-        "intent": "diary_qa|self_profile|general",
-        "query": "",
-        "top_k": 5,
-        "recent_n": 8,
-        "char_budget": 3000,
-        "lang": "zh",
-    }
+# Prompt layout: static text first, per-request text last. Ollama reuses the KV cache for an identical
+# token prefix, so system prompts are module constants and dynamic fields only ever trail them.
+_ROUTE_SCHEMA = {
+    "intent": "diary_qa|self_profile|general",
+    "query": "",
+    "top_k": 5,
+    "recent_n": 8,
+    "char_budget": 3000,
+    "lang": "zh",
+}
+_ROUTE_SYSTEM = (
+    "You are a routing engine for a diary assistant.\n"
+    "Return ONE valid JSON object ONLY. No markdown. No extra text.\n"
+    "Keys MUST match schema exactly.\n"
+    "intent: 'diary_qa' for diary/history facts; 'self_profile' for summarizing the user from diary patterns; 'general' for general knowledge.\n"
+    "query: short retrieval query (<= 6 words). Empty for general.\n"
+    "top_k: 0-8, recent_n: 0-12, char_budget: 1200-6000\n"
+    "lang: 'zh' if user message mainly Chinese else 'en'\n"
+    f"prompt_version={ROUTE_PROMPT_VERSION}"
+)
+# `{"schema":{...},"user_text":` — same bytes as dumping the whole payload, so the prompt prefix stays stable.
+_ROUTE_USER_PREFIX = dumps_json({"schema": _ROUTE_SCHEMA})[:-1] + ',"user_text":'
 
-    system = (
-        "You are a routing engine for a diary assistant.\n"
-        "Return ONE valid JSON object ONLY. No markdown. No extra text.\n"
-        "Keys MUST match schema exactly.\n"
-        "intent: 'diary_qa' for diary/history facts; 'self_profile' for summarizing the user from diary patterns; 'general' for general knowledge.\n"
-        "query: short retrieval query (<= 6 words). Empty for general.\n"
-        "top_k: 0-8, recent_n: 0-12, char_budget: 1200-6000\n"
-        "lang: 'zh' if user message mainly Chinese else 'en'\n"
-        f"prompt_version={ROUTE_PROMPT_VERSION}"
-    )
-    user = json.dumps({"schema": schema, "user_text": user_text}, ensure_ascii=False)
-    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+def _build_route_messages(user_text: str) -> List[Dict[str, str]]:
+    user = _ROUTE_USER_PREFIX + dumps_json(user_text) + "}"
+    return [{"role": "system", "content": _ROUTE_SYSTEM}, {"role": "user", "content": user}]
+
+
+_RouteKey = Tuple[str, Union[int, bytes]]
+
+# (model, messages digest) -> (stored_at, parsed route obj). get/put never await, so the event loop serialises access.
+_ROUTE_CACHE: "OrderedDict[_RouteKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _route_cache_key(model: str, msgs: List[Dict[str, str]]) -> _RouteKey:
+    raw = dumps_json(msgs).encode("utf-8")
+    if xxhash is not None:
+        return model, xxhash.xxh3_64_intdigest(raw)
+    return model, hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _route_cache_get(key: _RouteKey) -> Optional[Dict[str, Any]]:
+    hit = _ROUTE_CACHE.get(key)
+    if hit is None:
+        return None
+    stored_at, obj = hit
+    if time.monotonic() - stored_at > ROUTE_CACHE_TTL_S:
+        _ROUTE_CACHE.pop(key, None)
+        return None
+    _ROUTE_CACHE.move_to_end(key)
+    return obj
+
+
+def _route_cache_put(key: _RouteKey, obj: Dict[str, Any]) -> None:
+    if ROUTE_CACHE_SIZE <= 0:
+        return
+    _ROUTE_CACHE[key] = (time.monotonic(), obj)
+    _ROUTE_CACHE.move_to_end(key)
+    while len(_ROUTE_CACHE) > ROUTE_CACHE_SIZE:
+        _ROUTE_CACHE.popitem(last=False)
+
+
+_ANSWER_SYSTEM = {
+    "zh": (
+        "你是一个检索驱动的日记助理。\n"
+        "必须输出一个 JSON 对象，且只能输出 JSON（无多余文本）。\n"
+        "Schema: {answer: string, status: 'ok'|'not_recorded', evidence: {entry_ids: number[], card_ids: string[]}}\n"
+        "硬规则：\n"
+        "1) 若 intent=diary_qa：所有关于用户日记/历史的事实只能来自 CONTEXT_PACK_JSON。\n"
+        "2) 若 intent=self_profile：只能参考 recent_summaries / memory_cards / recent_chat_messages；只能基于其中重复出现的模式、习惯、主题和摘要，做谨慎概括，不得臆造。\n"
+        "3) 若 CONTEXT_PACK_JSON 中没有足够证据支撑用户问题（diary_qa 或 self_profile），必须输出 status='not_recorded'，并且 answer 必须精确为：未记录。\n"
+        "4) 若 intent=general：可以回答常识，但不得声称来自日记；仍按 schema 输出。\n"
+        f"prompt_version={ANSWER_PROMPT_VERSION}"
+    ),
+    "en": (
+        "You are a retrieval-grounded diary assistant.\n"
+        "You MUST output one JSON object only (no extra text).\n"
+        "Schema: {answer: string, status: 'ok'|'not_recorded', evidence: {entry_ids: number[], card_ids: string[]}}\n"
+        "Hard rules:\n"
+        "1) If intent=diary_qa: any diary/history facts MUST come only from CONTEXT_PACK_JSON.\n"
+        "2) If intent=self_profile: use only recent_summaries / memory_cards / recent_chat_messages as support. Summarize only repeated patterns, habits, themes, emotions, or preferences supported by CONTEXT_PACK_JSON.\n"
+        "3) If CONTEXT_PACK_JSON lacks sufficient evidence for diary_qa or self_profile, output status='not_recorded' and answer MUST be exactly: Not recorded.\n"
+        "4) If intent=general: you may answer normally but never claim it came from the diary.\n"
+        f"prompt_version={ANSWER_PROMPT_VERSION}"
+    ),
+}
+
+
+async def _await_until(aw: Any, deadline: float) -> Any:
+    """Await `aw`, raising asyncio.TimeoutError at `deadline` (event-loop clock).
+
+    asyncio.timeout_at on Python 3.11+; asyncio.wait_for with the remaining budget before that.
+    """
+    if hasattr(asyncio, "timeout_at"):
+        async with asyncio.timeout_at(deadline):
+            return await aw
+    return await asyncio.wait_for(aw, timeout=max(0.0, deadline - asyncio.get_running_loop().time()))
 
 
 def _build_answer_messages(*, user_text: str, context_pack_json: str, lang: str, intent: str) -> List[Dict[str, str]]:
-    if lang == "zh":
-        system = (
-            "你是一个检索驱动的日记助理。\n"
-            "必须输出一个 JSON 对象，且只能输出 JSON（无多余文本）。\n"
-            "Schema: {answer: string, status: 'ok'|'not_recorded', evidence: {entry_ids: number[], card_ids: string[]}}\n"
-            "硬规则：\n"
-            "1) 若 intent=diary_qa：所有关于用户日记/历史的事实只能来自 CONTEXT_PACK_JSON。\n"
-            "2) 若 intent=self_profile：只能参考 recent_summaries / memory_cards / recent_chat_messages；只能基于其中重复出现的模式、习惯、主题和摘要，做谨慎概括，不得臆造。\n"
-            "3) 若 CONTEXT_PACK_JSON 中没有足够证据支撑用户问题（diary_qa 或 self_profile），必须输出 status='not_recorded'，并且 answer 必须精确为：未记录。\n"
-            "4) 若 intent=general：可以回答常识，但不得声称来自日记；仍按 schema 输出。\n"
-            f"prompt_version={ANSWER_PROMPT_VERSION}"
-        )
+    system = _ANSWER_SYSTEM["zh" if lang == "zh" else "en"]
+    question = "QUESTION:\n" + (user_text or "")
+    context = "CONTEXT_PACK_JSON:\n" + (context_pack_json or "{}")
+    if intent == "self_profile":
+        # The self-profile pack does not depend on the question, so it goes first and stays in the cached prefix.
+        user = f"intent={intent}\n" + context + "\n\n" + question
     else:
-        system = (
-            "You are a retrieval-grounded diary assistant.\n"
-            "You MUST output one JSON object only (no extra text).\n"
-            "Schema: {answer: string, status: 'ok'|'not_recorded', evidence: {entry_ids: number[], card_ids: string[]}}\n"
-            "Hard rules:\n"
-            "1) If intent=diary_qa: any diary/history facts MUST come only from CONTEXT_PACK_JSON.\n"
-            "2) If intent=self_profile: use only recent_summaries / memory_cards / recent_chat_messages as support. Summarize only repeated patterns, habits, themes, emotions, or preferences supported by CONTEXT_PACK_JSON.\n"
-            "3) If CONTEXT_PACK_JSON lacks sufficient evidence for diary_qa or self_profile, output status='not_recorded' and answer MUST be exactly: Not recorded.\n"
-            "4) If intent=general: you may answer normally but never claim it came from the diary.\n"
-            f"prompt_version={ANSWER_PROMPT_VERSION}"
-        )
-
-    user = (
-        f"intent={intent}\n"
-        "QUESTION:\n" + (user_text or "") + "\n\n"
-        "CONTEXT_PACK_JSON:\n" + (context_pack_json or "{}")
-    )
+        user = f"intent={intent}\n" + question + "\n\n" + context
     return [{"role": "system", "content": system}, {"role": "user", "content": user}]
 
 
@@ -238,7 +300,9 @@ class CascadeBot:
         **_ignored: Any,
     ) -> Dict[str, Any]:
         lang = _detect_lang(user_text)
-        t0 = time.perf_counter()
+        # One absolute deadline on the loop clock; _await_until() enforces it without re-deriving budgets.
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
         deadline = t0 + TOTAL_TIMEOUT_S
         logger.info(f"cascade_chat:start lang={lang} total_timeout_s={TOTAL_TIMEOUT_S}")
 
@@ -256,23 +320,37 @@ class CascadeBot:
         route_ms = 0
         route_err: Optional[str] = None
 
+        # Speculative retrieval with the fallback query, overlapped with the Phi call;
+        # reused below when the final route resolves to the same arguments.
+        spec_args = (fast_q, self.default_top_k, self.default_recent_n, self.default_char_budget)
+        spec_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
         if use_phi_route:
+            spec_task = asyncio.create_task(
+                asyncio.to_thread(build_context_pack, fast_q, top_k=spec_args[1], recent_n=spec_args[2], char_budget=spec_args[3])
+            )
             try:
-                remain = deadline - time.perf_counter()
+                remain = deadline - loop.time()
                 if remain <= 3:
                     raise asyncio.TimeoutError()
 
                 phi_timeout = min(PHI_TIMEOUT_S, max(1.0, remain - 3.0))
 
                 msgs = _build_route_messages(user_text)
-                coro = self.client.chat_text(
-                    model=self.phi_model,
-                    messages=msgs,
-                    options={"temperature": 0, "top_p": 0.1, "num_predict": PHI_NUM_PREDICT},
-                )
-                text, route_ms = await asyncio.wait_for(coro, timeout=phi_timeout)
+                cache_key = _route_cache_key(self.phi_model, msgs) if len(user_text or "") <= ROUTE_CACHE_MAX_CHARS else None
+                obj = _route_cache_get(cache_key) if cache_key is not None else None
+                if obj is None:
+                    text, route_ms = await _await_until(
+                        self.client.chat_text(
+                            model=self.phi_model,
+                            messages=msgs,
+                            options={"temperature": 0, "top_p": 0.1, "num_predict": PHI_NUM_PREDICT},
+                        ),
+                        loop.time() + phi_timeout,
+                    )
 
-                obj = json.loads(_extract_first_json_obj(text))
+                    obj = loads_first_json_object(text)
+                    if cache_key is not None and isinstance(obj, dict):
+                        _route_cache_put(cache_key, obj)
                 if isinstance(obj, dict):
                     route["intent"] = str(obj.get("intent") or route["intent"]).strip() or route["intent"]
                     route["query"] = str(obj.get("query") or "").strip()
@@ -305,16 +383,32 @@ class CascadeBot:
             route["top_k"] = 0
             route["recent_n"] = 0
 
+        pack_args = (
+            str(route.get("query") or ""),
+            int(route.get("top_k") or 0),
+            int(route.get("recent_n") or 0),
+            int(route.get("char_budget") or self.default_char_budget),
+        )
+        pack: Optional[Dict[str, Any]] = None
+        if spec_task is not None:
+            if intent != "self_profile" and pack_args == spec_args:
+                try:
+                    pack = await spec_task
+                except Exception as e:
+                    logger.warning(f"cascade_chat:speculative_pack_failed {type(e).__name__}: {e}")
+            else:
+                spec_task.cancel()
+
         if intent == "self_profile":
             pack = build_self_profile_pack(
                 char_budget=int(route.get("char_budget") or self.default_char_budget),
             )
-        else:
+        elif pack is None:
             pack = build_context_pack(
-                str(route.get("query") or ""),
-                top_k=int(route.get("top_k") or 0),
-                recent_n=int(route.get("recent_n") or 0),
-                char_budget=int(route.get("char_budget") or self.default_char_budget),
+                pack_args[0],
+                top_k=pack_args[1],
+                recent_n=pack_args[2],
+                char_budget=pack_args[3],
             )
         pack_text = build_context_pack_text(pack)
 
@@ -342,8 +436,7 @@ class CascadeBot:
             )
 
         try:
-            remain2 = deadline - time.perf_counter()
-            if remain2 <= 1:
+            if deadline - loop.time() <= 1:
                 raise asyncio.TimeoutError()
 
             if routed_generate is None:
@@ -369,30 +462,25 @@ class CascadeBot:
                     gen_payload["force_local"] = True
 
                 if inspect.iscoroutinefunction(routed_generate):
-                    res = await asyncio.wait_for(
-                            routed_generate(
-                                task="chat_answer",
-                                payload=gen_payload,
-                                messages=answer_msgs,
-                                temperature=0.0,
-                                max_tokens=ANSWER_NUM_PREDICT,
-                                local_chat=_local_chat,
-                            ),
-                        timeout=max(1.0, remain2),
+                    answer_call = routed_generate(
+                        task="chat_answer",
+                        payload=gen_payload,
+                        messages=answer_msgs,
+                        temperature=0.0,
+                        max_tokens=ANSWER_NUM_PREDICT,
+                        local_chat=_local_chat,
                     )
                 else:
-                    res = await asyncio.wait_for(
-                        asyncio.to_thread(
-                            routed_generate,
-                            task="chat_answer",
-                            payload=gen_payload,
-                            messages=answer_msgs,
-                            temperature=0.0,
-                            max_tokens=ANSWER_NUM_PREDICT,
-                            local_chat=_local_chat,
-                        ),
-                        timeout=max(1.0, remain2),
+                    answer_call = asyncio.to_thread(
+                        routed_generate,
+                        task="chat_answer",
+                        payload=gen_payload,
+                        messages=answer_msgs,
+                        temperature=0.0,
+                        max_tokens=ANSWER_NUM_PREDICT,
+                        local_chat=_local_chat,
                     )
+                res = await _await_until(answer_call, deadline)
                 ans_text, ans_ms = (res.content or ""), int(res.ms or 0)
         except asyncio.TimeoutError:
             answer_err = f"answer_timeout>{TOTAL_TIMEOUT_S}s"
@@ -407,7 +495,7 @@ class CascadeBot:
         answer_obj: Dict[str, Any] = {}
         parse_err: Optional[str] = None
         try:
-            answer_obj = json.loads(_extract_first_json_obj(ans_text))
+            answer_obj = loads_first_json_object(ans_text)
             if not isinstance(answer_obj, dict):
                 answer_obj = {}
         except Exception as e:
@@ -433,9 +521,9 @@ class CascadeBot:
                     "models": {"route_model": self.phi_model, "answer_model": self.answer_model},
                     "answer_ms": int(ans_ms),
                     "answer_err": answer_err,
-                    "elapsed_ms": int((time.perf_counter() - t0) * 1000),
+                    "elapsed_ms": int((loop.time() - t0) * 1000),
                     "total_timeout_s": TOTAL_TIMEOUT_S,
-                    "remaining_s": max(0.0, float(deadline - time.perf_counter())),
+                    "remaining_s": max(0.0, float(deadline - loop.time())),
                 }
             return out
 
@@ -472,9 +560,9 @@ class CascadeBot:
                 "answer_status": status,
                 "answer_parse_err": parse_err,
                 "answer_evidence": evidence,
-                "elapsed_ms": int((time.perf_counter() - t0) * 1000),
+                "elapsed_ms": int((loop.time() - t0) * 1000),
                 "total_timeout_s": TOTAL_TIMEOUT_S,
-                "remaining_s": max(0.0, float(deadline - time.perf_counter())),
+                "remaining_s": max(0.0, float(deadline - loop.time())),
             }
-        logger.info(f"cascade_chat:done status={status} elapsed_ms={int((time.perf_counter() - t0) * 1000)}")
+        logger.info(f"cascade_chat:done status={status} elapsed_ms={int((loop.time() - t0) * 1000)}")
         return out
@@ -1,33 +1,87 @@
+import atexit
+import logging
 import re
+import threading
 import time
 import asyncio
 import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from core.settings import env_bool, env_float, env_int, env_str
-from llm.providers import ProviderError, ProviderResult, get_provider
-from llm.request_store import hash_request, store_meta, store_request, store_response
-from storage.repo_llm_cache import get_cached_response_json, is_cache_enabled, upsert_cached_response_json
-from storage.repo_llm_calls import insert_call, list_calls
+from llm.providers import ProviderError, ProviderResult
+from llm.request_store import hash_request, store_call
 from utils.redact import redact_messages
 
+logger = logging.getLogger(__name__)
+
 
 # Backward compatible intent set (your previous draft)
 CLOUD_INTENTS = {"weekly_review", "persona_summary", "long_write"}
 _PRIVACY_RANK = {"L0": 0, "L1": 1, "L2": 2}
-_PII_PATTERNS = [
+_LOCAL_DEFAULT_TASKS = frozenset({"block_analyze", "mem_update"})
+# Email, URL, phone — applied one after another in this order, so an email is masked whole
+# before the phone pattern can take a number in front of its "@".
+_PII_PATTERNS = (
     re.compile(r"(?i)\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b"),
     re.compile(r"(?i)\bhttps?://[^\s]+"),
-    re.compile(r"(?x)(?<!\w)(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}(?!\w)"),
-]
+    re.compile(r"(?<!\w)(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}(?!\w)"),
+)
+_DIGIT_RUN_RE = re.compile(r"\d{3}")
+# Same, plus the "[" that bracket redaction needs: a message without any is sent as-is.
+_SANITIZE_HINT_RE = re.compile(r"[@\[]|\d{3}|(?i:https?://)")
+
+@dataclass(frozen=True)
+class _RouterEnv:
+    cloud_enabled: bool
+    allow_cloud_inference: bool
+    allow_cloud_training: bool
+    block_raw_text_upload: bool
+    only_when_idle: bool
+    char_threshold: int
+    max_privacy_rank: int
+    default_provider: str
+    deepseek_model: str
+    qwen_cloud_model: str
+    fail_window_s: int
+    fail_threshold: int
+    timeout_connect_s: float
+    timeout_read_s: float
+    retries: int
+    cache_ttl_s: int
+
+
+@lru_cache(maxsize=1)
+def _router_env() -> _RouterEnv:
+    """Routing env, parsed once per process. Call `_router_env.cache_clear()` after changing env (tests)."""
+    return _RouterEnv(
+        cloud_enabled=env_bool("CLOUD_ENABLED", False),
+        allow_cloud_inference=env_bool("ALLOW_CLOUD_INFERENCE", True),
+        allow_cloud_training=env_bool("ALLOW_CLOUD_TRAINING", False),
+        block_raw_text_upload=env_bool("BLOCK_RAW_TEXT_UPLOAD", True),
+        only_when_idle=env_bool("CLOUD_ONLY_WHEN_IDLE", False),
+        char_threshold=env_int("CLOUD_CHAR_THRESHOLD", 6000),
+        max_privacy_rank=_privacy_rank(env_str("CLOUD_MAX_PRIVACY_LEVEL", "L1")),
+        default_provider=env_str("CLOUD_DEFAULT_PROVIDER"),
+        deepseek_model=env_str("DEEPSEEK_MODEL"),
+        qwen_cloud_model=env_str("QWEN_CLOUD_MODEL"),
+        fail_window_s=env_int("CLOUD_FAIL_WINDOW_S", 600),
+        fail_threshold=env_int("CLOUD_FAIL_THRESHOLD", 3),
+        timeout_connect_s=env_float("CLOUD_TIMEOUT_CONNECT_S", 10.0),
+        timeout_read_s=env_float("CLOUD_TIMEOUT_READ_S", 120.0),
+        retries=env_int("CLOUD_RETRIES", 2),
+        cache_ttl_s=env_int("LLM_CACHE_TTL_S", 0),
+    )
 
-def _norm_privacy_level(level: Any) -> str:
-    v = str(level or "").strip().upper()
-    if v in _PRIVACY_RANK:
-        return v
-    return "L1"
+
+def _privacy_rank(level: Any) -> int:
+    """L0/L1/L2 -> 0/1/2; anything else counts as L1."""
+    return _PRIVACY_RANK.get(str(level or "").strip().upper(), 1)
 
 
 def _infer_privacy_level(payload: Dict[str, Any]) -> str:
@@ -37,30 +91,46 @@ def _infer_privacy_level(payload: Dict[str, Any]) -> str:
 
 
 def _privacy_allowed(payload: Dict[str, Any]) -> tuple[bool, str]:
-    max_level = _norm_privacy_level(env_str("CLOUD_MAX_PRIVACY_LEVEL", "L1"))
-    req_level = _norm_privacy_level(payload.get("privacy_level") or _infer_privacy_level(payload))
-    if _PRIVACY_RANK[req_level] > _PRIVACY_RANK[max_level]:
-        return False, f"privacy_blocked req={req_level} max={max_level}"
-    return True, req_level
+    max_rank = _router_env().max_privacy_rank
+    req_rank = _privacy_rank(payload.get("privacy_level") or _infer_privacy_level(payload))
+    if req_rank > max_rank:
+        return False, f"privacy_blocked req=L{req_rank} max=L{max_rank}"
+    return True, f"L{req_rank}"
+
+
+def _mask_pii(text: str) -> str:
+    """Apply the PII patterns in order, skipping any whose literal ("@", "://", 3+ digits) is absent."""
+    email_re, url_re, phone_re = _PII_PATTERNS
+    if "@" in text:
+        text = email_re.sub("__", text)
+    if "://" in text:
+        text = url_re.sub("__", text)
+    if _DIGIT_RUN_RE.search(text) is not None:
+        text = phone_re.sub("__", text)
+    return text
+
+
+def _needs_sanitize(m: Dict[str, Any]) -> bool:
+    for key in ("content", "text"):
+        v = m.get(key)
+        if isinstance(v, str) and _SANITIZE_HINT_RE.search(v):
+            return True
+    return False
 
 
 def _sanitize_cloud_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out = redact_messages(messages)
-    clean: List[Dict[str, Any]] = []
+    if not any(_needs_sanitize(m) for m in messages):
+        return list(messages)  # nothing to redact or mask: skip the per-message copies
+    out = redact_messages(messages)  # fresh dicts: safe to rewrite in place
     for m in out:
-        m2 = dict(m)
-        content = m2.get("content")
+        content = m.get("content")
         if isinstance(content, str):
-            s = content
-            for pat in _PII_PATTERNS:
-                s = pat.sub("__", s)
-            m2["content"] = s
-        clean.append(m2)
-    return clean
+            m["content"] = _mask_pii(content)
+    return out
 
 
-def _filter_cloud_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-    keep = {
+_CLOUD_PAYLOAD_KEEP = frozenset(
+    {
         "intent",
         "prompt_version",
         "is_idle",
@@ -73,7 +143,13 @@ def _filter_cloud_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         "cloud_model",
         "local_model",
     }
-    return {k: payload[k] for k in keep if k in payload}
+)
+
+
+def _filter_cloud_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    if payload.keys() <= _CLOUD_PAYLOAD_KEEP:
+        return payload
+    return {k: payload[k] for k in _CLOUD_PAYLOAD_KEEP & payload.keys()}
 
 
 def should_use_cloud(intent: str, *, force_cloud: bool = False) -> bool:
@@ -93,37 +169,98 @@ class RouteDecision:
     fallback_backend: str = "local"  # "local" | "cloud" | "none"
 
 
-def _estimate_chars_from_messages(messages: List[Dict[str, str]]) -> int:
+def _estimate_chars_from_messages(messages: List[Dict[str, str]], cap: Optional[int] = None) -> int:
+    """Role + content length; with `cap`, stops counting once the total reaches it."""
     n = 0
     for m in messages:
-        n += len((m.get("role") or ""))
-        n += len((m.get("content") or ""))
+        n += len(m.get("role") or "") + len(m.get("content") or "")
+        if cap is not None and n >= cap:
+            break
     return n
 
 
+class _CloudBreaker:
+    """Per-provider sliding window of recent cloud failures, kept in process.
+
+    generate() feeds it directly. While a provider's circuit is closed, the window is
+    re-seeded from the llm_calls audit table at most every RESEED_S seconds, so failures
+    recorded by another process (server vs worker) still open it here, and a restart does
+    not forget an ongoing outage. Audit rows are batched, so another process's failures
+    show up with that delay plus up to RESEED_S.
+    """
+
+    RESEED_S = 30.0
+
+    def __init__(self) -> None:
+        self._fails: Dict[str, Deque[float]] = {}
+        self._seeded_at: Dict[str, float] = {}
+        self._closed_at: Dict[str, float] = {}  # last success; older audit failures are ignored
+        self._lock = threading.Lock()
+
+    def _load(self, provider: str, window_s: int, threshold: int) -> Deque[float]:
+        fails: Deque[float] = deque()
+        try:
+            from storage.repo_llm_calls import list_calls
+
+            now = datetime.now(timezone.utc)
+            tmin = (now - timedelta(seconds=window_s)).isoformat(timespec="seconds")
+            rows = list_calls(provider=provider, status="failed", time_min=tmin, limit=threshold)
+            mono = time.monotonic()
+            closed_at = self._closed_at.get(provider)
+            for row in reversed(rows):  # oldest first
+                age = (now - datetime.fromisoformat(str(row.get("created_at")))).total_seconds()
+                ts = mono - max(0.0, age)
+                if closed_at is None or ts > closed_at:
+                    fails.append(ts)
+        except Exception:
+            # If audit table isn't available for some reason, do not hard-fail routing.
+            pass
+        return fails
+
+    def is_open(self, provider: str, *, window_s: int, threshold: int) -> bool:
+        if threshold <= 0:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            cutoff = now - window_s
+            fails = self._fails.setdefault(provider, deque())
+            while fails and fails[0] < cutoff:
+                fails.popleft()
+            if len(fails) >= threshold:
+                return True
+            seeded_at = self._seeded_at.get(provider)
+            if seeded_at is None or now - seeded_at >= self.RESEED_S:
+                self._seeded_at[provider] = now
+                shared = self._load(provider, window_s, threshold)
+                if len(shared) > len(fails):
+                    fails = self._fails[provider] = shared
+            return len(fails) >= threshold
+
+    def record_failure(self, provider: str) -> None:
+        with self._lock:
+            self._fails.setdefault(provider, deque()).append(time.monotonic())
+
+    def record_success(self, provider: str) -> None:
+        with self._lock:
+            self._fails[provider] = deque()
+            self._closed_at[provider] = time.monotonic()
+
+
+_BREAKER = _CloudBreaker()
+
+
 def _cloud_circuit_open(provider: str) -> bool:
-    """Simple circuit breaker based on recent failed calls (DB audit).
+    """Simple circuit breaker based on recent failed cloud calls.
 
     Env:
       - CLOUD_FAIL_WINDOW_S (default 600)
       - CLOUD_FAIL_THRESHOLD (default 3)
 
     If failures >= threshold within window => circuit open => route to local.
+    A successful call closes the circuit again.
     """
-    window_s = env_int("CLOUD_FAIL_WINDOW_S", 600)
-    threshold = env_int("CLOUD_FAIL_THRESHOLD", 3)
-    if threshold <= 0:
-        return False
-
-    now = datetime.now(timezone.utc)
-    tmin = (now - timedelta(seconds=window_s)).isoformat(timespec="seconds")
-
-    try:
-        rows = list_calls(provider=provider, status="failed", time_min=tmin, limit=threshold)
-        return len(rows) >= threshold
-    except Exception:
-        # If audit table isn't available for some reason, do not hard-fail routing.
-        return False
+    env = _router_env()
+    return _BREAKER.is_open(provider, window_s=env.fail_window_s, threshold=env.fail_threshold)
 
 
 def route(task: str, payload: Dict[str, Any]) -> RouteDecision:
@@ -150,143 +287,77 @@ def route(task: str, payload: Dict[str, Any]) -> RouteDecision:
     task = (task or "").strip().lower()
     intent = (payload.get("intent") or task or "").strip()
     prompt_version = str(payload.get("prompt_version") or "v1")
+    local_model = str(payload.get("local_model") or "")
 
-    # Hard overrides
-    if bool(payload.get("force_local")):
+    def _local(reason: str) -> RouteDecision:
         return RouteDecision(
             backend="local",
             provider=None,
-            model=str(payload.get("local_model") or ""),
+            model=local_model,
             prompt_version=prompt_version,
-            reason="force_local",
+            reason=reason,
             fallback_backend="none",
         )
 
-    cloud_enabled = env_bool("CLOUD_ENABLED", False)
-    allow_cloud_inference = env_bool("ALLOW_CLOUD_INFERENCE", True)
-    allow_cloud_training = env_bool("ALLOW_CLOUD_TRAINING", False)
-    block_raw_text_upload = env_bool("BLOCK_RAW_TEXT_UPLOAD", True)
-    only_when_idle = env_bool("CLOUD_ONLY_WHEN_IDLE", False)
+    # Hard overrides
+    if bool(payload.get("force_local")):
+        return _local("force_local")
+
+    env = _router_env()
+    force_cloud = bool(payload.get("force_cloud"))
     is_idle = bool(payload.get("is_idle", True))
     use_for_training = bool(payload.get("use_for_training", False))
 
+    # Ordered policy gates; the first that holds keeps the request local.
     # Default: block_analyze/mem_update stay local (Phi/Qwen local) unless force_cloud.
-    if not bool(payload.get("force_cloud")) and task in {"block_analyze", "mem_update"}:
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason=f"task={task} default_local",
-            fallback_backend="none",
-        )
-
-    if not cloud_enabled and not bool(payload.get("force_cloud")):
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason="cloud_disabled",
-            fallback_backend="none",
-        )
-
-    if use_for_training and not allow_cloud_training:
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason="cloud_training_disabled",
-            fallback_backend="none",
-        )
-
-    if (not use_for_training) and not allow_cloud_inference:
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason="cloud_inference_disabled",
-            fallback_backend="none",
-        )
-
-    if block_raw_text_upload and (payload.get("raw_text") is not None):
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason="raw_text_upload_blocked",
-            fallback_backend="none",
-        )
+    for blocked, reason in (
+        (not force_cloud and task in _LOCAL_DEFAULT_TASKS, f"task={task} default_local"),
+        (not env.cloud_enabled and not force_cloud, "cloud_disabled"),
+        (use_for_training and not env.allow_cloud_training, "cloud_training_disabled"),
+        ((not use_for_training) and not env.allow_cloud_inference, "cloud_inference_disabled"),
+        (env.block_raw_text_upload and (payload.get("raw_text") is not None), "raw_text_upload_blocked"),
+    ):
+        if blocked:
+            return _local(reason)
 
     allowed, privacy_reason = _privacy_allowed(payload)
     if not allowed:
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason=privacy_reason,
-            fallback_backend="none",
-        )
-
-    if only_when_idle and not is_idle and not bool(payload.get("force_cloud")):
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason="cloud_only_when_idle",
-            fallback_backend="none",
-        )
-
-    # Decide by intent + length threshold
-    messages = payload.get("messages")
-    if isinstance(messages, list):
-        char_len = _estimate_chars_from_messages(messages)  # best effort
-    else:
-        text = payload.get("text") or payload.get("raw_text") or payload.get("user_text") or ""
-        char_len = len(str(text))
+        return _local(privacy_reason)
 
-    char_threshold = env_int("CLOUD_CHAR_THRESHOLD", 6000)
+    if env.only_when_idle and not is_idle and not force_cloud:
+        return _local("cloud_only_when_idle")
 
-    want_cloud = bool(payload.get("force_cloud")) or should_use_cloud(intent) or (char_len >= char_threshold)
+    # Decide by intent + length threshold; the length is only measured when the intent doesn't decide.
+    want_cloud = force_cloud or should_use_cloud(intent)
+    char_len = -1  # not measured
+    if not want_cloud:
+        messages = payload.get("messages")
+        if isinstance(messages, list):
+            char_len = _estimate_chars_from_messages(messages, cap=env.char_threshold)  # best effort
+        else:
+            text = payload.get("text") or payload.get("raw_text") or payload.get("user_text") or ""
+            char_len = len(str(text))
+        want_cloud = char_len >= env.char_threshold
 
     if not want_cloud:
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason=f"below_threshold len={char_len}",
-            fallback_backend="none",
-        )
+        return _local(f"below_threshold len={char_len}")
 
-    provider = (payload.get("preferred_provider") or env_str("CLOUD_DEFAULT_PROVIDER") or "deepseek").strip().lower()
+    provider = (payload.get("preferred_provider") or env.default_provider or "deepseek").strip().lower()
     if provider not in {"deepseek", "qwen"}:
         provider = "deepseek"
 
-    if _cloud_circuit_open(provider) and not bool(payload.get("force_cloud")):
-        return RouteDecision(
-            backend="local",
-            provider=None,
-            model=str(payload.get("local_model") or ""),
-            prompt_version=prompt_version,
-            reason=f"circuit_open provider={provider}",
-            fallback_backend="none",
-        )
+    if _cloud_circuit_open(provider) and not force_cloud:
+        return _local(f"circuit_open provider={provider}")
 
     # Select cloud model
     if provider == "qwen":
         model = str(
             payload.get("cloud_model")
-            or env_str("QWEN_CLOUD_MODEL")
+            or env.qwen_cloud_model
             or "qwen-plus"
         )
     else:
-        model = str(payload.get("cloud_model") or env_str("DEEPSEEK_MODEL") or "deepseek-chat")
+        model = str(payload.get("cloud_model") or env.deepseek_model or "deepseek-chat")
 
     return RouteDecision(
         backend="cloud",
@@ -298,13 +369,17 @@ def route(task: str, payload: Dict[str, Any]) -> RouteDecision:
     )
 
 
+_NO_USAGE: Dict[str, Any] = {}
+
+
 def _provider_result_from_cached_raw(*, provider: str, model: str, raw: Dict[str, Any]) -> ProviderResult:
-    content = (
-        raw.get("choices", [{}])[0]
-        .get("message", {})
-        .get("content", "")
-    )
-    usage = raw.get("usage") or {}
+    try:
+        content = raw["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        content = ""
+    usage = raw.get("usage")
+    if not isinstance(usage, dict):
+        usage = _NO_USAGE
     return ProviderResult(
         content=content,
         raw=raw,
@@ -319,16 +394,77 @@ def _provider_result_from_cached_raw(*, provider: str, model: str, raw: Dict[str
 
 LocalChatFn = Callable[..., ProviderResult]
 
+# The response file and the llm_cache upsert after a cloud success run here, in order;
+# executor threads are joined at interpreter exit, so queued writes are not lost.
+# The request file is written synchronously before the provider call.
+_PERSIST_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-persist")
+
+
+def _persist_cloud_success(
+    req_hash: str,
+    raw: Dict[str, Any],
+    provider: str,
+    model: str,
+    cache_enabled: bool,
+    db_path: Path,
+) -> None:
+    from storage.repo_llm_cache import upsert_cached_response_json
+
+    try:
+        store_call(req_hash, response=raw)
+        upsert_cached_response_json(provider, model, req_hash, raw, enabled=cache_enabled, db_path=db_path)
+    except Exception as e:
+        logger.warning("cloud success persistence failed hash=%s: %s: %s", req_hash, type(e).__name__, e)
+
+
+def flush_persist_writes() -> None:
+    """Block until every queued cloud persistence write has run (tests, shutdown hooks)."""
+    _PERSIST_POOL.submit(lambda: None).result()
+
+
+# One event loop per calling thread, reused across generate() calls instead of asyncio.run's
+# per-call loop setup/teardown. Closed at interpreter exit.
+_LOOP_TLS = threading.local()
+_LOCAL_LOOPS: List[asyncio.AbstractEventLoop] = []
+_LOCAL_LOOPS_LOCK = threading.Lock()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_LOOP_TLS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _LOOP_TLS.loop = loop
+        with _LOCAL_LOOPS_LOCK:
+            _LOCAL_LOOPS[:] = [lp for lp in _LOCAL_LOOPS if not lp.is_closed()]
+            _LOCAL_LOOPS.append(loop)
+    return loop
+
+
+def _close_local_loops() -> None:
+    with _LOCAL_LOOPS_LOCK:
+        loops, _LOCAL_LOOPS[:] = list(_LOCAL_LOOPS), []
+    for loop in loops:
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        except Exception:
+            pass
+        loop.close()
+
+
+atexit.register(_close_local_loops)
+
 
 def _run_local_chat(local_chat: LocalChatFn, **kwargs: Any) -> ProviderResult:
     """Run local_chat that may be sync or async.
 
     generation_router.generate() is synchronous. When local_chat is async, execute it
-    in this context via asyncio.run (safe when called from worker/thread paths).
+    on this thread's persistent loop (safe when called from worker/thread paths).
     """
     res = local_chat(**kwargs)
     if inspect.isawaitable(res):
-        return asyncio.run(res)
+        return _thread_loop().run_until_complete(res)
     return res
 
 
@@ -347,12 +483,14 @@ def generate(
     This is the single entry you should call from cascade_bot / jobs:
       - route(...) => decision
       - if cloud: cache -> provider.chat -> cache write
-      - always: insert_call(...) audit row
+      - always: enqueue_call(...) audit row (batched by a background writer)
       - failure: record failed audit row; optional fallback to local
 
     `local_chat` should accept (messages=..., model=..., temperature=..., max_tokens=..., **kwargs)
     and return ProviderResult.
     """
+    # Deferred so route()/should_use_cloud() users never load the provider HTTP stack or DB layer.
+    from storage.repo_llm_calls import enqueue_call
 
     decision = route(task, {**payload, "messages": messages})
 
@@ -388,9 +526,12 @@ def generate(
                 params={"temperature": temperature, "max_tokens": max_tokens, "task": task},
                 prompt_version=decision.prompt_version,
             )
-            store_request(req_hash, {"provider": "ollama", "model": decision.model, "messages": messages})
-            store_response(req_hash, res.raw if isinstance(res.raw, dict) else {"content": res.content})
-            insert_call(
+            store_call(
+                req_hash,
+                request={"provider": "ollama", "model": decision.model, "messages": messages},
+                response=res.raw if isinstance(res.raw, dict) else {"content": res.content},
+            )
+            enqueue_call(
                 provider="ollama",
                 model=decision.model or "local",
                 prompt_version=decision.prompt_version,
@@ -423,13 +564,18 @@ def generate(
 
     # -------- Cloud path --------
     assert decision.provider is not None
+    from llm.providers import get_provider
+    from storage.db_core import get_db_path
+    from storage.repo_llm_cache import get_cached_response_json, is_cache_enabled
+
     provider_name = decision.provider
     provider = get_provider(provider_name)
 
-    timeout_connect_s = env_float("CLOUD_TIMEOUT_CONNECT_S", 10.0)
-    timeout_read_s = env_float("CLOUD_TIMEOUT_READ_S", 120.0)
-    retries = env_int("CLOUD_RETRIES", 2)
-    ttl_s = env_int("LLM_CACHE_TTL_S", 0)
+    env = _router_env()
+    timeout_connect_s = env.timeout_connect_s
+    timeout_read_s = env.timeout_read_s
+    retries = env.retries
+    ttl_s = env.cache_ttl_s
     ttl_arg = ttl_s if ttl_s > 0 else None
 
     req_params = {
@@ -447,10 +593,10 @@ def generate(
         prompt_version=decision.prompt_version,
     )
 
-    # Persist request payload (redacted by request_store)
-    store_request(
+    # Persist request payload (redacted by request_store) before the call, so it survives a crash.
+    store_call(
         req_hash,
-        {
+        request={
             "provider": provider_name,
             "model": decision.model,
             "prompt_version": decision.prompt_version,
@@ -466,7 +612,7 @@ def generate(
             cache_hit = True
             res = _provider_result_from_cached_raw(provider=provider_name, model=decision.model, raw=cached)
             try:
-                insert_call(
+                enqueue_call(
                     provider=provider_name,
                     model=decision.model,
                     prompt_version=decision.prompt_version,
@@ -498,16 +644,21 @@ def generate(
             meta={"task": task, "prompt_version": decision.prompt_version},
         )
         ms = int((time.perf_counter() - t0) * 1000)
-
-        # Persist response + cache
-        try:
-            store_response(req_hash, res.raw)
-            upsert_cached_response_json(provider_name, decision.model, req_hash, res.raw)
-        except Exception:
-            pass
+        _BREAKER.record_success(provider_name)
+
+        # Persist response + cache off the caller's critical path (single FIFO writer).
+        _PERSIST_POOL.submit(
+            _persist_cloud_success,
+            req_hash,
+            res.raw,
+            provider_name,
+            decision.model,
+            is_cache_enabled(),
+            get_db_path(),
+        )
 
         try:
-            insert_call(
+            enqueue_call(
                 provider=provider_name,
                 model=decision.model,
                 prompt_version=decision.prompt_version,
@@ -539,10 +690,11 @@ def generate(
 
     except ProviderError as e:
         ms = int((time.perf_counter() - t0) * 1000)
+        _BREAKER.record_failure(provider_name)
         try:
-            store_meta(
+            store_call(
                 req_hash,
-                {
+                meta={
                     "ok": False,
                     "error": str(e),
                     "provider": provider_name,
@@ -557,7 +709,7 @@ def generate(
             pass
 
         try:
-            insert_call(
+            enqueue_call(
                 provider=provider_name,
                 model=decision.model,
                 prompt_version=decision.prompt_version,
@@ -583,7 +735,7 @@ def generate(
             )
             ms_local = int((time.perf_counter() - t1) * 1000)
             try:
-                insert_call(
+                enqueue_call(
                     provider="ollama",
                     model=payload.get("local_model") or "local",
                     prompt_version=decision.prompt_version,
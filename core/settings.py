@@ -6,6 +6,10 @@ import os
 from pathlib import Path
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
+
+
 def env_str(name: str, default: str = "") -> str:
     return (os.getenv(name) or default).strip()
 
@@ -14,9 +18,9 @@ def env_bool(name: str, default: bool) -> bool:
     v = (os.getenv(name) or "").strip().lower()
     if not v:
         return default
-    if v in {"1", "true", "yes", "y", "on"}:
+    if v in _TRUE_VALUES:
         return True
-    if v in {"0", "false", "no", "n", "off"}:
+    if v in _FALSE_VALUES:
         return False
     return default
 
@@ -1,17 +1,36 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import http.client
+import io
+import os
 import shutil
 import subprocess
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from core.settings import env_bool, env_float, env_int, env_str
+from utils.json_extract import dumps_json_bytes, loads_json
 
 _RETRY_HTTP_STATUS = {408, 425, 429, 500, 502, 503, 504}
+# A reused keep-alive socket the server already closed fails with one of these; resend once.
+_STALE_CONN_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+# Blocking HTTP calls run on a dedicated pool rather than the default executor: its long-lived
+# threads keep their keep-alive connections warm, and slow generations cannot starve other
+# asyncio.to_thread work. A caller-side asyncio timeout does not free a worker; a hung request
+# holds one until the socket timeout (_http_timeout, up to 300s). So the pool caps concurrent
+# Ollama calls and is sized like the default executor, min(32, cpu + 4), well above a local
+# server's parallelism (OLLAMA_NUM_PARALLEL); OLLAMA_HTTP_WORKERS overrides it.
+_HTTP_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(1, env_int("OLLAMA_HTTP_WORKERS", min(32, (os.cpu_count() or 1) + 4))),
+    thread_name_prefix="ollama-http",
+)
 
 
 class OllamaError(RuntimeError):
@@ -27,6 +46,19 @@ def _snip(text: str | None, n: int = 800) -> str:
         return s
     return s[:n] + "…"
 
+@lru_cache(maxsize=1)
+def _ollama_env() -> Tuple[str, float, int, float, str, bool]:
+    """Client defaults, parsed once per process. Call `_ollama_env.cache_clear()` to reload."""
+    return (
+        env_str("OLLAMA_BASE_URL", "http://127.0.0.1:11434"),
+        env_float("OLLAMA_CONNECT_TIMEOUT_S", 10.0),
+        env_int("OLLAMA_MAX_RETRIES", 2),
+        env_float("OLLAMA_RETRY_BACKOFF_S", 0.6),
+        env_str("OLLAMA_KEEP_ALIVE", "30m"),
+        env_bool("OLLAMA_THINK", False),
+    )
+
+
 class OllamaClient:
     """Minimal Ollama HTTP client without third-party runtime dependency."""
 
@@ -38,23 +70,35 @@ class OllamaClient:
         max_retries: int | None = None,
         keep_alive: str | None = None,
     ) -> None:
-        self.base_url = (base_url or env_str("OLLAMA_BASE_URL", "http://127.0.0.1:11434")).rstrip("/")
+        env_base_url, connect_timeout_s, env_max_retries, retry_backoff_s, env_keep_alive, think = _ollama_env()
+        self.base_url = (base_url or env_base_url).rstrip("/")
         self.timeout_s = float(timeout_s)
-        self.connect_timeout_s = env_float("OLLAMA_CONNECT_TIMEOUT_S", 10.0)
+        self.connect_timeout_s = connect_timeout_s
         self.read_timeout_s = None if self.timeout_s <= 0 else self.timeout_s
-        self.max_retries = env_int("OLLAMA_MAX_RETRIES", 2) if max_retries is None else int(max_retries)
-        self.retry_backoff_s = env_float("OLLAMA_RETRY_BACKOFF_S", 0.6)
-        self.default_keep_alive = keep_alive or env_str("OLLAMA_KEEP_ALIVE", "30m")
-        self.default_think = env_bool("OLLAMA_THINK", False)
+        self.max_retries = env_max_retries if max_retries is None else int(max_retries)
+        self.retry_backoff_s = retry_backoff_s
+        self.default_keep_alive = keep_alive or env_keep_alive
+        self.default_think = think
+        self._conns = threading.local()
+        self._conns_lock = threading.Lock()
+        self._open_conns: Set[http.client.HTTPConnection] = set()
 
     async def __aenter__(self) -> "OllamaClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        return None
+        self.close()
 
     async def aclose(self) -> None:
-        return None
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled keep-alive connections (they reopen on the next call)."""
+        with self._conns_lock:
+            conns, self._open_conns = self._open_conns, set()
+        self._conns = threading.local()
+        for conn in conns:
+            conn.close()
 
     def _messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         parts: List[str] = []
@@ -84,19 +128,66 @@ class OllamaClient:
             return max(self.connect_timeout_s, 300.0)
         return max(self.connect_timeout_s, float(self.read_timeout_s))
 
+    def _keepalive_conn(self, netloc: str) -> http.client.HTTPConnection:
+        # One persistent connection per (client, worker thread, host): http.client connections
+        # are not thread-safe and asyncio.to_thread may run calls on different executor threads.
+        conns = getattr(self._conns, "by_netloc", None)
+        if conns is None:
+            conns = self._conns.by_netloc = {}
+        conn = conns.get(netloc)
+        if conn is None:
+            conn = conns[netloc] = http.client.HTTPConnection(netloc, timeout=self._http_timeout())
+            with self._conns_lock:
+                self._open_conns.add(conn)
+        return conn
+
+    def _drop_conn(self, netloc: str) -> None:
+        conn = getattr(self._conns, "by_netloc", {}).pop(netloc, None)
+        if conn is not None:
+            with self._conns_lock:
+                self._open_conns.discard(conn)
+            conn.close()
+
     def _post_json_sync(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        req = urllib.request.Request(
-            url=url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=self._http_timeout()) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            return json.loads(raw) if raw else {}
+        body = dumps_json_bytes(payload)
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "http":
+            req = urllib.request.Request(url=url, data=body, headers=headers, method="POST")
+            with urllib.request.urlopen(req, timeout=self._http_timeout()) as resp:
+                raw = resp.read()
+                return loads_json(raw) if raw else {}
+
+        # Plain-HTTP (the local Ollama server): keep the TCP connection alive between calls.
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        while True:
+            conn = self._keepalive_conn(parts.netloc)
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except _STALE_CONN_ERRORS:
+                self._drop_conn(parts.netloc)
+                if reused:
+                    continue  # idle socket closed by the server; retry once on a fresh one
+                raise
+            except Exception:
+                self._drop_conn(parts.netloc)
+                raise
+            break
+        if resp.will_close:
+            self._drop_conn(parts.netloc)
+        if resp.status >= 400:
+            # Same exception urlopen raises, so chat()'s status/404 handling is unchanged.
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(raw))
+        return loads_json(raw) if raw else {}
 
     async def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return await asyncio.to_thread(self._post_json_sync, url, payload)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_HTTP_EXECUTOR, self._post_json_sync, url, payload)
 
     def _healthcheck_sync(self) -> bool:
         req = urllib.request.Request(
@@ -4,11 +4,16 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from .base import BaseProvider, ProviderError, ProviderResult
-from .deepseek_api import DeepSeekProvider
-from .qwen_api import QwenProvider
+
+# The concrete providers pull in urllib/ssl/certifi; they are imported on first use
+# (get_provider, PROVIDERS, or attribute access) so `ProviderResult` stays cheap to import.
+_LAZY_PROVIDERS = {
+    "DeepSeekProvider": ".deepseek_api",
+    "QwenProvider": ".qwen_api",
+}
 
 
 def _try_get_settings_attr(key: str) -> Optional[str]:
@@ -49,11 +54,32 @@ def _get_config(key: str, default: Optional[str] = None) -> Optional[str]:
     return default
 
 
-# Optional: registry for inspection / extension
-PROVIDERS = {
-    "deepseek": DeepSeekProvider,
-    "qwen": QwenProvider,
-}
+def _provider_class(name: str) -> type:
+    cls = globals().get(name)
+    if cls is None:
+        from importlib import import_module
+
+        cls = globals()[name] = getattr(import_module(_LAZY_PROVIDERS[name], __name__), name)
+    return cls
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_PROVIDERS:
+        return _provider_class(name)
+    if name == "PROVIDERS":
+        return _providers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _providers() -> Dict[str, type]:
+    # Optional: registry for inspection / extension (built once, then a plain module global)
+    reg = globals().get("PROVIDERS")
+    if reg is None:
+        reg = globals()["PROVIDERS"] = {
+            "deepseek": _provider_class("DeepSeekProvider"),
+            "qwen": _provider_class("QwenProvider"),
+        }
+    return reg
 
 
 def get_provider(name: str) -> BaseProvider:
@@ -68,9 +94,10 @@ def get_provider(name: str) -> BaseProvider:
       - ProviderError: missing API key (fatal)
     """
     n = (name or "").strip().lower()
-    if n not in PROVIDERS:
+    providers = _providers()
+    if n not in providers:
         raise ValueError(
-            f"Unknown provider '{name}'. Supported providers: {', '.join(sorted(PROVIDERS.keys()))}"
+            f"Unknown provider '{name}'. Supported providers: {', '.join(sorted(providers.keys()))}"
         )
 
     if n == "deepseek":
@@ -83,7 +110,7 @@ def get_provider(name: str) -> BaseProvider:
                 retryable=False,
                 detail="DEEPSEEK_API_KEY is not set",
             )
-        return DeepSeekProvider(api_key=api_key, base_url=base_url or "https://api.deepseek.com")
+        return _provider_class("DeepSeekProvider")(api_key=api_key, base_url=base_url or "https://api.deepseek.com")
 
     if n == "qwen":
         api_key = _get_config("DASHSCOPE_API_KEY") or _get_config("QWEN_API_KEY")
@@ -98,7 +125,7 @@ def get_provider(name: str) -> BaseProvider:
                 retryable=False,
                 detail="DASHSCOPE_API_KEY (or QWEN_API_KEY) is not set",
             )
-        return QwenProvider(
+        return _provider_class("QwenProvider")(
             api_key=api_key,
             base_url=base_url or "https://dashscope-intl.aliyuncs.com/compatible-mode/v1",
         )
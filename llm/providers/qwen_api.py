@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
 import ssl
 import time
 import urllib.error
 import urllib.request
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+from utils.json_extract import dumps_json_bytes, loads_json
+
 from .base import BaseProvider, ProviderError, ProviderResult
 
 try:
@@ -19,6 +21,18 @@ def _is_retryable_status(status: int) -> bool:
     return status == 408 or status == 429 or 500 <= status <= 599
 
 
+@lru_cache(maxsize=1)
+def _default_ssl_context() -> ssl.SSLContext:
+    # Loading the CA bundle costs tens of ms; one context serves every request (it is thread-safe).
+    cafile = None
+    if certifi is not None:
+        try:
+            cafile = certifi.where()
+        except Exception:
+            cafile = None
+    return ssl.create_default_context(cafile=cafile)
+
+
 class QwenProvider(BaseProvider):
     """Qwen (DashScope) OpenAI-compatible Chat Completions provider."""
 
@@ -27,26 +41,25 @@ class QwenProvider(BaseProvider):
     def __init__(self, *, api_key: str, base_url: str):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
 
     def _ssl_context(self) -> ssl.SSLContext:
-        cafile = None
-        if certifi is not None:
-            try:
-                cafile = certifi.where()
-            except Exception:
-                cafile = None
-        return ssl.create_default_context(cafile=cafile)
+        return _default_ssl_context()
 
     def _post_json(self, url: str, headers: Dict[str, str], payload: Dict[str, Any], timeout_s: float) -> Dict[str, Any]:
         req = urllib.request.Request(
             url=url,
-            data=json.dumps(payload).encode("utf-8"),
+            data=dumps_json_bytes(payload),
             headers=headers,
             method="POST",
         )
         with urllib.request.urlopen(req, timeout=timeout_s, context=self._ssl_context()) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            return json.loads(raw) if raw else {}
+            raw = resp.read()
+            return loads_json(raw) if raw else {}
 
     def chat(
         self,
@@ -70,11 +83,7 @@ class QwenProvider(BaseProvider):
             )
 
         url = f"{self.base_url}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        headers = self._headers
 
         payload: Dict[str, Any] = {
             "model": model,
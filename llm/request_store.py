@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional
 
+from utils.json_extract import dumps_json
+
 
 _SENSITIVE_KEY_RE = re.compile(
     r"(api[_-]?key|authorization|bearer|token|secret|password|passwd|access[_-]?key)",
@@ -20,8 +22,9 @@ def _utc_ts() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def _atomic_write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _atomic_write_text(path: Path, text: str, *, mkdir: bool = True) -> None:
+    if mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
     tmp.write_text(text, encoding="utf-8")
     tmp.replace(path)
@@ -41,19 +44,28 @@ def _redact_sensitive(obj: Any) -> Any:
 
     This is a defensive guard: we do *not* want any API keys / tokens to be
     written to disk or database.
+
+    Copy-on-write: containers are only copied along the path to a redacted value,
+    so the common no-secret payload (hashed on every generate()) is returned as-is.
     """
     if isinstance(obj, dict):
-        out: Dict[str, Any] = {}
+        out: Optional[Dict[str, Any]] = None
         for k, v in obj.items():
-            if _SENSITIVE_KEY_RE.search(str(k) or ""):
-                out[k] = "***REDACTED***"
-            else:
-                out[k] = _redact_sensitive(v)
-        return out
-    if isinstance(obj, list):
-        return [_redact_sensitive(x) for x in obj]
-    if isinstance(obj, tuple):
-        return [_redact_sensitive(x) for x in obj]
+            nv = "***REDACTED***" if _SENSITIVE_KEY_RE.search(str(k) or "") else _redact_sensitive(v)
+            if nv is not v:
+                if out is None:
+                    out = dict(obj)
+                out[k] = nv
+        return obj if out is None else out
+    if isinstance(obj, (list, tuple)):
+        items: Optional[list] = None
+        for i, x in enumerate(obj):
+            nx = _redact_sensitive(x)
+            if nx is not x:
+                if items is None:
+                    items = list(obj)
+                items[i] = nx
+        return obj if items is None else items
     return obj
 
 
@@ -126,7 +138,7 @@ def store_request(
     """
     p = _call_dir(data_dir, request_hash) / "request.json"
     safe = _redact_sensitive(dict(payload_json))
-    _atomic_write_text(p, json.dumps(safe, ensure_ascii=False, indent=2))
+    _atomic_write_text(p, dumps_json(safe, pretty=True))
     return p
 
 
@@ -139,7 +151,7 @@ def store_response(
     """Persist the response payload as JSON (redacted)."""
     p = _call_dir(data_dir, request_hash) / "response.json"
     safe = _redact_sensitive(dict(payload_json))
-    _atomic_write_text(p, json.dumps(safe, ensure_ascii=False, indent=2))
+    _atomic_write_text(p, dumps_json(safe, pretty=True))
     return p
 
 
@@ -152,10 +164,32 @@ def store_meta(
     """Persist meta/audit info for a call (timestamps, ms, cache_hit, etc.)."""
     p = _call_dir(data_dir, request_hash) / "meta.json"
     safe = _redact_sensitive(dict(meta_json))
-    _atomic_write_text(p, json.dumps(safe, ensure_ascii=False, indent=2))
+    _atomic_write_text(p, dumps_json(safe, pretty=True))
     return p
 
 
+def store_call(
+    request_hash: str,
+    *,
+    request: Optional[Mapping[str, Any]] = None,
+    response: Optional[Mapping[str, Any]] = None,
+    meta: Optional[Mapping[str, Any]] = None,
+    data_dir: Optional[Path] = None,
+) -> Path:
+    """Persist any of request/response/meta for one call in a single pass (redacted).
+
+    Same files as store_request/store_response/store_meta, but the call directory is
+    resolved and created once. Returns the call directory.
+    """
+    d = _call_dir(data_dir, request_hash)
+    d.mkdir(parents=True, exist_ok=True)
+    for name, payload in (("request.json", request), ("response.json", response), ("meta.json", meta)):
+        if payload is not None:
+            safe = _redact_sensitive(dict(payload))
+            _atomic_write_text(d / name, dumps_json(safe, pretty=True), mkdir=False)
+    return d
+
+
 # ---------------------------------------------------------------------------
 # Backward-compatible helper (your earlier quick draft).
 # Keep it so existing call sites don't break.
@@ -171,5 +205,5 @@ def save_request_json(data_dir: Path, *, provider: str, task: str, payload: dict
     ts = _utc_ts()
     path = req_dir / f"{ts}_{provider}_{task}.json"
     safe = _redact_sensitive(payload)
-    _atomic_write_text(path, json.dumps(safe, ensure_ascii=False, indent=2))
+    _atomic_write_text(path, dumps_json(safe, pretty=True))
     return path
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import os
 import re
@@ -12,6 +13,7 @@ from core.settings import MEM_UPDATE_MODEL as DEFAULT_PHI_MODEL, PROMPT_VERSION_
 from storage.db_core import compute_sha256
 from storage.repo_entries import is_memory_update_applied, record_memory_update_applied
 from storage.repo_mem import get_mem_card, insert_mem_card_change, list_mem_cards, upsert_mem_card
+from utils.json_extract import extract_json_span, loads_first_json_object
 
 PROMPT_VERSION = PROMPT_VERSION_MEM_UPDATE
 
@@ -110,10 +112,10 @@ def pick_candidates(analysis_json: Dict[str, Any], *, top_n: int = 5, pool: int
         content = _safe_json_loads(r.get("content_json", "")) or {}
         scored.append((_score_candidate(entry_topics, content), r, content))
 
-    scored.sort(key=lambda x: (x[0], x[1].get("updated_at", "")), reverse=True)
+    top = heapq.nlargest(top_n, scored, key=lambda x: (x[0], x[1].get("updated_at", "")))
 
     out: List[Dict[str, Any]] = []
-    for score, r, content in scored[:top_n]:
+    for score, r, content in top:
         out.append(
             {
                 "card_id": r["card_id"],
@@ -180,18 +182,6 @@ def _build_json_repair_messages(bad_json_text: str) -> List[Dict[str, str]]:
     return [{"role": "system", "content": system}, {"role": "user", "content": user}]
 
 
-
-
-def _extract_first_json_obj(text: str) -> str:
-    if not text:
-        return text
-    s = text.find("{")
-    e = text.rfind("}")
-    if s == -1 or e == -1 or e <= s:
-        return text.strip()
-    return text[s : e + 1].strip()
-
-
 def _fallback_ops(entry_id: int, analysis_json: Dict[str, Any]) -> List[Dict[str, Any]]:
     topics = analysis_json.get("topics") or []
     if isinstance(topics, list) and topics:
@@ -278,8 +268,7 @@ async def update_mem_cards(
                 temperature=0.0,
                 max_tokens=500,
             )
-            raw = _extract_first_json_obj(str(res.content or ""))
-            obj = json.loads(raw)
+            obj = loads_first_json_object(str(res.content or ""))
             cloud_ops = obj.get("ops") if isinstance(obj, dict) else None
             ops = cloud_ops if isinstance(cloud_ops, list) else []
         except Exception as e:
@@ -288,18 +277,20 @@ async def update_mem_cards(
 
     # 2) Optional local LLM path (disabled by default).
     if not ops and _should_use_local_mem_llm():
+        owned_client = None
         try:
             if client is None and OllamaClient is not None:
-                client = OllamaClient()
+                # Created here, so closed here: the pooled keep-alive sockets would otherwise leak.
+                client = owned_client = OllamaClient()
             if client is not None and hasattr(client, "chat_text"):
                 text, _ms = await client.chat_text(
                     model=model,
                     messages=messages,
                     options={"temperature": 0, "top_p": 0.1, "num_predict": 500},
                 )
-                raw = _extract_first_json_obj(text)
+                raw = extract_json_span(text)
                 try:
-                    obj = json.loads(raw)
+                    obj = loads_first_json_object(text)
                 except Exception:
                     # One repair attempt for malformed JSON.
                     repair_messages = _build_json_repair_messages(raw)
@@ -308,7 +299,7 @@ async def update_mem_cards(
                         messages=repair_messages,
                         options={"temperature": 0, "top_p": 0.1, "num_predict": 400},
                     )
-                    obj = json.loads(_extract_first_json_obj(repaired))
+                    obj = loads_first_json_object(repaired)
 
                 local_ops = obj.get("ops") if isinstance(obj, dict) else None
                 ops = local_ops if isinstance(local_ops, list) else []
@@ -317,6 +308,9 @@ async def update_mem_cards(
                 err = f"{err}; local_failed: {e}"
             else:
                 err = f"local_failed: {e}"
+        finally:
+            if owned_client is not None:
+                await owned_client.aclose()
 
     if not ops:
         ops = _fallback_ops(entry_id, analysis_json)
@@ -324,6 +318,7 @@ async def update_mem_cards(
     updated = 0
     changes = 0
     touched: List[str] = []
+    now = _now_iso()  # one timestamp for every card write/change row of this update
 
     for op in ops[:2]:
         op_type = str(op.get("op") or "").strip()
@@ -337,7 +332,7 @@ async def update_mem_cards(
             if not card_id:
                 continue
             after = op.get("content_json") or {}
-            upsert_mem_card(card_id=card_id, type=ctype, content_json=after, updated_at=_now_iso(), confidence=conf)
+            upsert_mem_card(card_id=card_id, type=ctype, content_json=after, updated_at=now, confidence=conf)
             insert_mem_card_change(
                 card_id=card_id,
                 entry_id=entry_id,
@@ -346,7 +341,7 @@ async def update_mem_cards(
                     "after": after,
                     "meta": {"op": "create", "note": op.get("note"), "prompt_version": PROMPT_VERSION},
                 },
-                created_at=_now_iso(),
+                created_at=now,
             )
             updated += 1
             changes += 1
@@ -368,7 +363,7 @@ async def update_mem_cards(
             patch = op.get("merge_patch") or {}
             after = _merge_patch(before or {}, patch)
 
-            upsert_mem_card(card_id=card_id, type=ctype, content_json=after, updated_at=_now_iso(), confidence=conf)
+            upsert_mem_card(card_id=card_id, type=ctype, content_json=after, updated_at=now, confidence=conf)
             insert_mem_card_change(
                 card_id=card_id,
                 entry_id=entry_id,
@@ -378,7 +373,7 @@ async def update_mem_cards(
                     "after": after,
                     "meta": {"op": "update", "note": op.get("note"), "prompt_version": PROMPT_VERSION},
                 },
-                created_at=_now_iso(),
+                created_at=now,
             )
             updated += 1
             changes += 1
@@ -62,21 +62,25 @@ def _dedupe_sentences(text: str, *, max_sentences: int, max_chars: int) -> str:
     return joined
 
 
+_SIGNAL_KEYS = ("mood", "stress", "sleep", "exercise", "social", "work")
+
+
 def _merge_signals(block_objs: List[Dict[str, Any]]) -> Dict[str, Optional[int]]:
     """Latest-non-null wins for each signal key."""
-    keys = ("mood", "stress", "sleep", "exercise", "social", "work")
-    merged: Dict[str, Optional[int]] = {k: None for k in keys}
-    for obj in block_objs:
+    merged: Dict[str, Optional[int]] = dict.fromkeys(_SIGNAL_KEYS)
+    missing = set(_SIGNAL_KEYS)
+    # Walk newest-first and stop once every signal has a value.
+    for obj in reversed(block_objs):
         sig = obj.get("signals")
         if not isinstance(sig, dict):
             continue
-        for k in keys:
+        for k in tuple(missing):
             v = sig.get(k)
             if isinstance(v, int) and 0 <= v <= 10:
                 merged[k] = v
-            elif v is None:
-                # do not overwrite an existing number
-                continue
+                missing.discard(k)
+        if not missing:
+            break
     return merged
 
 
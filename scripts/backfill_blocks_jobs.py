@@ -16,10 +16,20 @@ from storage import db
 
 
 def _load_entries(limit: int) -> List[Dict[str, Any]]:
+    """Load entries together with their existing block count in one query."""
     conn = db.connect()
     try:
         rows = conn.execute(
-            "SELECT id, created_at, raw_text FROM entries ORDER BY id ASC LIMIT ?",
+            """
+            SELECT
+                e.id,
+                e.created_at,
+                e.raw_text,
+                (SELECT COUNT(*) FROM entry_blocks b WHERE b.entry_id = e.id) AS n_blocks
+            FROM entries e
+            ORDER BY e.id ASC
+            LIMIT ?
+            """,
             (int(limit),),
         ).fetchall()
         return [dict(r) for r in rows]
@@ -48,19 +58,51 @@ def _delete_blocks_for_entry(entry_id: int) -> None:
         conn.close()
 
 
-def main(argv: list[str] | None = None) -> int:
-    p = argparse.ArgumentParser(description="Backfill entry_blocks + block_jobs for existing entries")
-    p.add_argument("--limit", type=int, default=100000)
-    p.add_argument("--rebuild", action="store_true", help="delete existing blocks/jobs and rebuild")
-    args = p.parse_args(argv)
+def _enqueue_entry_blocks(*, entry_id: int, text: str, created_at: str, rebuild: bool) -> int:
+    if rebuild:
+        _delete_blocks_for_entry(entry_id)
+
+    blocks = _filter_blocks_for_jobs(split_to_blocks(text))
+    now = created_at or db._utc_now_iso()
+    queued = 0
+    for b in blocks:
+        block_id = db.insert_entry_block(
+            entry_id=entry_id,
+            idx=int(b.get("idx", 0)),
+            title=(b.get("title") or None),
+            raw_text=str(b.get("raw_text") or b.get("text") or ""),
+            created_at=created_at or now,
+        )
+        if block_id:
+            db.insert_block_job(
+                block_id=int(block_id),
+                status="pending",
+                attempts=0,
+                last_error=None,
+                created_at=now,
+                updated_at=now,
+            )
+            queued += 1
+    return queued
 
-    db.init_db()
-    entries = _load_entries(limit=max(1, int(args.limit)))
 
-    scanned = len(entries)
-    queued_entries = 0
-    queued_blocks = 0
-    skipped_existing = 0
+def backfill_entries(*, limit: int, rebuild: bool = False) -> Dict[str, Any]:
+    """Create blocks + pending jobs for the first `limit` entries; returns counters.
+
+    Per-entry failures are collected in `errors` instead of aborting the run.
+    """
+    db.init_db()
+    entries = _load_entries(limit=max(1, int(limit)))
+
+    summary: Dict[str, Any] = {
+        "scanned": len(entries),
+        "queued_entries": 0,
+        "queued_blocks": 0,
+        "skipped_existing": 0,
+        "failed": 0,
+        "rebuild": bool(rebuild),
+        "errors": [],
+    }
 
     for e in entries:
         entry_id = int(e["id"])
@@ -70,45 +112,50 @@ def main(argv: list[str] | None = None) -> int:
         if not text:
             continue
 
-        has_blocks = db.count_entry_blocks(entry_id) > 0
-        if has_blocks and not args.rebuild:
-            skipped_existing += 1
-            continue
-
-        if has_blocks and args.rebuild:
-            _delete_blocks_for_entry(entry_id)
-
-        blocks = _filter_blocks_for_jobs(split_to_blocks(text))
-        if not blocks:
+        has_blocks = int(e.get("n_blocks") or 0) > 0
+        if has_blocks and not rebuild:
+            summary["skipped_existing"] += 1
             continue
 
-        now = created_at or db._utc_now_iso()
-        for b in blocks:
-            block_id = db.insert_entry_block(
+        try:
+            n = _enqueue_entry_blocks(
                 entry_id=entry_id,
-                idx=int(b.get("idx", 0)),
-                title=(b.get("title") or None),
-                raw_text=str(b.get("raw_text") or b.get("text") or ""),
-                created_at=created_at or now,
+                text=text,
+                created_at=created_at,
+                rebuild=has_blocks and rebuild,
             )
-            if block_id:
-                db.insert_block_job(
-                    block_id=int(block_id),
-                    status="pending",
-                    attempts=0,
-                    last_error=None,
-                    created_at=now,
-                    updated_at=now,
-                )
-                queued_blocks += 1
-
-        queued_entries += 1
-
-    print(
-        f"[DONE] scanned={scanned} queued_entries={queued_entries} "
-        f"queued_blocks={queued_blocks} skipped_existing={skipped_existing} rebuild={bool(args.rebuild)}"
+        except Exception as exc:
+            # One bad entry should not abort the whole backfill.
+            summary["failed"] += 1
+            summary["errors"].append(f"entry {entry_id}: {type(exc).__name__}: {exc}")
+            continue
+        if n <= 0:
+            continue
+        summary["queued_blocks"] += n
+        summary["queued_entries"] += 1
+
+    return summary
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    return (
+        f"[DONE] scanned={summary['scanned']} queued_entries={summary['queued_entries']} "
+        f"queued_blocks={summary['queued_blocks']} skipped_existing={summary['skipped_existing']} "
+        f"failed={summary['failed']} rebuild={summary['rebuild']}"
     )
-    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Backfill entry_blocks + block_jobs for existing entries")
+    p.add_argument("--limit", type=int, default=100000)
+    p.add_argument("--rebuild", action="store_true", help="delete existing blocks/jobs and rebuild")
+    args = p.parse_args(argv)
+
+    summary = backfill_entries(limit=int(args.limit), rebuild=bool(args.rebuild))
+    for err in summary["errors"]:
+        print(f"[ERR] {err}", file=sys.stderr)
+    print(format_summary(summary))
+    return 1 if summary["failed"] > 0 else 0
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime, timezone
+import os
 import re
 import sys
 
@@ -17,13 +18,16 @@ except Exception:
     from db import init_db, insert_entry  # type: ignore
 
 
+_NAME_RE = re.compile(r"(\d{4}-\d{2}-\d{2})(?:_(\d{2}-\d{2}-\d{2}))?\.txt$")
+
+
 def parse_date_from_filename(name: str) -> datetime | None:
     """
     支持：
       - 2025-12-20.txt
       - 2025-12-20_10-30-00.txt
     """
-    m = re.match(r"(\d{4}-\d{2}-\d{2})(?:_(\d{2}-\d{2}-\d{2}))?\.txt$", name)
+    m = _NAME_RE.match(name)
     if not m:
         return None
     date_part = m.group(1)
@@ -33,6 +37,14 @@ def parse_date_from_filename(name: str) -> datetime | None:
     return datetime.fromisoformat(f"{date_part}T00:00:00")
 
 
+def scan_txt_files(diaries_dir: Path) -> list[os.DirEntry]:
+    """单次 scandir 遍历 *.txt，按文件名排序（DirEntry 自带 stat 缓存）；跳过隐藏文件（如 macOS 的 ._*.txt）。"""
+    with os.scandir(diaries_dir) as it:
+        files = [e for e in it if e.name.endswith(".txt") and not e.name.startswith(".") and e.is_file()]
+    files.sort(key=lambda e: e.name)
+    return files
+
+
 def main() -> int:
     diaries_dir = BASE_DIR / "diaries"
     if not diaries_dir.exists():
@@ -41,7 +53,7 @@ def main() -> int:
 
     init_db()
 
-    files = sorted(diaries_dir.glob("*.txt"))
+    files = scan_txt_files(diaries_dir)
     if not files:
         print("[OK] no txt files to migrate.")
         return 0
@@ -52,7 +64,7 @@ def main() -> int:
 
     for fp in files:
         try:
-            text = fp.read_text(encoding="utf-8").strip()
+            text = Path(fp.path).read_text(encoding="utf-8").strip()
             if not text:
                 skipped_empty += 1
                 continue
@@ -23,7 +23,7 @@ except Exception as e:
     CascadeBot = None  # type: ignore
     cascade_import_err = f"{type(e).__name__}: {e}"
 
-from storage.db import init_db  # type: ignore
+from storage.db import close_thread_connections, init_db  # type: ignore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -113,7 +113,10 @@ async def _startup_init(_app: FastAPI) -> None:
 @asynccontextmanager
 async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     await _startup_init(_app)
-    yield
+    try:
+        yield
+    finally:
+        close_thread_connections()
 
 
 app = FastAPI(title="Personal Diary AI & English Learning", lifespan=_lifespan)
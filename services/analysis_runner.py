@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-import io
 import logging
-import os
-from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any, Dict
 
@@ -46,35 +43,26 @@ def enqueue_latest_analysis(
     max_attempts: int,
     job_timeout_s: int,
 ) -> Dict[str, Any]:
-    del preferred_provider, max_attempts, job_timeout_s, job_limit
-    old_env = os.environ.get("MIN_BLOCK_CHARS")
-    stdout_buf = io.StringIO()
-    stderr_buf = io.StringIO()
+    # MIN_BLOCK_CHARS is read once at import by the worker (core.settings); block
+    # splitting during backfill does not consult it, so the process env is left alone.
+    del preferred_provider, max_attempts, job_timeout_s, min_block_chars
+    out = ""
+    err = ""
 
     try:
-        os.environ["MIN_BLOCK_CHARS"] = str(max(1, int(min_block_chars)))
-        from scripts.backfill_blocks_jobs import main as backfill_main
+        from scripts.backfill_blocks_jobs import backfill_entries, format_summary
 
-        with redirect_stdout(stdout_buf), redirect_stderr(stderr_buf):
-            rc = int(backfill_main(["--limit", str(max(1, int(entry_limit)))]))
-    except SystemExit as e:
-        rc = int(e.code) if isinstance(e.code, int) else 1
+        summary = backfill_entries(limit=max(1, int(entry_limit)))
+        out = format_summary(summary)
+        # Keep the returned error text bounded even when many entries fail.
+        err = "\n".join(summary["errors"][:20])
+        # Same convention as the script's exit code: any failed entry is a partial failure.
+        rc = 1 if summary["failed"] > 0 else 0
     except Exception as e:
         logger.exception("enqueue_latest failed: %s: %s", type(e).__name__, e)
         rc = 1
-        stderr_text = stderr_buf.getvalue()
-        if stderr_text:
-            stderr_text += "\n"
-        stderr_text += f"{type(e).__name__}: {e}"
-        stderr_buf = io.StringIO(stderr_text)
-    finally:
-        if old_env is None:
-            os.environ.pop("MIN_BLOCK_CHARS", None)
-        else:
-            os.environ["MIN_BLOCK_CHARS"] = old_env
+        err = f"{type(e).__name__}: {e}"
 
-    out = stdout_buf.getvalue().strip()
-    err = stderr_buf.getvalue().strip()
     if out:
         logger.info("enqueue_latest backfill out=%s", out)
     if err:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import shutil
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,6 +29,10 @@ from .entry_ingest_service import replace_entry_content_atomic
 
 logger = logging.getLogger(__name__)
 
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+# 接收与落盘之间最多缓冲几个分块（内存上限约 depth * chunk）。
+_UPLOAD_QUEUE_DEPTH = 4
+
 
 def build_audio_content_text(*, note: str, transcript: str) -> str:
     text_parts: list[str] = []
@@ -39,6 +45,79 @@ def build_audio_content_text(*, note: str, transcript: str) -> str:
     return "\n".join(text_parts).strip()
 
 
+def _copy_spooled_upload(src: Any, target_path: Path, max_bytes: int) -> int:
+    """Copy an already-on-disk upload spool to `target_path` fd-to-fd; -1 if over `max_bytes`."""
+    src.flush()  # buffered tail must reach the fd before fstat/sendfile see it
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
+    if size > max_bytes:
+        return -1
+    with open(target_path, "wb") as dst:
+        sent = 0
+        try:
+            # sendfile(2): the kernel moves the pages, nothing is copied through Python.
+            while sent < size:
+                n = os.sendfile(dst.fileno(), src_fd, sent, size - sent)
+                if n <= 0:
+                    break
+                sent += n
+        except (AttributeError, OSError):
+            pass  # no file-to-file sendfile here (e.g. macOS/Windows); finish with a buffered copy
+        if sent < size:
+            src.seek(sent)
+            dst.seek(sent)
+            shutil.copyfileobj(src, dst, _UPLOAD_CHUNK_BYTES)
+    return size
+
+
+async def _spool_upload_to_file(audio: UploadFile, target_path: Path, *, max_bytes: int) -> int:
+    """Stream an upload to disk; returns bytes received, or -1 once `max_bytes` is exceeded.
+
+    A producer task reads the request body into a bounded queue while this coroutine
+    writes queued chunks in a worker thread, so network receive and disk writes overlap.
+    Bodies Starlette already rolled over to disk are copied with sendfile instead.
+    """
+    spool = getattr(audio, "file", None)
+    if getattr(spool, "_rolled", False):
+        # Starlette has already spooled the body to a temp file: copy it fd-to-fd in a thread
+        # instead of reading it back through Python.
+        return await asyncio.to_thread(_copy_spooled_upload, spool, target_path, max_bytes)
+
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=_UPLOAD_QUEUE_DEPTH)
+
+    async def _produce() -> int:
+        total = 0
+        try:
+            while True:
+                chunk = await audio.read(_UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > max_bytes:
+                    total = -1
+                    break
+                await queue.put(chunk)
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+        return total
+
+    f = await asyncio.to_thread(open, target_path, "wb")
+    try:
+        producer = asyncio.create_task(_produce())
+        try:
+            while (chunk := await queue.get()) is not None:
+                await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+        return await producer
+    finally:
+        await asyncio.to_thread(f.close)
+
+
 async def save_audio_diary_payload(
     *,
     request: Request,
@@ -54,31 +133,24 @@ async def save_audio_diary_payload(
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     target_path = audio_folder / f"{stamp}_{uuid.uuid4().hex[:10]}{ext}"
 
-    total = 0
-    with open(target_path, "wb") as f:
-        while True:
-            chunk = await audio.read(1024 * 1024)
-            if not chunk:
-                break
-            total += len(chunk)
-            if total > max_audio_upload_bytes:
-                f.close()
-                target_path.unlink(missing_ok=True)
-                raise HTTPException(
-                    status_code=413,
-                    detail={
-                        "code": "AUDIO_TOO_LARGE",
-                        "message": f"audio file too large (> {max_audio_upload_bytes // (1024 * 1024)}MB)",
-                    },
-                )
-            f.write(chunk)
+    total = await _spool_upload_to_file(audio, target_path, max_bytes=max_audio_upload_bytes)
+    if total < 0:
+        target_path.unlink(missing_ok=True)
+        raise HTTPException(
+            status_code=413,
+            detail={
+                "code": "AUDIO_TOO_LARGE",
+                "message": f"audio file too large (> {max_audio_upload_bytes // (1024 * 1024)}MB)",
+            },
+        )
     await audio.close()
 
     if total <= 0:
         target_path.unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail={"code": "EMPTY_AUDIO", "message": "empty audio upload"})
 
-    analysis = analyze_audio_file(target_path)
+    # ffmpeg 转码 + numpy 特征提取耗时较长，放到线程里跑，避免卡住其他请求。
+    analysis = await asyncio.to_thread(analyze_audio_file, target_path)
     audio_entry_id = insert_audio_entry(
         diary_date=date_str,
         file_path=str(target_path),
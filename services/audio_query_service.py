@@ -8,7 +8,7 @@ from storage.repo_audio import (
     get_audio_entry,
     list_recent_audio_analyses,
 )
-from storage.db_core import connect
+from storage.db_core import read_snapshot
 from pipeline.audio_features import build_voice_profile
 
 
@@ -24,8 +24,7 @@ def get_audio_detail_payload(audio_id: int) -> Optional[Dict[str, Any]]:
     entry_analysis_obj: Dict[str, Any] = {}
     block_job_stats: Dict[str, int] = {"pending": 0, "running": 0, "done": 0, "failed": 0, "skipped": 0, "total": 0}
     if link and isinstance(link.get("entry_id"), int):
-        conn = connect()
-        try:
+        with read_snapshot() as conn:
             row = conn.execute(
                 """
                 SELECT id, created_at, raw_text
@@ -54,8 +53,6 @@ def get_audio_detail_payload(audio_id: int) -> Optional[Dict[str, Any]]:
                 """,
                 (int(link["entry_id"]),),
             ).fetchall()
-        finally:
-            conn.close()
         if row:
             transcript_entry_id = int(row["id"])
             transcript_created_at = str(row["created_at"] or "")
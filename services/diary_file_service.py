@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime
+import re
+import threading
+from datetime import date
 from pathlib import Path
 from typing import Any, Dict
 
@@ -8,6 +10,33 @@ from fastapi import HTTPException, Request
 
 from storage.repo_entries import list_entries_by_date
 
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)
+_AUDIO_EXTS = frozenset({".webm", ".wav", ".m4a", ".mp3", ".ogg", ".opus", ".aac"})
+# Content-type substring -> extension, checked in priority order.
+_AUDIO_CT_EXTS = (
+    ("webm", ".webm"),
+    ("wav", ".wav"),
+    ("mpeg", ".mp3"),
+    ("mp3", ".mp3"),
+    ("ogg", ".ogg"),
+    ("mp4", ".m4a"),
+    ("m4a", ".m4a"),
+)
+
+# Striped per-file locks so an append and a rewrite of the same day's backup never interleave
+# (both run in worker threads). A fixed set: memory does not grow with the number of days.
+_BACKUP_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+
+def _backup_lock(file_path: Path) -> threading.Lock:
+    return _BACKUP_LOCKS[hash(file_path.resolve()) % len(_BACKUP_LOCKS)]
+
+
+def _ensure_dir(path: Path) -> Path:
+    # 不缓存：目录可能在运行中被清理，mkdir(exist_ok=True) 本身足够便宜。
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 
 def diaries_dir(request: Request) -> Path:
     data_dir = Path(
@@ -17,44 +46,36 @@ def diaries_dir(request: Request) -> Path:
             getattr(request.app.state, "base_dir", Path(__file__).resolve().parent),
         )
     )
-    path = data_dir / "diaries"
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    return _ensure_dir(data_dir / "diaries")
 
 
 def safe_diary_path(diaries_dir_path: Path, date_str: str) -> Path:
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-    except Exception:
-        raise HTTPException(status_code=400, detail={"code": "INVALID_DATE", "message": "date must be YYYY-MM-DD"})
-    return diaries_dir_path / f"{date_str}.txt"
+    m = _DATE_RE.fullmatch(str(date_str or ""))
+    if m is not None:
+        try:
+            # Range check (month length, leap years) without strptime's format parsing.
+            date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            return diaries_dir_path / f"{date_str}.txt"
+        except ValueError:
+            pass
+    raise HTTPException(status_code=400, detail={"code": "INVALID_DATE", "message": "date must be YYYY-MM-DD"})
 
 
 def audio_dir(request: Request, date_str: str) -> Path:
     diaries_path = diaries_dir(request)
     safe_diary_path(diaries_path, date_str)
-    audio_path = diaries_path / "audio" / date_str
-    audio_path.mkdir(parents=True, exist_ok=True)
-    return audio_path
+    return _ensure_dir(diaries_path / "audio" / date_str)
 
 
 def safe_audio_ext(filename: str, content_type: str) -> str:
     suffix = (Path(filename or "").suffix or "").lower()
-    allow = {".webm", ".wav", ".m4a", ".mp3", ".ogg", ".opus", ".aac"}
-    if suffix in allow:
+    if suffix in _AUDIO_EXTS:
         return suffix
 
     ct = (content_type or "").lower()
-    if "webm" in ct:
-        return ".webm"
-    if "wav" in ct:
-        return ".wav"
-    if "mpeg" in ct or "mp3" in ct:
-        return ".mp3"
-    if "ogg" in ct:
-        return ".ogg"
-    if "mp4" in ct or "m4a" in ct:
-        return ".m4a"
+    for token, ext in _AUDIO_CT_EXTS:
+        if token in ct:
+            return ext
     return ".webm"
 
 
@@ -76,18 +97,19 @@ def render_daily_backup_text(rows: list[Dict[str, Any]]) -> str:
 
 def rewrite_daily_backup_from_db(*, request: Request, date_str: str) -> Path:
     file_path = safe_diary_path(diaries_dir(request), date_str)
-    rows = list_entries_by_date(date_str)
-    content = render_daily_backup_text(rows)
-    if content.strip():
-        file_path.write_text(content, encoding="utf-8")
-    else:
-        file_path.unlink(missing_ok=True)
+    with _backup_lock(file_path):
+        rows = list_entries_by_date(date_str)
+        content = render_daily_backup_text(rows)
+        if content.strip():
+            file_path.write_text(content, encoding="utf-8")
+        else:
+            file_path.unlink(missing_ok=True)
     return file_path
 
 
 def append_daily_backup_entry(*, request: Request, date_str: str, created_at: str, text: str) -> Path:
     file_path = safe_diary_path(diaries_dir(request), date_str)
     chunk = f"\n\n--- {created_at} ---\n{str(text or '').strip()}\n"
-    with open(file_path, "a", encoding="utf-8") as f:
+    with _backup_lock(file_path), open(file_path, "a", encoding="utf-8") as f:
         f.write(chunk)
     return file_path
@@ -9,40 +9,37 @@ from storage.repo_jobs import (
     get_entry_job_status_summary,
     list_entry_blocks,
 )
-from storage.db_core import connect
+from storage.db_core import read_connection
 
 
 def entry_failure_reasons(entry_id: int, *, limit: int = 4) -> list[Dict[str, Any]]:
-    conn = connect()
-    try:
-        rows = conn.execute(
-            """
-            SELECT b.idx, j.attempts, j.last_error
-            FROM block_jobs j
-            JOIN entry_blocks b ON b.block_id = j.block_id
-            WHERE b.entry_id=?
-              AND j.status='failed'
-              AND COALESCE(j.last_error, '') <> ''
-            ORDER BY b.idx ASC, j.updated_at DESC
-            LIMIT ?
-            """,
-            (int(entry_id), int(limit)),
-        ).fetchall()
-        out = []
-        for row in rows:
-            msg = str(row["last_error"] or "").strip()
-            if not msg:
-                continue
-            out.append(
-                {
-                    "block_idx": int(row["idx"] or 0),
-                    "attempts": int(row["attempts"] or 0),
-                    "message": msg[:400],
-                }
-            )
-        return out
-    finally:
-        conn.close()
+    conn = read_connection()
+    rows = conn.execute(
+        """
+        SELECT b.idx, j.attempts, j.last_error
+        FROM block_jobs j
+        JOIN entry_blocks b ON b.block_id = j.block_id
+        WHERE b.entry_id=?
+          AND j.status='failed'
+          AND COALESCE(j.last_error, '') <> ''
+        ORDER BY b.idx ASC, j.updated_at DESC
+        LIMIT ?
+        """,
+        (int(entry_id), int(limit)),
+    ).fetchall()
+    out = []
+    for row in rows:
+        msg = str(row["last_error"] or "").strip()
+        if not msg:
+            continue
+        out.append(
+            {
+                "block_idx": int(row["idx"] or 0),
+                "attempts": int(row["attempts"] or 0),
+                "message": msg[:400],
+            }
+        )
+    return out
 
 
 def summarize_entry_analysis_pipeline(entry_id: int) -> Dict[str, Any]:
@@ -135,19 +132,16 @@ def summarize_entry_analysis_pipeline(entry_id: int) -> Dict[str, Any]:
 
 
 def get_entry_detail_payload(entry_id: int) -> Optional[Dict[str, Any]]:
-    conn = connect()
-    try:
-        row = conn.execute(
-            """
-            SELECT id, created_at, source, raw_text
-            FROM entries
-            WHERE id=?
-            LIMIT 1
-            """,
-            (int(entry_id),),
-        ).fetchone()
-    finally:
-        conn.close()
+    conn = read_connection()
+    row = conn.execute(
+        """
+        SELECT id, created_at, source, raw_text
+        FROM entries
+        WHERE id=?
+        LIMIT 1
+        """,
+        (int(entry_id),),
+    ).fetchone()
 
     if not row:
         return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import json
 import time
 from datetime import datetime, timezone
@@ -85,6 +86,8 @@ def _select_mem_cards_by_topics(
         if not isinstance(content, dict):
             content = {}
         score = _score_card(topics, content)
+        if score <= 0:
+            continue
         scored.append(
             (
                 int(score),
@@ -95,14 +98,11 @@ def _select_mem_cards_by_topics(
             )
         )
 
-    scored.sort(key=lambda x: (x[0], x[1], x[2]), reverse=True)
+    # Only the top_m matches are needed; a bounded heap avoids sorting the whole pool.
+    top = heapq.nlargest(max(0, int(top_m)), scored, key=lambda x: (x[0], x[1], x[2]))
 
     out: List[Dict[str, Any]] = []
-    for score, _updated_at, _card_id, r, content in scored:
-        if len(out) >= int(top_m):
-            break
-        if int(score) <= 0:
-            continue
+    for score, _updated_at, _card_id, r, content in top:
         out.append(
             {
                 "card_id": r.get("card_id"),
@@ -170,38 +170,53 @@ def build_context_pack(
     }
 
     steps: List[str] = []
-    pack["meta"]["initial_chars"] = _model_chars(pack)
-
-    def over_budget() -> bool:
-        return _model_chars(pack) > int(char_budget)
+    model_chars = _model_chars(pack)
+    pack["meta"]["initial_chars"] = model_chars
+    budget = int(char_budget)
 
-    if over_budget() and pack.get("topk"):
+    if model_chars > budget and pack.get("topk"):
         _trim_entry_fields(pack["topk"], drop_facts=True, drop_todos=True)
         steps.append("drop_topk_facts_todos")
-
-    while over_budget() and len(pack.get("recent") or []) > 1:
-        pack["recent"] = (pack.get("recent") or [])[:-1]
+        model_chars = _model_chars(pack)
+
+    # Shrinking only removes whole list items, so track the serialized size arithmetically
+    # (json.dumps list: items joined by ", ") instead of re-dumping the pack per step.
+    item_chars = {key: [_pack_chars(x) for x in pack.get(key) or []] for key in ("recent", "topk", "mem_cards")}
+
+    def pop_last(key: str) -> None:
+        nonlocal model_chars
+        sizes = item_chars[key]
+        model_chars -= sizes.pop() + (2 if sizes else 0)
+        pack[key] = (pack.get(key) or [])[:-1]
+
+    def clear(key: str) -> None:
+        nonlocal model_chars
+        sizes = item_chars[key]
+        model_chars -= sum(sizes) + 2 * (len(sizes) - 1)
+        sizes.clear()
+        pack[key] = []
+
+    while model_chars > budget and len(pack.get("recent") or []) > 1:
+        pop_last("recent")
         steps.append("shrink_recent")
 
-    while over_budget() and len(pack.get("topk") or []) > 1:
-        pack["topk"] = (pack.get("topk") or [])[:-1]
+    while model_chars > budget and len(pack.get("topk") or []) > 1:
+        pop_last("topk")
         steps.append("shrink_topk")
 
-    def min_mem_cards() -> int:
-        return 1 if len(mem_cards) > 0 else 0
-
-    while over_budget() and len(pack.get("mem_cards") or []) > min_mem_cards():
-        pack["mem_cards"] = (pack.get("mem_cards") or [])[:-1]
+    min_mem_cards = 1 if len(mem_cards) > 0 else 0
+    while model_chars > budget and len(pack.get("mem_cards") or []) > min_mem_cards:
+        pop_last("mem_cards")
         steps.append("shrink_mem_cards")
 
-    if over_budget() and len(pack.get("mem_cards") or []) > 0:
-        pack["mem_cards"] = []
+    if model_chars > budget and len(pack.get("mem_cards") or []) > 0:
+        clear("mem_cards")
         steps.append("drop_mem_cards")
-    if over_budget() and len(pack.get("topk") or []) > 0:
-        pack["topk"] = []
+    if model_chars > budget and len(pack.get("topk") or []) > 0:
+        clear("topk")
         steps.append("drop_topk")
-    if over_budget() and len(pack.get("recent") or []) > 0:
-        pack["recent"] = []
+    if model_chars > budget and len(pack.get("recent") or []) > 0:
+        clear("recent")
         steps.append("drop_recent")
 
     ms = int((time.perf_counter() - t0) * 1000)
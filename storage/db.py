@@ -33,6 +33,7 @@ from .db_core import (  # noqa: F401
     SQLITE_TIMEOUT_S,
     connect,
     transaction,
+    close_thread_connections,
     get_db_path,
     _connect,
     _safe_json_loads,
@@ -55,6 +56,7 @@ from .repo_entries import (  # noqa: F401
     list_recent_entries,
     list_recent_entries_overview,
     list_recent_entry_summaries,
+    count_recent_analysis_topics,
     get_entry_analysis_brief,
 )
 from .repo_audio import (  # noqa: F401
@@ -105,6 +107,7 @@ from .repo_jobs import (  # noqa: F401
     get_entry_block,
     insert_block_job,
     count_block_jobs_by_status,
+    block_job_status_counts,
     list_pending_block_jobs,
     reset_stale_running_block_jobs,
     claim_next_block_job,
@@ -120,6 +123,8 @@ from .repo_jobs import (  # noqa: F401
 # LLM cloud/cache (audit + response cache)
 from .repo_llm_calls import (  # noqa: F401
     insert_call,
+    enqueue_call,
+    flush_call_audit,
     get_call,
     list_calls,
 )
@@ -139,6 +144,7 @@ __all__ = [
     "SQLITE_TIMEOUT_S",
     "connect",
     "transaction",
+    "close_thread_connections",
     "get_db_path",
     "_connect",
     "_safe_json_loads",
@@ -158,6 +164,7 @@ __all__ = [
     "list_recent_entries",
     "list_recent_entries_overview",
     "list_recent_entry_summaries",
+    "count_recent_analysis_topics",
     "get_entry_analysis_brief",
     # audio
     "insert_audio_entry",
@@ -194,6 +201,7 @@ __all__ = [
     "get_entry_block",
     "insert_block_job",
     "count_block_jobs_by_status",
+    "block_job_status_counts",
     "list_pending_block_jobs",
     "reset_stale_running_block_jobs",
     "claim_next_block_job",
@@ -206,6 +214,8 @@ __all__ = [
     "get_entry_job_status_summary",
     # llm audit/cache
     "insert_call",
+    "enqueue_call",
+    "flush_call_audit",
     "get_call",
     "list_calls",
     "is_cache_enabled",
@@ -5,11 +5,18 @@ import sys
 import sqlite3
 import hashlib
 import json
+import threading
+import weakref
 from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # type: ignore  # optional: faster decoding of stored analysis_json
+except Exception:  # pragma: no cover
+    orjson = None
+
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_DB_PATH = BASE_DIR / "diary.sqlite3"
 
@@ -44,7 +51,7 @@ def get_db_path() -> Path:
 
     return DEFAULT_DB_PATH
 
-def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+def connect(db_path: Optional[Path] = None, *, check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Unified connection factory:
     - PRAGMA foreign_keys=ON
@@ -53,7 +60,7 @@ def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     - PRAGMA busy_timeout
     """
     path = (db_path or get_db_path()).expanduser().resolve()
-    conn = sqlite3.connect(str(path), timeout=SQLITE_TIMEOUT_S)
+    conn = sqlite3.connect(str(path), timeout=SQLITE_TIMEOUT_S, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
 
     # Critical: enforce FK on every connection (SQLite is per-connection)
@@ -79,18 +86,125 @@ def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     return conn
 
 
+_read_local = threading.local()
+_write_local = threading.local()
+
+
+class _ThreadConns(Dict[Path, sqlite3.Connection]):
+    """One thread's {resolved path: connection} cache; identity-hashed so a WeakSet can track it."""
+
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
+# Every live per-thread cache, so close_thread_connections() can reach connections held by
+# other (pool) threads. Weak: a cache goes away with its thread, as before.
+_THREAD_CONNS: "weakref.WeakSet[_ThreadConns]" = weakref.WeakSet()
+_THREAD_CONNS_LOCK = threading.Lock()
+
+
+def _thread_conns(local: threading.local) -> _ThreadConns:
+    conns = getattr(local, "conns", None)
+    if conns is None:
+        conns = local.conns = _ThreadConns()
+        with _THREAD_CONNS_LOCK:
+            _THREAD_CONNS.add(conns)
+    return conns
+
+
+def _pooled_connect(path: Path) -> sqlite3.Connection:
+    # Only the owning thread uses it; check_same_thread=False just lets
+    # close_thread_connections() close it from another thread.
+    return connect(path, check_same_thread=False)
+
+
+def close_thread_connections(db_path: Optional[Path] = None) -> None:
+    """
+    Close the cached per-thread read and write connections of every thread (all DB paths,
+    or only `db_path`). Call at shutdown or when a DB file is discarded; threads that touch
+    the DB again afterwards simply open fresh connections.
+    """
+    path = db_path.expanduser().resolve() if db_path is not None else None
+    with _THREAD_CONNS_LOCK:
+        caches = list(_THREAD_CONNS)
+    for conns in caches:
+        for key in list(conns):
+            if path is not None and key != path:
+                continue
+            conn = conns.pop(key, None)
+            if conn is None:
+                continue
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def read_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    Per-thread cached read-only connection for hot read paths (status polling, dashboards).
+    - Reuses the connection across calls on the same thread (no open/PRAGMA cost per request)
+    - PRAGMA query_only=ON, so it can never write
+    - Keyed by resolved DB path, so switching DIARY_DB_PATH gets a fresh connection
+    Callers must not close it. Reads outside an explicit transaction see the latest commit (WAL).
+    """
+    path = (db_path or get_db_path()).expanduser().resolve()
+    conns = _thread_conns(_read_local)
+    conn = conns.get(path)
+    if conn is None:
+        conn = _pooled_connect(path)
+        conn.execute("PRAGMA query_only=ON;")
+        conns[path] = conn
+    return conn
+
+
+@contextmanager
+def read_snapshot(db_path: Optional[Path] = None):
+    """
+    Run several SELECTs on the pooled read connection inside one BEGIN DEFERRED ... COMMIT.
+    One WAL read snapshot for the whole block (consistent counts, one lock/snapshot setup)
+    instead of an implicit transaction per statement. Do not nest.
+    """
+    conn = read_connection(db_path)
+    conn.execute("BEGIN DEFERRED;")
+    try:
+        yield conn
+    finally:
+        conn.commit()
+
+
 def _connect() -> sqlite3.Connection:
     # Backward-compatible alias
     return connect()
 
 
 def _safe_json_loads(s: str) -> Any:
+    if not s:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except Exception:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib parser accepts
     try:
-        return json.loads(s) if s else None
+        return json.loads(s)
     except Exception:
         return None
 
 
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params: Any = ()) -> List[Dict[str, Any]]:
+    """Run a SELECT and return plain dicts built from raw tuples.
+
+    Skips the per-row sqlite3.Row allocation and key lookups of `[dict(r) for r in rows]`;
+    column names are read once from cursor.description.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    cols = [c[0] for c in cur.description]
+    return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+
 def _utc_now_iso() -> str:
     """Timezone-aware UTC timestamp for storage."""
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -116,30 +230,52 @@ def _parse_iso_utc(ts: str) -> Optional[datetime]:
 
 @contextmanager
 def _conn_ro():
-    """Read-only connection context."""
-    conn = connect()
-    try:
-        yield conn
-    finally:
-        conn.close()
+    """Read-only connection context (pooled per thread via read_connection; not closed on exit)."""
+    yield read_connection()
 
 
 @contextmanager
-def _conn_txn():
-    """Read-write connection context with explicit BEGIN/COMMIT/ROLLBACK."""
-    conn = connect()
+def _pooled_txn(db_path: Optional[Path] = None):
+    """
+    BEGIN ... COMMIT/ROLLBACK on a per-thread cached read-write connection (keyed by resolved
+    DB path), so small writes skip connect()+PRAGMA setup. If that connection is already inside
+    a transaction (a nested call on the same thread), a fresh connection is used and closed, as
+    before. A connection whose transaction failed is dropped rather than reused.
+    """
+    path = (db_path or get_db_path()).expanduser().resolve()
+    conns = _thread_conns(_write_local)
+    conn = conns.get(path)
+    pooled = conn is None or not conn.in_transaction
+    if conn is None:
+        conn = conns[path] = _pooled_connect(path)
+    elif not pooled:
+        conn = connect(path)
     try:
         conn.execute("BEGIN;")  # explicit transaction boundary
         yield conn
         conn.commit()
-    except Exception:
+    except BaseException:
+        # BaseException too (KeyboardInterrupt, CancelledError, GeneratorExit): a pooled
+        # connection left mid-transaction would keep holding the write lock.
         try:
             conn.rollback()
         except Exception:
             pass
+        if pooled:
+            conns.pop(path, None)
+            conn.close()
         raise
     finally:
-        conn.close()
+        if not pooled:
+            conn.close()
+
+
+@contextmanager
+def _conn_txn():
+    """Read-write connection context with explicit BEGIN/COMMIT/ROLLBACK (pooled per thread)."""
+    with _pooled_txn() as conn:
+        yield conn
+
 
 @contextmanager
 def transaction(db_path: Optional[Path] = None):
@@ -147,19 +283,9 @@ def transaction(db_path: Optional[Path] = None):
     Public transaction context manager.
     Guarantees "single contract fallback = single txn write".
     """
-    conn = connect(db_path=db_path)
-    try:
-        conn.execute("BEGIN;")
+    with _pooled_txn(db_path) as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        try:
-            conn.rollback()
-        except Exception:
-            pass
-        raise
-    finally:
-        conn.close()
+
 
 def _fts5_is_available(conn: sqlite3.Connection) -> bool:
     """Best-effort check: return True if FTS5 is usable in this sqlite build."""
@@ -3,11 +3,11 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional
 
-from .db_core import _conn_ro, _conn_txn, _utc_now_iso
+from .db_core import _conn_ro, _conn_txn, _fetch_dicts, _utc_now_iso
 
 
 def _row_dict(row: Any) -> dict:
-    item = dict(row)
+    item = row if isinstance(row, dict) else dict(row)
     raw = item.get("meta_json")
     if isinstance(raw, str) and raw:
         try:
@@ -79,7 +79,8 @@ def get_chat_session(session_id: int) -> Optional[dict]:
 
 def list_chat_sessions(limit: int = 60) -> List[dict]:
     with _conn_ro() as conn:
-        rows = conn.execute(
+        return _fetch_dicts(
+            conn,
             """
             SELECT
                 s.id,
@@ -105,13 +106,13 @@ def list_chat_sessions(limit: int = 60) -> List[dict]:
             LIMIT ?
             """,
             (int(limit),),
-        ).fetchall()
-    return [dict(r) for r in rows]
+        )
 
 
 def list_chat_messages(session_id: int, limit: int = 200) -> List[dict]:
     with _conn_ro() as conn:
-        rows = conn.execute(
+        rows = _fetch_dicts(
+            conn,
             """
             SELECT id, session_id, created_at, role, mode, text, meta_json
             FROM chat_messages
@@ -120,7 +121,7 @@ def list_chat_messages(session_id: int, limit: int = 200) -> List[dict]:
             LIMIT ?
             """,
             (int(session_id), int(limit)),
-        ).fetchall()
+        )
     return [_row_dict(r) for r in rows]
 
 
@@ -161,7 +162,8 @@ def insert_chat_message(
 def list_recent_chat_messages(limit: int = 50, role: Optional[str] = None) -> List[dict]:
     with _conn_ro() as conn:
         if role:
-            rows = conn.execute(
+            rows = _fetch_dicts(
+                conn,
                 """
                 SELECT id, session_id, created_at, role, mode, text, meta_json
                 FROM chat_messages
@@ -170,9 +172,10 @@ def list_recent_chat_messages(limit: int = 50, role: Optional[str] = None) -> Li
                 LIMIT ?
                 """,
                 (str(role), int(limit)),
-            ).fetchall()
+            )
         else:
-            rows = conn.execute(
+            rows = _fetch_dicts(
+                conn,
                 """
                 SELECT id, session_id, created_at, role, mode, text, meta_json
                 FROM chat_messages
@@ -180,5 +183,5 @@ def list_recent_chat_messages(limit: int = 50, role: Optional[str] = None) -> Li
                 LIMIT ?
                 """,
                 (int(limit),),
-            ).fetchall()
+            )
     return [_row_dict(r) for r in rows]
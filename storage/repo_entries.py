@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
-from .db_core import _conn_ro, _conn_txn, _safe_json_loads, _utc_now_iso, compute_sha256
+from .db_core import _conn_ro, _conn_txn, _fetch_dicts, _safe_json_loads, _utc_now_iso, compute_sha256
 
 
 def insert_entry(raw_text: str, created_at: Optional[str] = None, source: str = "api") -> int:
@@ -38,7 +39,8 @@ def get_entry(entry_id: int) -> Optional[Dict[str, Any]]:
 def list_entries_by_date(date_str: str) -> List[Dict[str, Any]]:
     prefix = f"{str(date_str or '').strip()}%"
     with _conn_ro() as conn:
-        rows = conn.execute(
+        return _fetch_dicts(
+            conn,
             """
             SELECT id, created_at, raw_text, source, sha256, version
             FROM entries
@@ -46,8 +48,7 @@ def list_entries_by_date(date_str: str) -> List[Dict[str, Any]]:
             ORDER BY created_at ASC, id ASC
             """,
             (prefix,),
-        ).fetchall()
-    return [dict(r) for r in rows]
+        )
 
 
 def update_entry_text(entry_id: int, raw_text: str) -> None:
@@ -115,20 +116,58 @@ def save_entry_analysis(
 
 def list_recent_entries(limit: int = 50) -> list[dict]:
     with _conn_ro() as conn:
-        rows = conn.execute(
+        return _fetch_dicts(
+            conn,
             "SELECT id, created_at, raw_text, source, sha256, version FROM entries ORDER BY created_at DESC LIMIT ?",
             (limit,),
-        ).fetchall()
-    return [dict(r) for r in rows]
+        )
 
 
-def list_recent_entries_overview(limit: int = 50, *, max_attempts: int = 3) -> List[Dict[str, Any]]:
-    """Return recent entries with list-view analysis/job summary in one query."""
+def list_recent_entries_overview(
+    limit: int = 50,
+    *,
+    max_attempts: int = 3,
+    head_chars: int = 1024,
+    before: Optional[str] = None,
+    before_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Return recent entries with list-view analysis/job summary in one query.
+
+    Only the first `head_chars` characters of each entry are returned (`raw_text_head`)
+    together with the UTF-8 byte size (`size_bytes`); list views never need the full text.
+
+    Keyset pagination: pass the last row's `created_at` (and `id`) as `before`/`before_id`
+    to get the next page. Job stats are aggregated for the selected page only.
+    """
     max_attempts = int(max_attempts)
+    page_where = ""
+    page_params: List[Any] = []
+    if before:
+        if before_id is not None:
+            page_where = "WHERE created_at < ? OR (created_at = ? AND id < ?)"
+            page_params = [str(before), str(before), int(before_id)]
+        else:
+            page_where = "WHERE created_at < ?"
+            page_params = [str(before)]
+
     with _conn_ro() as conn:
         rows = conn.execute(
-            """
-            WITH job_stats AS (
+            f"""
+            WITH page AS (
+                SELECT
+                    id,
+                    created_at,
+                    substr(raw_text, 1, ?) AS raw_text_head,
+                    length(CAST(raw_text AS BLOB)) AS size_bytes,
+                    source,
+                    sha256,
+                    version
+                FROM entries
+                {page_where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            ),
+            job_stats AS (
                 SELECT
                     b.entry_id AS entry_id,
                     SUM(CASE WHEN j.status='pending' THEN 1 ELSE 0 END) AS pending,
@@ -138,14 +177,16 @@ def list_recent_entries_overview(limit: int = 50, *, max_attempts: int = 3) -> L
                     SUM(CASE WHEN j.status='failed' AND j.attempts < ? THEN 1 ELSE 0 END) AS failed_retriable,
                     SUM(CASE WHEN j.status='failed' AND j.attempts >= ? THEN 1 ELSE 0 END) AS failed_exhausted,
                     COUNT(*) AS total
-                FROM entry_blocks b
+                FROM page p
+                JOIN entry_blocks b ON b.entry_id = p.id
                 JOIN block_jobs j ON j.block_id = b.block_id
                 GROUP BY b.entry_id
             )
             SELECT
                 e.id,
                 e.created_at,
-                e.raw_text,
+                e.raw_text_head,
+                e.size_bytes,
                 e.source,
                 e.sha256,
                 e.version,
@@ -167,13 +208,12 @@ def list_recent_entries_overview(limit: int = 50, *, max_attempts: int = 3) -> L
                     ORDER BY b2.idx ASC, j.updated_at DESC
                     LIMIT 1
                 ) AS first_failure_error
-            FROM entries e
+            FROM page e
             LEFT JOIN entry_analysis a ON a.entry_id = e.id
             LEFT JOIN job_stats js ON js.entry_id = e.id
-            ORDER BY e.created_at DESC
-            LIMIT ?
+            ORDER BY e.created_at DESC, e.id DESC
             """,
-            (max_attempts, max_attempts, int(limit)),
+            (max(1, int(head_chars)), *page_params, int(limit), max_attempts, max_attempts),
         ).fetchall()
 
     out: List[Dict[str, Any]] = []
@@ -239,6 +279,48 @@ def list_recent_entry_summaries(n: int = 8) -> List[Dict[str, Any]]:
     return out
 
 
+def count_recent_analysis_topics(n: int = 24, top_k: int = 6) -> List[Tuple[str, int]]:
+    """Top topics over the most recent N analyzed entries.
+
+    SQLite (JSON1) hands back only each row's `topics` array instead of the whole analysis;
+    rows json_valid rejects (e.g. NaN literals) fall back to _safe_json_loads. Topics are
+    normalized and counted in Python, so ties keep first-seen order (newest entry first).
+    Rows whose `topics` is not an array contribute nothing.
+    """
+    with _conn_ro() as conn:
+        rows = conn.execute(
+            """
+            SELECT
+                CASE
+                    WHEN NOT json_valid(a.analysis_json) THEN a.analysis_json
+                    WHEN json_type(a.analysis_json, '$.topics') = 'array'
+                        THEN json_extract(a.analysis_json, '$.topics')
+                END AS topics,
+                json_valid(a.analysis_json) AS valid
+            FROM entries e
+            JOIN entry_analysis a ON a.entry_id = e.id
+            ORDER BY e.created_at DESC
+            LIMIT ?
+            """,
+            (int(n),),
+        ).fetchall()
+
+    counter: Counter[str] = Counter()
+    for r in rows:
+        if not r["topics"]:
+            continue
+        topics = _safe_json_loads(r["topics"])
+        if not r["valid"]:
+            topics = topics.get("topics") if isinstance(topics, dict) else None
+        if not isinstance(topics, list):
+            continue
+        for topic in topics:
+            t = str(topic or "").strip()
+            if t:
+                counter[t] += 1
+    return counter.most_common(int(top_k))
+
+
 def get_entry_analysis_brief(entry_id: int) -> Optional[Dict[str, Any]]:
     """Fetch one entry's analysis in a compact form suitable for context_pack."""
     with _conn_ro() as conn:
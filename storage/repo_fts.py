@@ -6,6 +6,13 @@ from typing import Any, Dict, List, Optional
 from .db_core import _conn_ro, _conn_txn, _fts_table_exists, _utc_now_iso
 
 
+def _join_str_list(value: Any, sep: str) -> str:
+    """Join the non-blank, stripped items of a list field; non-lists index as empty."""
+    if not isinstance(value, list):
+        return ""
+    return sep.join(t for x in value if (t := str(x).strip()))
+
+
 def upsert_entry_fts(
     *,
     entry_id: int,
@@ -26,22 +33,11 @@ def upsert_entry_fts(
             r = conn.execute("SELECT created_at FROM entries WHERE id=?", (int(entry_id),)).fetchone()
             created_at = (r[0] if r else None) or _utc_now_iso()
 
-        summary = str((analysis_obj or {}).get("summary_1_3") or "").strip()
-
-        topics = (analysis_obj or {}).get("topics") or []
-        if not isinstance(topics, list):
-            topics = []
-        topics_text = " ".join([str(x).strip() for x in topics if str(x).strip()])
-
-        facts = (analysis_obj or {}).get("facts") or []
-        if not isinstance(facts, list):
-            facts = []
-        facts_text = " \n ".join([str(x).strip() for x in facts if str(x).strip()])
-
-        todos = (analysis_obj or {}).get("todos") or []
-        if not isinstance(todos, list):
-            todos = []
-        todos_text = " \n ".join([str(x).strip() for x in todos if str(x).strip()])
+        obj = analysis_obj or {}
+        summary = str(obj.get("summary_1_3") or "").strip()
+        topics_text = _join_str_list(obj.get("topics"), " ")
+        facts_text = _join_str_list(obj.get("facts"), " \n ")
+        todos_text = _join_str_list(obj.get("todos"), " \n ")
 
         # FTS5 virtual tables do not reliably support ON CONFLICT; do delete+insert.
         conn.execute("DELETE FROM entry_fts WHERE rowid=?", (int(entry_id),))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -279,6 +280,27 @@ def count_block_jobs_by_status(status: str) -> int:
     return int(row["n"] if row else 0)
 
 
+BLOCK_JOB_STATUSES = ("pending", "running", "done", "failed", "skipped")
+
+
+def block_job_status_counts(conn: Optional[sqlite3.Connection] = None) -> Dict[str, int]:
+    """Per-status job counts plus `total`, from one GROUP BY pass.
+
+    The total comes from a window SUM over the grouped counts, so SQLite computes it in
+    the same scan of idx_block_jobs_status. `total` includes any unknown status values.
+    """
+    sql = "SELECT status, COUNT(*) AS n, SUM(COUNT(*)) OVER () AS total FROM block_jobs GROUP BY status"
+    if conn is None:
+        with _conn_ro() as c:
+            rows = c.execute(sql).fetchall()
+    else:
+        rows = conn.execute(sql).fetchall()
+    stats: Dict[str, int] = dict.fromkeys(BLOCK_JOB_STATUSES, 0)
+    stats.update({str(r[0]): int(r[1]) for r in rows if r[0] in stats})
+    stats["total"] = int(rows[0][2]) if rows else 0
+    return stats
+
+
 def list_pending_block_jobs(limit: int = 50) -> List[Dict[str, Any]]:
     """List pending jobs with block payload for a worker to consume later."""
     with _conn_ro() as conn:
@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any, Optional
 
-from storage.db_core import _conn_ro, _conn_txn, _parse_iso_utc, _safe_json_loads, _utc_now_iso
+from storage.db_core import _conn_ro, _conn_txn, _parse_iso_utc, _safe_json_loads, _utc_now_iso, transaction
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -79,8 +80,12 @@ def upsert_cached_response_json(
     response_json: dict[str, Any],
     *,
     enabled: Optional[bool] = None,
+    db_path: Optional[Path] = None,
 ) -> str:
-    """Insert/replace cached response payload; returns cache_key."""
+    """Insert/replace cached response payload; returns cache_key.
+
+    `db_path` pins the database when the write runs off the request thread.
+    """
     if enabled is None:
         enabled = is_cache_enabled()
 
@@ -92,7 +97,7 @@ def upsert_cached_response_json(
     # Stable encoding helps debugging and makes diffs easier to read.
     payload_s = json.dumps(response_json, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
-    with _conn_txn() as conn:
+    with transaction(db_path) as conn:
         conn.execute(
             """
             INSERT INTO llm_cache(cache_key, provider, model, response_json, created_at, updated_at)
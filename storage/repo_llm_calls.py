@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import atexit
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-from .db_core import _conn_ro, _conn_txn, _safe_json_loads, _utc_now_iso
+from .db_core import _conn_ro, _conn_txn, _safe_json_loads, _utc_now_iso, get_db_path, transaction
+
+logger = logging.getLogger(__name__)
 
 
 def _to_json_text(obj: Any) -> Optional[str]:
@@ -22,7 +30,18 @@ def _to_json_text(obj: Any) -> Optional[str]:
         return str(obj)
 
 
-def insert_call(
+_INSERT_CALL_SQL = """
+    INSERT INTO llm_calls(
+        created_at, provider, model, prompt_version,
+        request_hash, request_json, response_json,
+        status, error, ms,
+        tokens_prompt, tokens_completion, tokens_total
+    )
+    VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)
+"""
+
+
+def _call_row(
     *,
     provider: str,
     model: str,
@@ -37,48 +56,153 @@ def insert_call(
     tokens_completion: Optional[int] = None,
     tokens_total: Optional[int] = None,
     created_at: Optional[str] = None,
-) -> int:
-    """Insert one llm call audit row. Returns inserted id."""
+) -> Tuple[Any, ...]:
     status = str(status or "").strip().lower()
     if status not in {"ok", "failed"}:
         status = "failed"
         error = error or "invalid status"
 
-    created_at = created_at or _utc_now_iso()
+    return (
+        created_at or _utc_now_iso(),
+        str(provider),
+        str(model),
+        str(prompt_version),
+        str(request_hash),
+        _to_json_text(request_json),
+        _to_json_text(response_json),
+        status,
+        error,
+        int(ms) if ms is not None else None,
+        int(tokens_prompt) if tokens_prompt is not None else None,
+        int(tokens_completion) if tokens_completion is not None else None,
+        int(tokens_total) if tokens_total is not None else None,
+    )
 
-    req_txt = _to_json_text(request_json)
-    resp_txt = _to_json_text(response_json)
 
+def insert_call(
+    *,
+    provider: str,
+    model: str,
+    prompt_version: str,
+    request_hash: str,
+    request_json: Any = None,
+    response_json: Any = None,
+    status: str = "ok",
+    error: Optional[str] = None,
+    ms: Optional[int] = None,
+    tokens_prompt: Optional[int] = None,
+    tokens_completion: Optional[int] = None,
+    tokens_total: Optional[int] = None,
+    created_at: Optional[str] = None,
+) -> int:
+    """Insert one llm call audit row. Returns inserted id."""
+    row = _call_row(
+        provider=provider,
+        model=model,
+        prompt_version=prompt_version,
+        request_hash=request_hash,
+        request_json=request_json,
+        response_json=response_json,
+        status=status,
+        error=error,
+        ms=ms,
+        tokens_prompt=tokens_prompt,
+        tokens_completion=tokens_completion,
+        tokens_total=tokens_total,
+        created_at=created_at,
+    )
     with _conn_txn() as conn:
-        cur = conn.execute(
-            """
-            INSERT INTO llm_calls(
-                created_at, provider, model, prompt_version,
-                request_hash, request_json, response_json,
-                status, error, ms,
-                tokens_prompt, tokens_completion, tokens_total
-            )
-            VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """,
-            (
-                created_at,
-                str(provider),
-                str(model),
-                str(prompt_version),
-                str(request_hash),
-                req_txt,
-                resp_txt,
-                status,
-                error,
-                int(ms) if ms is not None else None,
-                int(tokens_prompt) if tokens_prompt is not None else None,
-                int(tokens_completion) if tokens_completion is not None else None,
-                int(tokens_total) if tokens_total is not None else None,
-            ),
-        )
+        cur = conn.execute(_INSERT_CALL_SQL, row)
         return int(cur.lastrowid)
 
 
+# Buffered audit writes: callers on the generation path enqueue rows and a daemon thread
+# commits them in batches (one transaction + executemany per DB file).
+AUDIT_BATCH_MAX = 64
+AUDIT_FLUSH_S = 0.25
+_audit_queue: "queue.Queue[Tuple[Path, Tuple[Any, ...]]]" = queue.Queue(maxsize=2048)
+_audit_thread: Optional[threading.Thread] = None
+_audit_thread_lock = threading.Lock()
+
+
+def _write_call_rows(batch: List[Tuple[Path, Tuple[Any, ...]]]) -> None:
+    by_path: Dict[Path, List[Tuple[Any, ...]]] = {}
+    for path, row in batch:
+        by_path.setdefault(path, []).append(row)
+    for path, rows in by_path.items():
+        try:
+            with transaction(path) as conn:
+                conn.executemany(_INSERT_CALL_SQL, rows)
+        except Exception as e:
+            # Audit must never take down the caller; drop the batch but say so.
+            logger.warning(f"llm_calls audit batch dropped rows={len(rows)} err={type(e).__name__}: {e}")
+
+
+def _audit_writer() -> None:
+    while True:
+        batch = [_audit_queue.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_S
+        while len(batch) < AUDIT_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _write_call_rows(batch)
+        finally:
+            for _ in batch:
+                _audit_queue.task_done()
+
+
+def _ensure_audit_writer() -> None:
+    global _audit_thread
+    if _audit_thread is not None and _audit_thread.is_alive():
+        return
+    with _audit_thread_lock:
+        if _audit_thread is None or not _audit_thread.is_alive():
+            _audit_thread = threading.Thread(target=_audit_writer, name="llm-calls-audit", daemon=True)
+            _audit_thread.start()
+
+
+def enqueue_call(**kwargs: Any) -> None:
+    """
+    Buffer one audit row (same keywords as `insert_call`) for the background writer.
+    The target DB is resolved now; when the buffer is full the row is written synchronously.
+    """
+    row = _call_row(**kwargs)
+    path = get_db_path()
+    _ensure_audit_writer()
+    try:
+        _audit_queue.put_nowait((path, row))
+    except queue.Full:
+        _write_call_rows([(path, row)])
+
+
+def flush_call_audit() -> None:
+    """Block until every buffered audit row has been written."""
+    if _audit_thread is not None and _audit_thread.is_alive():
+        _audit_queue.join()
+        return
+    batch: List[Tuple[Path, Tuple[Any, ...]]] = []
+    while True:
+        try:
+            batch.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        try:
+            _write_call_rows(batch)
+        finally:
+            for _ in batch:
+                _audit_queue.task_done()
+
+
+atexit.register(flush_call_audit)
+
+
 def get_call(call_id: int) -> Optional[Dict[str, Any]]:
     with _conn_ro() as conn:
         row = conn.execute(
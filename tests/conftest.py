@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from storage.db_core import init_db
+from storage.db_core import close_thread_connections, init_db
 
 
 @pytest.fixture
@@ -10,4 +10,5 @@ def isolated_db(monkeypatch, tmp_path):
     db_path = tmp_path / "test.sqlite3"
     monkeypatch.setenv("DIARY_DB_PATH", str(db_path))
     init_db()
-    return db_path
+    yield db_path
+    close_thread_connections(db_path)
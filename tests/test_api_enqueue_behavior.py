@@ -68,3 +68,144 @@ def test_analyze_latest_route_only_enqueues(monkeypatch, isolated_db, tmp_path):
     assert len(queued) == 1
     assert int(queued[0]["entry_limit"]) == 10
     assert int(queued[0]["job_limit"]) == 20
+
+
+def test_enqueue_latest_analysis_backfills_blocks_in_process(isolated_db, tmp_path):
+    from services.analysis_runner import enqueue_latest_analysis
+    from storage.repo_entries import insert_entry
+    from storage.repo_jobs import count_block_jobs_by_status
+
+    insert_entry(raw_text="Backfill me: an entry saved before blocks existed.", source="test")
+
+    res = enqueue_latest_analysis(
+        base_dir=Path(tmp_path),
+        entry_limit=10,
+        job_limit=20,
+        preferred_provider="deepseek",
+        min_block_chars=20,
+        max_attempts=8,
+        job_timeout_s=180,
+    )
+
+    assert res["ok"] is True
+    assert res["backfill_rc"] == 0
+    assert res["job_limit"] == 20
+    assert "queued_entries=1" in res["stdout"]
+    assert count_block_jobs_by_status("pending") > 0
+
+
+def test_enqueue_latest_analysis_reports_failed_entries(monkeypatch, isolated_db, tmp_path):
+    import scripts.backfill_blocks_jobs as backfill
+    from services.analysis_runner import enqueue_latest_analysis
+    from storage.repo_entries import insert_entry
+
+    def _boom(**kwargs):
+        raise RuntimeError("split failed")
+
+    monkeypatch.setattr(backfill, "_enqueue_entry_blocks", _boom)
+    insert_entry(raw_text="An entry whose block split fails.", source="test")
+
+    res = enqueue_latest_analysis(
+        base_dir=Path(tmp_path),
+        entry_limit=10,
+        job_limit=20,
+        preferred_provider="deepseek",
+        min_block_chars=20,
+        max_attempts=8,
+        job_timeout_s=180,
+    )
+
+    assert res["ok"] is False
+    assert res["backfill_rc"] == 1
+    assert "failed=1" in res["stdout"]
+    assert "split failed" in res["stderr"]
+
+
+def test_analyze_status_serves_cached_stats_within_ttl(monkeypatch, isolated_db):
+    from storage.repo_entries import insert_entry
+    from storage.repo_jobs import insert_block_job, insert_entry_block
+
+    monkeypatch.setenv("DIARY_ANALYZE_STATUS_TTL_S", "60")
+    monkeypatch.setattr(routes_diary, "_status_cache", {"t": 0.0, "v": None, "gen": 0})
+    entry_id = insert_entry(raw_text="status cache", source="test")
+
+    def _add_job(idx: int) -> None:
+        block_id = insert_entry_block(entry_id=entry_id, idx=idx, title=None, raw_text=f"block {idx}")
+        insert_block_job(block_id=block_id, status="pending", attempts=0)
+
+    _add_job(0)
+    with TestClient(server.app) as client:
+        first = client.get("/api/diary/analyze_status").json()
+        _add_job(1)
+        cached = client.get("/api/diary/analyze_status").json()
+        monkeypatch.setenv("DIARY_ANALYZE_STATUS_TTL_S", "0")
+        fresh = client.get("/api/diary/analyze_status").json()
+
+    assert first["stats"]["pending"] == 1
+    assert cached["stats"]["pending"] == 1
+    assert fresh["stats"]["pending"] == 2
+    assert fresh["stats"]["total"] == 2
+
+
+def test_analyze_latest_invalidates_cached_status(monkeypatch, isolated_db):
+    monkeypatch.setenv("DIARY_ANALYZE_STATUS_TTL_S", "60")
+    monkeypatch.setattr(routes_diary, "_status_cache", {"t": 0.0, "v": None, "gen": 0})
+    monkeypatch.setattr(routes_diary, "queue_latest_analysis", lambda **kwargs: {"ok": True, "queued": True})
+
+    with TestClient(server.app) as client:
+        client.get("/api/diary/analyze_status")
+        assert routes_diary._status_cache["v"] is not None
+        client.post("/api/diary/analyze_latest", json={})
+        assert routes_diary._status_cache["v"] is None
+
+
+def test_analyze_status_drops_a_fill_started_before_invalidation(monkeypatch):
+    import asyncio
+
+    monkeypatch.setenv("DIARY_ANALYZE_STATUS_TTL_S", "60")
+    monkeypatch.setattr(routes_diary, "_status_cache", {"t": 0.0, "v": None, "gen": 0})
+
+    def _fetch_then_invalidate():
+        routes_diary._invalidate_status_cache()  # e.g. a delete landing mid-fetch
+        return {"pending": 1, "total": 1}
+
+    monkeypatch.setattr(routes_diary, "_fetch_job_stats", _fetch_then_invalidate)
+
+    res = asyncio.run(routes_diary.analyze_status())
+
+    assert res["stats"]["pending"] == 1
+    assert routes_diary._status_cache["v"] is None
+
+
+def test_status_lock_is_per_event_loop():
+    import asyncio
+
+    async def _lock():
+        lock = routes_diary._get_status_lock()
+        async with lock:
+            assert lock is routes_diary._get_status_lock()
+        return lock
+
+    assert asyncio.run(_lock()) is not asyncio.run(_lock())
+
+
+def test_save_route_writes_backup_alongside_enqueue(monkeypatch, isolated_db, tmp_path):
+    monkeypatch.setattr(routes_diary, "queue_entry_analysis", lambda **kwargs: {"ok": True, "queued": True})
+    server.app.state.ingest_entry = ingest_entry
+    server.app.state.InputError = ValueError
+    server.app.state.base_dir = Path(tmp_path)
+    monkeypatch.setattr(server.app.state, "data_dir", Path(tmp_path), raising=False)
+
+    with TestClient(server.app) as client:
+        res = client.post("/api/diary/save", json={"text": "  backup me  ", "date": "2026-04-12"})
+        bad = client.post("/api/diary/save", json={"text": "   ", "date": "2026-04-13"})
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["backup_warning"] == ""
+    assert body["entry_detail"]
+    backup = Path(body["file"])
+    assert backup == Path(tmp_path) / "diaries" / "2026-04-12.txt"
+    assert backup.read_text(encoding="utf-8").endswith("\nbackup me\n")
+    assert bad.status_code == 400
+    assert not (Path(tmp_path) / "diaries" / "2026-04-13.txt").exists()
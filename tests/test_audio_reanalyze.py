@@ -68,3 +68,115 @@ def test_reanalyze_audio_reuses_existing_entry(monkeypatch, isolated_db, tmp_pat
     assert link is not None
     assert int(link["entry_id"]) == int(entry_id)
     assert str(link["status"]) == "done"
+
+
+class _FakeUpload:
+    def __init__(self, data: bytes, *, filename: str = "clip.wav", content_type: str = "audio/wav"):
+        self._data = data
+        self._pos = 0
+        self.filename = filename
+        self.content_type = content_type
+        self.closed = False
+
+    async def read(self, size: int = -1) -> bytes:
+        end = len(self._data) if size < 0 else self._pos + size
+        chunk = self._data[self._pos:end]
+        self._pos += len(chunk)
+        return chunk
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_save_audio_writes_all_chunks_and_rejects_oversize(monkeypatch, isolated_db, tmp_path):
+    from fastapi import HTTPException
+
+    monkeypatch.setattr(audio_ingest_service, "_UPLOAD_CHUNK_BYTES", 7)
+    monkeypatch.setattr(audio_ingest_service, "analyze_audio_file", lambda path: {"source_ext": ".wav"})
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(base_dir=Path(tmp_path), data_dir=Path(tmp_path))))
+    payload = bytes(range(256)) * 3
+
+    res = asyncio.run(
+        audio_ingest_service.save_audio_diary_payload(
+            request=request,
+            audio=_FakeUpload(payload),
+            date_str="2026-04-12",
+            note=None,
+            max_audio_upload_bytes=4096,
+            ingest_entry=None,
+            input_error_type=ValueError,
+        )
+    )
+    assert res["size_bytes"] == len(payload)
+    assert Path(res["file"]).read_bytes() == payload
+
+    try:
+        asyncio.run(
+            audio_ingest_service.save_audio_diary_payload(
+                request=request,
+                audio=_FakeUpload(payload),
+                date_str="2026-04-12",
+                note=None,
+                max_audio_upload_bytes=100,
+                ingest_entry=None,
+                input_error_type=ValueError,
+            )
+        )
+    except HTTPException as e:
+        assert e.status_code == 413
+    else:
+        raise AssertionError("oversized upload should be rejected")
+    assert len(list((Path(tmp_path) / "diaries" / "audio" / "2026-04-12").iterdir())) == 1
+
+
+def test_spool_upload_propagates_read_errors(tmp_path):
+    class _BrokenUpload(_FakeUpload):
+        async def read(self, size: int = -1) -> bytes:
+            if self._pos > 0:
+                raise ConnectionResetError("client went away")
+            return await super().read(size)
+
+    target = Path(tmp_path) / "partial.webm"
+    try:
+        asyncio.run(audio_ingest_service._spool_upload_to_file(_BrokenUpload(b"x" * 64), target, max_bytes=1024))
+    except ConnectionResetError:
+        pass
+    else:
+        raise AssertionError("read error should propagate")
+
+
+def test_spool_upload_copies_rolled_spool_file(tmp_path):
+    import tempfile
+
+    from starlette.datastructures import UploadFile
+
+    payload = bytes(range(256)) * 8
+    spool = tempfile.SpooledTemporaryFile(max_size=64)
+    spool.write(payload)
+    spool.seek(0)
+    assert spool._rolled
+    upload = UploadFile(file=spool, filename="clip.wav")
+
+    target = Path(tmp_path) / "copied.wav"
+    total = asyncio.run(audio_ingest_service._spool_upload_to_file(upload, target, max_bytes=len(payload)))
+    assert total == len(payload)
+    assert target.read_bytes() == payload
+
+    too_small = asyncio.run(audio_ingest_service._spool_upload_to_file(upload, target, max_bytes=len(payload) - 1))
+    assert too_small == -1
+    spool.close()
+
+
+def test_copy_spooled_upload_falls_back_without_sendfile(monkeypatch, tmp_path):
+    import tempfile
+
+    def _no_sendfile(*args, **kwargs):
+        raise OSError("sendfile not supported for regular files")
+
+    monkeypatch.setattr(audio_ingest_service.os, "sendfile", _no_sendfile, raising=False)
+    payload = b"abc" * 1000
+    with tempfile.TemporaryFile() as src:
+        src.write(payload)
+        target = Path(tmp_path) / "fallback.wav"
+        assert audio_ingest_service._copy_spooled_upload(src, target, 10_000) == len(payload)
+    assert target.read_bytes() == payload
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from block_analyze import _parse_or_raise
+import asyncio
+import json
+
+from block_analyze import (
+    StageCallResult,
+    _coerce_signal,
+    _coerce_str_list,
+    _local_repair_json,
+    _parse_or_raise,
+    _run_json_stage,
+    _try_repair_json_lines,
+)
 
 
 def test_parse_or_raise_repairs_missing_commas_between_members():
@@ -26,3 +37,98 @@ def test_parse_or_raise_repairs_missing_commas_between_members():
     assert obj["open_insight"] == "他在冲突和自我保护之间摇摆"
     assert obj["signals"]["work"] == 9
     assert obj["reflection_depth"] == 2
+
+
+def test_local_repair_closes_truncated_and_single_quoted_output():
+    assert _local_repair_json('```json\n{"a": "x", "b": [1, 2') == '{"a": "x", "b": [1, 2]}'
+    assert _local_repair_json('{"a": 1, "b":') == '{"a": 1}'
+    assert _local_repair_json("{'a': 'b'}") == '{"a": "b"}'
+    assert _local_repair_json('{"a": 1, "summary": "cut off mid') == '{"a": 1, "summary": "cut off mid'
+
+
+def test_json_stage_uses_model_repair_when_output_is_cut_mid_string():
+    truncated = '{"summary_1_3":"睡得不好，因为'
+    repaired = (
+        '{"summary_1_3":"睡得不好","open_insight":"需要休息",'
+        '"signals":{"mood":4,"stress":6,"sleep":3,"exercise":null,"social":null,"work":null},'
+        '"facts":[],"todos":[],"topics":["sleep"]}'
+    )
+    stages = []
+    recorded = []
+
+    async def caller(stage, messages, fmt, max_tokens):
+        stages.append(stage)
+        return StageCallResult(output=repaired if stage.endswith("_repair") else truncated, ms=7, model="ollama:phi")
+
+    parsed, _ms, _model, _output = asyncio.run(
+        _run_json_stage(
+            stage_name="final",
+            title=None,
+            raw_text="睡得不好",
+            template_obj={},
+            build_messages=lambda: [],
+            parser=_parse_or_raise,
+            stage_caller=caller,
+            fallback_stage_caller=None,
+            stage_recorder=lambda **kw: recorded.append((kw["stage"], kw["status"])),
+            input_meta={},
+            max_tokens=256,
+        )
+    )
+
+    assert stages == ["final", "final_repair"]
+    assert parsed["summary_1_3"] == "睡得不好"
+    assert ("final_local_repair", "ok") not in recorded
+
+
+def test_json_stage_skips_model_repair_when_local_fix_parses():
+    truncated = (
+        '{"summary_1_3":"睡得不好","open_insight":"需要休息",'
+        '"signals":{"mood":4,"stress":6,"sleep":3,"exercise":null,"social":null,"work":null},'
+        '"facts":[],"todos":[],"topics":["sleep"'
+    )
+    stages = []
+    recorded = []
+
+    async def caller(stage, messages, fmt, max_tokens):
+        stages.append(stage)
+        return StageCallResult(output=truncated, ms=7, model="ollama:phi")
+
+    parsed, ms, model, output = asyncio.run(
+        _run_json_stage(
+            stage_name="final",
+            title=None,
+            raw_text="睡得不好",
+            template_obj={},
+            build_messages=lambda: [],
+            parser=_parse_or_raise,
+            stage_caller=caller,
+            fallback_stage_caller=None,
+            stage_recorder=lambda **kw: recorded.append((kw["stage"], kw["status"])),
+            input_meta={},
+            max_tokens=256,
+        )
+    )
+
+    assert stages == ["final"]
+    assert parsed["topics"] == ["sleep"]
+    assert (ms, model) == (7, "ollama:phi")
+    assert output.endswith('["sleep"]}')
+    assert recorded == [("final", "failed"), ("final_local_repair", "ok")]
+
+
+def test_coerce_str_list_keeps_clean_lists_and_filters_mixed_ones():
+    clean = ["a", "b"]
+    assert _coerce_str_list(clean) is clean
+    assert _coerce_str_list(["a", " ", 3, 2.5, None, {"x": 1}, ""]) == ["a", "3", "2.5"]
+    assert _coerce_str_list(None) == []
+    assert _coerce_str_list("not a list") == []
+
+
+def test_coerce_signal_string_forms():
+    assert [_coerce_signal(v) for v in ("7", " 10 ", "11", "６", "7.6", "about 3/10", "-2", "n/a", "")] == [7, 10, None, 6, 8, 3, None, None, None]
+
+
+def test_repair_json_lines_keeps_structural_lines_only():
+    raw = 'Here you go:\r\n{\r\n  "a": 1,\r\n  stray words\r\n\r\n  "b": "x"\r\n}\r\n'
+    assert json.loads(_try_repair_json_lines(raw)) == {"a": 1, "b": "x"}
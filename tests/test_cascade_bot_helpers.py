@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bot import cascade_bot
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("I slept badly after the deadline", "sleep"),
+        ("今天上班很累", "work"),
+        ("Went running with friends", "exercise"),
+        ("压力好大", "stress"),
+        ("What did I eat for dinner today", "what did eat dinner"),
+        ("我们 今天 吃了 火锅", "吃了 火锅"),
+        ("", ""),
+    ],
+)
+def test_fallback_query(text, expected):
+    assert cascade_bot._fallback_query(text) == expected
+
+
+def test_detect_lang_and_personal_query_hint():
+    assert cascade_bot._detect_lang("hello 你好") == "zh"
+    assert cascade_bot._detect_lang("hello") == "en"
+    assert cascade_bot._looks_like_personal_diary_query("你觉得我是什么样的人")
+    assert not cascade_bot._looks_like_personal_diary_query("what is the capital of France")
+    assert cascade_bot._personal_diary_query_hint("你知道我哪些信息") == "个人信息 习惯 主题"
+    assert cascade_bot._personal_diary_query_hint("我是不是总是熬夜睡不好") == "sleep"
+
+
+def test_topic_alternation_keeps_priority_order():
+    # "work" appears first in the text, but "sleep" has the higher priority.
+    assert cascade_bot._match_topic("work all day, then could not sleep") == "sleep"
+    assert cascade_bot._match_topic("a stressful meeting with friends") == "work"
+    assert cascade_bot._match_topic("nothing relevant here") == ""
+
+
+def test_route_cache_lru_and_ttl(monkeypatch):
+    monkeypatch.setattr(cascade_bot, "_ROUTE_CACHE", type(cascade_bot._ROUTE_CACHE)())
+    monkeypatch.setattr(cascade_bot, "ROUTE_CACHE_SIZE", 2)
+    now = [100.0]
+    monkeypatch.setattr(cascade_bot.time, "monotonic", lambda: now[0])
+
+    keys = [cascade_bot._route_cache_key("phi", cascade_bot._build_route_messages(q)) for q in ("a", "b", "c")]
+    assert keys[0] == cascade_bot._route_cache_key("phi", cascade_bot._build_route_messages("a"))
+    assert keys[0] != cascade_bot._route_cache_key("other", cascade_bot._build_route_messages("a"))
+
+    cascade_bot._route_cache_put(keys[0], {"intent": "general"})
+    cascade_bot._route_cache_put(keys[1], {"intent": "diary_qa"})
+    assert cascade_bot._route_cache_get(keys[0]) == {"intent": "general"}
+    cascade_bot._route_cache_put(keys[2], {"intent": "self_profile"})
+    assert cascade_bot._route_cache_get(keys[1]) is None  # least recently used evicted
+
+    now[0] += cascade_bot.ROUTE_CACHE_TTL_S + 1
+    assert cascade_bot._route_cache_get(keys[0]) is None
+    assert keys[0] not in cascade_bot._ROUTE_CACHE
+
+
+@pytest.mark.parametrize("text", ["我最近睡得怎么样？", 'say "hi" {}', ""])
+def test_route_user_payload_matches_full_dump(text):
+    import json
+
+    msgs = cascade_bot._build_route_messages(text)
+    assert msgs[0]["content"] is cascade_bot._ROUTE_SYSTEM
+    assert msgs[1]["content"] == json.dumps(
+        {"schema": cascade_bot._ROUTE_SCHEMA, "user_text": text}, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+class _RouteClient:
+    def __init__(self, route: dict, before_route=None):
+        self.route = route
+        self.before_route = before_route
+
+    async def chat_text(self, *, model, messages, options):
+        if model == "phi":
+            if self.before_route is not None:
+                await self.before_route()
+            return cascade_bot.dumps_json(self.route), 5
+        return '{"answer": "ok", "status": "ok", "evidence": {}}', 5
+
+
+@pytest.mark.parametrize(
+    "route_query, expected_calls",
+    [("", [("what did plan", 5, 8, 3000)]), ("plans", [("what did plan", 5, 8, 3000), ("plans", 5, 8, 3000)])],
+)
+def test_chat_reuses_speculative_pack_when_route_matches(monkeypatch, route_query, expected_calls):
+    import threading
+
+    calls = []
+    spec_started = threading.Event()
+
+    def fake_pack(query, *, top_k, recent_n, char_budget):
+        calls.append((query, top_k, recent_n, char_budget))
+        spec_started.set()
+        return {"meta": {}, "items": []}
+
+    async def _wait_for_speculative_pack():
+        # Sync on the speculative task: the route resolves only after its thread ran.
+        assert await asyncio.to_thread(spec_started.wait, 5)
+
+    monkeypatch.setattr(cascade_bot, "_ROUTE_CACHE", type(cascade_bot._ROUTE_CACHE)())
+    monkeypatch.setattr(cascade_bot, "routed_generate", None)
+    monkeypatch.setattr(cascade_bot, "build_context_pack", fake_pack)
+    monkeypatch.setattr(cascade_bot, "build_context_pack_text", lambda pack: "{}")
+    route = {"intent": "diary_qa", "query": route_query, "top_k": 5, "recent_n": 8, "char_budget": 3000, "lang": "en"}
+    bot = cascade_bot.CascadeBot(client=_RouteClient(route, _wait_for_speculative_pack), phi_model="phi", answer_model="qwen")
+
+    out = asyncio.run(bot.chat("what did i plan"))
+
+    assert out["reply"] == "ok"
+    assert calls == expected_calls
+
+
+def test_answer_messages_keep_question_independent_context_first():
+    profile = cascade_bot._build_answer_messages(user_text="我是什么样的人", context_pack_json='{"k":1}', lang="zh", intent="self_profile")
+    qa = cascade_bot._build_answer_messages(user_text="昨天做了什么", context_pack_json='{"k":1}', lang="zh", intent="diary_qa")
+
+    assert profile[0]["content"] is qa[0]["content"]
+    assert profile[1]["content"] == 'intent=self_profile\nCONTEXT_PACK_JSON:\n{"k":1}\n\nQUESTION:\n我是什么样的人'
+    assert qa[1]["content"] == 'intent=diary_qa\nQUESTION:\n昨天做了什么\n\nCONTEXT_PACK_JSON:\n{"k":1}'
+
+
+def test_route_cache_key_uses_xxhash_when_available(monkeypatch):
+    from types import SimpleNamespace
+
+    msgs = cascade_bot._build_route_messages("hello")
+    monkeypatch.setattr(cascade_bot, "xxhash", SimpleNamespace(xxh3_64_intdigest=lambda raw: len(raw)))
+    assert cascade_bot._route_cache_key("phi", msgs) == ("phi", len(cascade_bot.dumps_json(msgs).encode("utf-8")))
+
+    monkeypatch.setattr(cascade_bot, "xxhash", None)
+    model, digest = cascade_bot._route_cache_key("phi", msgs)
+    assert model == "phi" and isinstance(digest, bytes) and len(digest) == 16
+
+
+@pytest.mark.parametrize("has_timeout_at", [True, False])
+def test_await_until_enforces_deadline_with_or_without_timeout_at(monkeypatch, has_timeout_at):
+    if not has_timeout_at:
+        monkeypatch.delattr(asyncio, "timeout_at", raising=False)
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        assert await cascade_bot._await_until(asyncio.sleep(0, result="ok"), loop.time() + 5) == "ok"
+        with pytest.raises(asyncio.TimeoutError):
+            await cascade_bot._await_until(asyncio.sleep(5), loop.time() + 0.01)
+
+    asyncio.run(_run())
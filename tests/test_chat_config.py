@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import api.routes_chat as routes_chat
+
+
+def test_chat_config_is_cached_until_cleared(monkeypatch):
+    monkeypatch.setenv("CHAT_TIMEOUT_S", "12.5")
+    monkeypatch.setenv("CHAT_FORCE_CLOUD", "yes")
+    monkeypatch.setenv("CHAT_PREFERRED_PROVIDER", " Qwen ")
+    routes_chat._chat_config.cache_clear()
+    try:
+        assert routes_chat._chat_config() == (12.5, True, "qwen")
+
+        monkeypatch.setenv("CHAT_PREFERRED_PROVIDER", "unknown")
+        assert routes_chat._chat_config() == (12.5, True, "qwen")
+
+        routes_chat._chat_config.cache_clear()
+        assert routes_chat._chat_config() == (12.5, True, None)
+    finally:
+        routes_chat._chat_config.cache_clear()
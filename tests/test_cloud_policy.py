@@ -1,6 +1,16 @@
+import pytest
+
 from bot import generation_router as gr
 
 
+@pytest.fixture(autouse=True)
+def _fresh_router_env(monkeypatch):
+    monkeypatch.setattr(gr, "_BREAKER", gr._CloudBreaker())
+    gr._router_env.cache_clear()
+    yield
+    gr._router_env.cache_clear()
+
+
 def _base_payload():
     return {
         "intent": "weekly_review",
@@ -18,7 +28,7 @@ def test_route_blocks_when_privacy_level_exceeds_limit(monkeypatch):
 
     d = gr.route("chat_answer", p)
     assert d.backend == "local"
-    assert "privacy_blocked" in d.reason
+    assert "privacy_blocked req=L2 max=L1" in d.reason
 
 
 def test_route_blocks_raw_text_upload(monkeypatch):
@@ -68,3 +78,230 @@ def test_sanitize_cloud_messages_masks_pii():
     assert "a@b.com" not in s
     assert "13800138000" not in s
     assert "https://x.y" not in s
+    assert msgs[0]["content"].startswith("mail me at a@b.com")  # caller's messages untouched
+
+
+def test_router_env_is_parsed_once_until_cleared(monkeypatch, isolated_db):
+    monkeypatch.setenv("CLOUD_ENABLED", "0")
+    p = _base_payload()
+    assert gr.route("chat_answer", p).reason == "cloud_disabled"
+
+    monkeypatch.setenv("CLOUD_ENABLED", "1")
+    assert gr.route("chat_answer", p).reason == "cloud_disabled"
+
+    gr._router_env.cache_clear()
+    assert gr.route("chat_answer", p).reason != "cloud_disabled"
+
+
+def test_sanitize_cloud_messages_applies_patterns_in_priority_order():
+    msgs = [
+        {"role": "user", "content": "13800138000@qq.com, https://a@b.com/x and +86 138-0013-8000"},
+        {"role": "user", "content": "没有任何敏感信息"},
+        {"role": "assistant", "content": None},
+    ]
+    out = gr._sanitize_cloud_messages(msgs)
+    assert out[0]["content"] == "__, __ and __"
+    assert out[1]["content"] == "没有任何敏感信息"
+    assert out[2]["content"] is None
+
+
+def test_cloud_breaker_seeds_from_audit_then_tracks_in_process(monkeypatch):
+    from datetime import datetime, timezone
+
+    now = [1000.0]
+    monkeypatch.setattr(gr.time, "monotonic", lambda: now[0])
+    seeded = []
+    audit_failures = [1]
+
+    def fake_list_calls(**kw):
+        seeded.append(kw["provider"])
+        ts = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        return [{"created_at": ts}] * audit_failures[0]
+
+    monkeypatch.setattr("storage.repo_llm_calls.list_calls", fake_list_calls)
+    breaker = gr._CloudBreaker()
+
+    assert breaker.is_open("deepseek", window_s=60, threshold=2) is False
+    breaker.record_failure("deepseek")
+    assert breaker.is_open("deepseek", window_s=60, threshold=2) is True
+    assert seeded == ["deepseek"]
+
+    now[0] += 120
+    assert breaker.is_open("deepseek", window_s=60, threshold=2) is False
+
+    breaker.record_failure("deepseek")
+    breaker.record_failure("deepseek")
+    breaker.record_success("deepseek")
+    assert breaker.is_open("deepseek", window_s=60, threshold=2) is False
+    assert seeded == ["deepseek", "deepseek"]  # closed: re-seeded at most every RESEED_S
+
+
+def test_cloud_breaker_reseeds_failures_from_other_processes(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    now = [1000.0]
+    monkeypatch.setattr(gr.time, "monotonic", lambda: now[0])
+    rows = []
+    monkeypatch.setattr("storage.repo_llm_calls.list_calls", lambda **kw: list(rows))
+    breaker = gr._CloudBreaker()
+
+    assert breaker.is_open("qwen", window_s=600, threshold=2) is False
+    rows[:] = [{"created_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}] * 2
+    assert breaker.is_open("qwen", window_s=600, threshold=2) is False  # within RESEED_S
+
+    now[0] += breaker.RESEED_S
+    assert breaker.is_open("qwen", window_s=600, threshold=2) is True
+
+    breaker.record_success("qwen")
+    now[0] += breaker.RESEED_S
+    old = (datetime.now(timezone.utc) - timedelta(seconds=2 * breaker.RESEED_S)).isoformat(timespec="seconds")
+    rows[:] = [{"created_at": old}] * 2
+    assert breaker.is_open("qwen", window_s=600, threshold=2) is False  # failures before the success
+
+
+def test_estimate_chars_stops_at_cap():
+    msgs = [{"role": "user", "content": "x" * 10}, {"role": "assistant", "content": None}, {"role": "user", "content": "y" * 10}]
+    assert gr._estimate_chars_from_messages(msgs) == 37
+    assert gr._estimate_chars_from_messages(msgs, cap=5) == 14
+
+
+def test_run_local_chat_reuses_thread_loop_for_async_chat():
+    seen = []
+
+    async def fake_chat(**kwargs):
+        import asyncio
+
+        seen.append(asyncio.get_running_loop())
+        return kwargs["messages"]
+
+    assert gr._run_local_chat(fake_chat, messages="a") == "a"
+    assert gr._run_local_chat(fake_chat, messages="b") == "b"
+    assert gr._run_local_chat(lambda **kw: "sync", messages="c") == "sync"
+    assert len(seen) == 2 and seen[0] is seen[1]
+    assert not seen[0].is_closed()
+
+
+def test_filter_cloud_payload_keeps_only_routing_keys():
+    payload = {"intent": "weekly_review", "raw_text": "secret", "privacy_level": "L1", "extra": 1}
+    assert gr._filter_cloud_payload(payload) == {"intent": "weekly_review", "privacy_level": "L1"}
+
+
+def test_router_import_does_not_load_provider_http_clients():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, bot.generation_router\n"
+        "assert 'llm.providers.deepseek_api' not in sys.modules\n"
+        "assert 'storage.repo_llm_cache' not in sys.modules\n"
+        "import llm.providers as p\n"
+        "assert sorted(p.PROVIDERS) == ['deepseek', 'qwen']\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_route_skips_length_scan_when_intent_decides(monkeypatch):
+    monkeypatch.setenv("CLOUD_ENABLED", "1")
+    monkeypatch.setenv("CLOUD_MAX_PRIVACY_LEVEL", "L2")
+    monkeypatch.setattr(gr, "_estimate_chars_from_messages", lambda *a, **k: pytest.fail("length scanned"))
+    p = _base_payload()  # intent=weekly_review
+    p["messages"] = [{"role": "user", "content": "x" * 10}]
+
+    d = gr.route("chat_answer", p)
+    assert d.backend == "cloud"
+    assert d.reason == "cloud len=-1 intent=weekly_review"
+
+
+def test_sanitize_and_filter_pass_clean_input_through():
+    msgs = [{"role": "user", "content": "今天 2 点散步"}, {"role": "user", "content": "晚饭：[米饭]"}]
+    out = gr._sanitize_cloud_messages(msgs[:1])
+    assert out == msgs[:1] and out[0] is msgs[0]
+    assert gr._sanitize_cloud_messages(msgs)[1]["content"] == "晚饭：__"
+
+    payload = {"intent": "chat", "privacy_level": "L1"}
+    assert gr._filter_cloud_payload(payload) is payload
+
+
+def test_provider_result_from_cached_raw_tolerates_partial_payloads():
+    full = {"choices": [{"message": {"content": "hi"}}], "usage": {"prompt_tokens": 3, "total_tokens": 5}}
+    res = gr._provider_result_from_cached_raw(provider="deepseek", model="m", raw=full)
+    assert (res.content, res.prompt_tokens, res.completion_tokens, res.total_tokens) == ("hi", 3, None, 5)
+
+    for raw in ({}, {"choices": []}, {"choices": [{"message": None}]}, {"usage": "n/a"}):
+        res = gr._provider_result_from_cached_raw(provider="deepseek", model="m", raw=raw)
+        assert res.content == "" and res.total_tokens is None
+
+
+def test_cloud_success_persists_in_background_then_serves_cache(monkeypatch, isolated_db, tmp_path):
+    from llm.providers import ProviderResult
+
+    monkeypatch.setenv("CLOUD_ENABLED", "1")
+    monkeypatch.setenv("CLOUD_MAX_PRIVACY_LEVEL", "L2")
+    monkeypatch.setenv("DIARY_DATA_DIR", str(tmp_path))
+    calls = []
+
+    class _FakeProvider:
+        def chat(self, messages, model, **kwargs):
+            calls.append(model)
+            raw = {"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 3}}
+            return ProviderResult(content="ok", raw=raw, provider="deepseek", model=model, ms=5)
+
+    monkeypatch.setattr("llm.providers.get_provider", lambda name: _FakeProvider())
+    kwargs = dict(task="chat_answer", payload=_base_payload(), messages=[{"role": "user", "content": "周报"}])
+
+    assert gr.generate(**kwargs).content == "ok"
+    assert len(list((tmp_path / "requests").glob("*/request.json"))) == 1  # written before the call
+    gr.flush_persist_writes()
+    assert len(list((tmp_path / "requests").glob("*/response.json"))) == 1
+
+    assert gr.generate(**kwargs).content == "ok"
+    assert len(calls) == 1
+
+
+def test_mask_pii_literal_gates_match_ungated_sequential_subs():
+    import random
+
+    def _ungated(text):
+        for pat in gr._PII_PATTERNS:
+            text = pat.sub("__", text)
+        return text
+
+    rng = random.Random(7)
+    alphabet = list("ab.@:/-+() 1234567890") + ["http://", "https://", "中", "\n", ".com"]
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert gr._mask_pii(text) == _ungated(text)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("+86 13800138000@qq.com", "+86 __"),
+        ("call 123 4567@foo.com", "call 123 __"),
+        ("我的邮箱是 86 12345678@qq.com", "我的邮箱是 86 __"),
+    ],
+)
+def test_sanitize_masks_email_before_a_leading_number(text, expected):
+    out = gr._sanitize_cloud_messages([{"role": "user", "content": text}])
+    assert out[0]["content"] == expected
+    assert "qq.com" not in out[0]["content"] and "foo.com" not in out[0]["content"]
+
+
+def test_cloud_providers_share_one_ssl_context_and_static_headers(monkeypatch):
+    from llm.providers import deepseek_api, qwen_api
+
+    for mod, cls in ((deepseek_api, deepseek_api.DeepSeekProvider), (qwen_api, qwen_api.QwenProvider)):
+        seen = []
+        monkeypatch.setattr(
+            cls,
+            "_post_json",
+            lambda self, url, headers, payload, timeout_s: seen.append((headers, self._ssl_context()))
+            or {"choices": [{"message": {"content": "ok"}}]},
+        )
+        p = cls(api_key="k-1", base_url="https://example.invalid/v1/")
+        assert p.chat([{"role": "user", "content": "hi"}], "m").content == "ok"
+        assert p.chat([{"role": "user", "content": "hi"}], "m").content == "ok"
+
+        assert seen[0][0]["Authorization"] == "Bearer k-1"
+        assert seen[0][0] is seen[1][0]
+        assert seen[0][1] is seen[1][1] is mod._default_ssl_context()
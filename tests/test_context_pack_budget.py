@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import copy
+
+from services import retrieval_service as rs
+
+
+def _entry(i: int) -> dict:
+    return {
+        "entry_id": i,
+        "summary_1_3": f"第{i}天 " + "x" * (i * 7),
+        "topics": ["work"],
+        "facts": ["f" * i],
+        "todos": ["t"],
+    }
+
+
+def _reference_steps(pack: dict, budget: int) -> list:
+    """The original re-serialize-every-step shrink loop."""
+    steps = []
+
+    def over() -> bool:
+        return rs._model_chars(pack) > budget
+
+    if over() and pack["topk"]:
+        rs._trim_entry_fields(pack["topk"], drop_facts=True, drop_todos=True)
+        steps.append("drop_topk_facts_todos")
+    for key, floor in (("recent", 1), ("topk", 1), ("mem_cards", 1 if pack["mem_cards"] else 0)):
+        while over() and len(pack[key]) > floor:
+            pack[key] = pack[key][:-1]
+            steps.append(f"shrink_{key}")
+    for key in ("mem_cards", "topk", "recent"):
+        if over() and pack[key]:
+            pack[key] = []
+            steps.append(f"drop_{key}")
+    return steps
+
+
+def test_incremental_budget_matches_full_reserialization(monkeypatch):
+    recent = [_entry(i) for i in range(1, 7)]
+    topk = [_entry(i) for i in range(10, 15)]
+    cards = [
+        {"card_id": f"c{i}", "type": "topic", "updated_at": "", "confidence": 0.5, "content_json": '{"topics": ["work"]}'}
+        for i in range(4)
+    ]
+    monkeypatch.setattr(rs, "list_recent_entry_summaries", lambda n: copy.deepcopy(recent[:n]))
+    monkeypatch.setattr(rs, "search_entries_brief", lambda q, top_k: copy.deepcopy(topk[:top_k]))
+    monkeypatch.setattr(rs, "list_mem_cards", lambda limit: copy.deepcopy(cards))
+
+    full = rs._model_chars(rs.build_context_pack("work", char_budget=10**9))
+    for budget in range(0, full + 50, 37):
+        pack = rs.build_context_pack("work", char_budget=budget)
+        ref = rs.build_context_pack("work", char_budget=10**9)
+        ref["limits"]["char_budget"] = budget
+        ref_steps = _reference_steps(ref, budget)
+
+        assert pack["meta"]["steps"] == ref_steps
+        assert pack["meta"]["final_chars_model"] == rs._model_chars(ref)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+from storage.repo_entries import count_recent_analysis_topics, insert_entry, save_entry_analysis
+
+
+def _analyzed(created_at: str, analysis_json: str) -> None:
+    entry_id = insert_entry(raw_text=f"entry at {created_at}", created_at=created_at, source="test")
+    save_entry_analysis(entry_id=entry_id, analysis_json=analysis_json, model="test", prompt_version="v1")
+
+
+def test_topics_counted_with_recency_tiebreak(isolated_db):
+    _analyzed("2026-06-01T08:00:00+00:00", json.dumps({"topics": ["old", "work"]}))
+    _analyzed("2026-06-02T08:00:00+00:00", "not json")
+    _analyzed("2026-06-03T08:00:00+00:00", json.dumps({"topics": "sleep"}))
+    _analyzed("2026-06-04T08:00:00+00:00", json.dumps({"topics": [" work ", "", 3, "family"]}))
+    _analyzed("2026-06-05T08:00:00+00:00", json.dumps({"topics": ["sleep", "work"]}))
+
+    assert count_recent_analysis_topics(24, 6) == [("work", 3), ("sleep", 1), ("3", 1), ("family", 1), ("old", 1)]
+    assert count_recent_analysis_topics(2, 1) == [("work", 2)]
+
+
+def test_topics_match_python_strip_numbers_and_nan_rows(isolated_db):
+    _analyzed("2026-06-01T08:00:00+00:00", json.dumps({"topics": ["工作\u3000", "\t运动\n", 0, 1.5, True, False]}))
+    _analyzed("2026-06-02T08:00:00+00:00", '{"score": NaN, "topics": ["运动", "工作", "阅读"]}')
+    _analyzed("2026-06-03T08:00:00+00:00", json.dumps({"topics": ["阅读", "工作"]}))
+
+    assert count_recent_analysis_topics(24, 10) == [
+        ("工作", 3),
+        ("阅读", 2),
+        ("运动", 2),
+        ("1.5", 1),
+        ("True", 1),
+    ]
+
+
+def test_topics_strip_unicode_whitespace_and_spell_numbers_like_str(isolated_db):
+    _analyzed("2026-06-01T08:00:00+00:00", json.dumps({"topics": ["\xa0work", 1e20]}))
+    _analyzed("2026-06-02T08:00:00+00:00", json.dumps({"topics": ["work\u2003", "1e+20"]}))
+
+    assert count_recent_analysis_topics(24, 6) == [("work", 2), ("1e+20", 2)]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from services.diary_file_service import safe_diary_path
+
+
+def test_safe_diary_path_accepts_valid_dates(tmp_path):
+    assert safe_diary_path(Path(tmp_path), "2026-06-08") == Path(tmp_path) / "2026-06-08.txt"
+    assert safe_diary_path(Path(tmp_path), "2024-02-29") == Path(tmp_path) / "2024-02-29.txt"
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    ["", "2026-6-8", "2026-02-30", "2025-02-29", "2026-13-01", "2026-06-08x", "../2026-06-08", "２０２６-06-08"],
+)
+def test_safe_diary_path_rejects_invalid_dates(tmp_path, date_str):
+    with pytest.raises(HTTPException) as exc:
+        safe_diary_path(Path(tmp_path), date_str)
+    assert exc.value.status_code == 400
+    assert exc.value.detail["code"] == "INVALID_DATE"
+
+
+def test_audio_dir_is_recreated_after_deletion(tmp_path):
+    import shutil
+    from types import SimpleNamespace
+
+    from services import diary_file_service
+
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(data_dir=Path(tmp_path))))
+
+    first = diary_file_service.audio_dir(request, "2026-06-08")
+    assert first == Path(tmp_path) / "diaries" / "audio" / "2026-06-08"
+    assert first.is_dir()
+
+    shutil.rmtree(Path(tmp_path) / "diaries")
+    assert diary_file_service.audio_dir(request, "2026-06-08").is_dir()
+
+
+@pytest.mark.parametrize(
+    "filename, content_type, expected",
+    [
+        ("clip.OPUS", "", ".opus"),
+        ("clip.bin", "audio/webm;codecs=opus", ".webm"),
+        ("", "audio/x-wav", ".wav"),
+        ("", "audio/mpeg", ".mp3"),
+        ("", "audio/ogg", ".ogg"),
+        ("", "audio/mp4", ".m4a"),
+        ("", "application/octet-stream", ".webm"),
+    ],
+)
+def test_safe_audio_ext(filename, content_type, expected):
+    from services.diary_file_service import safe_audio_ext
+
+    assert safe_audio_ext(filename, content_type) == expected
+
+
+def test_read_route_revalidates_with_etag(isolated_db, tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import server
+
+    monkeypatch.setattr(server.app.state, "data_dir", Path(tmp_path), raising=False)
+    diary = Path(tmp_path) / "diaries" / "2026-06-08.txt"
+    diary.parent.mkdir(parents=True, exist_ok=True)
+    diary.write_text("早上跑步", encoding="utf-8")
+
+    with TestClient(server.app) as client:
+        first = client.get("/api/diary/read", params={"date": "2026-06-08"})
+        etag = first.headers["etag"]
+        assert first.json()["text"] == "早上跑步"
+
+        cached = client.get("/api/diary/read", params={"date": "2026-06-08"}, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        diary.write_text("早上跑步，晚上读书", encoding="utf-8")
+        changed = client.get("/api/diary/read", params={"date": "2026-06-08"}, headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.json()["text"] == "早上跑步，晚上读书"
+        assert changed.headers["etag"] != etag
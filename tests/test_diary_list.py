@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+import server
+from storage.repo_entries import insert_entry, list_recent_entries_overview
+
+
+def test_overview_returns_bounded_head_and_full_byte_size(isolated_db):
+    text = "  第一行预览\n\n" + ("正文" * 2000)
+    insert_entry(raw_text=text, created_at="2026-06-20T08:00:00+00:00", source="test")
+
+    rows = list_recent_entries_overview(limit=5, head_chars=64)
+
+    assert len(rows) == 1
+    assert "raw_text" not in rows[0]
+    assert rows[0]["raw_text_head"] == text[:64]
+    assert int(rows[0]["size_bytes"]) == len(text.encode("utf-8"))
+
+
+def test_list_route_preview_matches_entry_text(isolated_db):
+    text = "  今天   天气不错\n\n出去走了走。" + ("x" * 5000)
+    insert_entry(raw_text=text, created_at="2026-06-21T08:00:00+00:00", source="test")
+
+    with TestClient(server.app) as client:
+        res = client.get("/api/diary/list", params={"limit": 10})
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["count"] == 1
+    item = body["items"][0]
+    assert item["date"] == "2026-06-21"
+    assert item["preview"] == " ".join(text.strip().split())[:80]
+    assert item["size_bytes"] == len(text.encode("utf-8"))
+    assert item["analysis_status"] == "idle"
+
+
+def test_list_route_pages_with_keyset_cursor(isolated_db):
+    for i in range(5):
+        insert_entry(raw_text=f"entry {i}", created_at="2026-06-22T08:00:00+00:00", source="test")
+    insert_entry(raw_text="older", created_at="2026-06-01T08:00:00+00:00", source="test")
+
+    seen = []
+    params = {"limit": 2}
+    with TestClient(server.app) as client:
+        for _ in range(5):
+            body = client.get("/api/diary/list", params=params).json()
+            seen.extend(item["entry_id"] for item in body["items"])
+            if body["next_before"] is None:
+                break
+            params = {"limit": 2, "before": body["next_before"], "before_id": body["next_before_id"]}
+
+    assert seen == [5, 4, 3, 2, 1, 6]
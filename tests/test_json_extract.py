@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from utils import json_extract
+from utils.json_extract import (
+    dumps_json,
+    dumps_json_bytes,
+    extract_json_span,
+    first_json_object,
+    loads_first_json_object,
+    loads_json,
+)
+
+
+def test_first_json_object_ignores_braces_in_strings_and_trailing_prose():
+    text = 'Sure: {"answer": "use {x} here \\" }", "n": {"k": 1}} and also {not json}'
+    assert first_json_object(text) == '{"answer": "use {x} here \\" }", "n": {"k": 1}}'
+    assert loads_first_json_object(text) == {"answer": 'use {x} here " }', "n": {"k": 1}}
+
+
+def test_falls_back_to_widest_span_when_unbalanced():
+    assert first_json_object('{"a": 1') is None
+    assert extract_json_span('noise {"a": {"b": 2}} tail') == '{"a": {"b": 2}}'
+    assert loads_first_json_object('{"a": NaN}')["a"] != 0
+    with pytest.raises(ValueError):
+        loads_first_json_object("no json here")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_is_compact_utf8_either_way(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extract, "orjson", None)
+    obj = {"文本": "睡眠", "n": [1, 2.5, None], "big": 2**70}
+    assert dumps_json(obj) == '{"文本":"睡眠","n":[1,2.5,null],"big":1180591620717411303424}'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_pretty_matches_stdlib_indent(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extract, "orjson", None)
+    obj = {"request": {"messages": [{"role": "user", "content": "日记"}]}, "n": [1, 2.5, None]}
+    assert dumps_json(obj, pretty=True) == json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_json_accepts_raw_utf8_bytes(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extract, "orjson", None)
+    assert loads_json('{"文本":"睡眠"}'.encode("utf-8")) == {"文本": "睡眠"}
+    assert loads_json(b'{"a":"x\xffy"}') == {"a": "x\ufffdy"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_bytes_is_utf8_of_dumps_json(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extract, "orjson", None)
+    obj = {"messages": [{"role": "user", "content": "今天\n\"引号\""}], "stream": False, "n": 2**70}
+    assert dumps_json_bytes(obj) == dumps_json(obj).encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_keeps_non_finite_floats_like_stdlib(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_extract, "orjson", None)
+    obj = {"score": float("nan"), "hi": [float("inf"), None], "t": ("-inf", float("-inf"))}
+    assert dumps_json(obj) == json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    assert dumps_json(obj, pretty=True) == json.dumps(obj, ensure_ascii=False, indent=2)
+    assert dumps_json_bytes(obj) == dumps_json(obj).encode("utf-8")
+
+
+def test_first_json_object_handles_escaped_backslashes_before_quotes():
+    assert first_json_object(r'{"a":"\\"}tail}') == r'{"a":"\\"}'
+    assert first_json_object(r'{"a":"\\\"}"} x') == r'{"a":"\\\"}"}'
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from storage.repo_llm_calls import enqueue_call, flush_call_audit, insert_call, list_calls
+
+
+def test_enqueued_audit_rows_are_batched_into_the_db_resolved_at_enqueue(isolated_db, monkeypatch, tmp_path):
+    for i in range(5):
+        enqueue_call(provider="ollama", model="local", prompt_version="v1", request_hash=f"h{i}", request_json={"i": i}, ms=i)
+    enqueue_call(provider="deepseek", model="deepseek-chat", prompt_version="v1", request_hash="bad", status="weird")
+
+    # Rows keep the DB they were enqueued for even if the env moves on before the flush.
+    monkeypatch.setenv("DIARY_DB_PATH", str(tmp_path / "other.sqlite3"))
+    flush_call_audit()
+    monkeypatch.setenv("DIARY_DB_PATH", str(isolated_db))
+
+    rows = list_calls(newest_first=False)
+    assert [r["request_hash"] for r in rows] == ["h0", "h1", "h2", "h3", "h4", "bad"]
+    assert rows[0]["request_json"] == {"i": 0}
+    assert (rows[-1]["status"], rows[-1]["error"]) == ("failed", "invalid status")
+
+
+def test_insert_call_still_returns_row_id(isolated_db):
+    call_id = insert_call(provider="ollama", model="local", prompt_version="v1", request_hash="x")
+    assert list_calls()[0]["id"] == call_id
@@ -1,4 +1,7 @@
+import asyncio
+
 from pipeline import memory_update as mu
+from storage.repo_entries import insert_entry
 
 
 def test_mem_update_uses_cloud_when_cloud_enabled(monkeypatch):
@@ -18,3 +21,27 @@ def test_mem_update_force_local_overrides_cloud(monkeypatch):
 def test_mem_update_local_llm_disabled_by_default(monkeypatch):
     monkeypatch.delenv("MEM_UPDATE_USE_LOCAL_LLM", raising=False)
     assert mu._should_use_local_mem_llm() is False
+
+
+def test_mem_update_closes_the_local_client_it_creates(monkeypatch, isolated_db):
+    created = []
+
+    class _FakeClient:
+        def __init__(self):
+            self.closed = False
+            created.append(self)
+
+        async def chat_text(self, **kwargs):
+            return '{"ops": []}', 1
+
+        async def aclose(self):
+            self.closed = True
+
+    monkeypatch.setenv("MEM_UPDATE_FORCE_LOCAL", "1")
+    monkeypatch.setenv("MEM_UPDATE_USE_LOCAL_LLM", "1")
+    monkeypatch.setattr(mu, "OllamaClient", _FakeClient)
+
+    entry_id = insert_entry(raw_text="最近工作节奏有点乱。", source="test")
+    asyncio.run(mu.update_mem_cards(entry_id=entry_id, analysis_json={"topics": ["work"]}))
+
+    assert len(created) == 1 and created[0].closed
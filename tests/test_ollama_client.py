@@ -63,3 +63,82 @@ def test_ensure_server_available_returns_false_without_binary(monkeypatch):
     ok = asyncio.run(client.ensure_server_available(startup_timeout_s=1.0, autostart=True))
 
     assert ok is False
+
+
+def test_post_json_reuses_keepalive_connection_and_maps_http_errors():
+    import json
+    import threading
+    import urllib.error
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import pytest
+
+    peers: list[int] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            peers.append(self.client_address[1])
+            status = 404 if self.path == "/api/missing" else 200
+            out = json.dumps({"echo": json.loads(body)}).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(out)))
+            self.end_headers()
+            self.wfile.write(out)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OllamaClient(base_url=f"http://127.0.0.1:{server.server_port}")
+    try:
+        assert client._post_json_sync(f"{client.base_url}/api/chat", {"n": 1}) == {"echo": {"n": 1}}
+        assert client._post_json_sync(f"{client.base_url}/api/chat", {"n": 2}) == {"echo": {"n": 2}}
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            client._post_json_sync(f"{client.base_url}/api/missing", {"n": 3})
+        assert exc.value.code == 404
+        assert len(set(peers)) == 1
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_chat_runs_blocking_http_on_dedicated_pool(monkeypatch):
+    import threading
+
+    client = OllamaClient(base_url="http://127.0.0.1:11434")
+    threads: list[str] = []
+
+    def fake_post(url, payload):
+        threads.append(threading.current_thread().name)
+        return {"message": {"role": "assistant", "content": "ok"}}
+
+    monkeypatch.setattr(client, "_post_json_sync", fake_post)
+    text, _ms = asyncio.run(client.chat_text(model="m", messages=[{"role": "user", "content": "hi"}]))
+
+    assert text == "ok"
+    assert threads and threads[0].startswith("ollama-http")
+
+
+def test_client_env_defaults_are_parsed_once_until_cleared(monkeypatch):
+    from llm import ollama_client
+
+    monkeypatch.setenv("OLLAMA_MAX_RETRIES", "5")
+    monkeypatch.setenv("OLLAMA_KEEP_ALIVE", "1h")
+    ollama_client._ollama_env.cache_clear()
+    try:
+        assert (OllamaClient().max_retries, OllamaClient().default_keep_alive) == (5, "1h")
+
+        monkeypatch.setenv("OLLAMA_MAX_RETRIES", "0")
+        assert OllamaClient().max_retries == 5
+        assert OllamaClient(max_retries=1).max_retries == 1
+
+        ollama_client._ollama_env.cache_clear()
+        assert OllamaClient().max_retries == 0
+    finally:
+        ollama_client._ollama_env.cache_clear()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from storage.db_core import read_connection
+from storage.repo_audio import list_recent_audio_analyses
+from storage.repo_entries import list_recent_entries_overview
+from storage.repo_jobs import block_job_status_counts
+
+
+def _plan(sql: str, params: tuple = ()) -> str:
+    return " | ".join(str(r[3]) for r in read_connection().execute("EXPLAIN QUERY PLAN " + sql, params))
+
+
+def _captured_statements(call) -> list[str]:
+    """SQL (with bound parameters expanded) that `call` runs on the pooled read connection."""
+    conn = read_connection()
+    seen: list[str] = []
+    conn.set_trace_callback(seen.append)
+    try:
+        call()
+    finally:
+        conn.set_trace_callback(None)
+    return [s for s in seen if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+
+
+@pytest.mark.parametrize(
+    "call, index_name",
+    [
+        (block_job_status_counts, "idx_block_jobs_status"),
+        (lambda: list_recent_entries_overview(30), "idx_entries_created_at"),
+        (lambda: list_recent_entries_overview(30, before="2026-01-01", before_id=1), "idx_entries_created_at"),
+        (lambda: list_recent_audio_analyses(30), "idx_audio_entries_created_at"),
+    ],
+)
+def test_repo_hot_reads_use_an_index(isolated_db, call, index_name):
+    statements = _captured_statements(call)
+    assert statements
+    plan = " | ".join(_plan(sql) for sql in statements)
+    assert index_name in plan
+
+
+@pytest.mark.parametrize(
+    "sql, index_name",
+    [
+        # api/routes_meta.py and api/routes_health.py (importing those needs FastAPI).
+        ("SELECT id, created_at FROM entries ORDER BY created_at DESC LIMIT 1", "idx_entries_created_at"),
+        ("SELECT entry_id FROM entry_analysis ORDER BY created_at DESC LIMIT 24", "idx_entry_analysis_created_at"),
+    ],
+)
+def test_route_hot_reads_use_an_index(isolated_db, sql, index_name):
+    plan = _plan(sql)
+    assert index_name in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from storage.db_core import read_connection
+from storage.repo_entries import insert_entry
+
+
+def _count_entries() -> int:
+    return int(read_connection().execute("SELECT COUNT(*) AS n FROM entries").fetchone()["n"])
+
+
+def test_read_connection_is_reused_and_sees_new_commits(isolated_db):
+    assert read_connection() is read_connection()
+    assert _count_entries() == 0
+
+    insert_entry(raw_text="visible to the cached reader", source="test")
+
+    assert _count_entries() == 1
+
+
+def test_read_connection_rejects_writes(isolated_db):
+    with pytest.raises(sqlite3.OperationalError):
+        read_connection().execute("DELETE FROM entries")
+
+
+def test_read_connection_follows_db_path(monkeypatch, isolated_db, tmp_path):
+    first = read_connection()
+    monkeypatch.setenv("DIARY_DB_PATH", str(tmp_path / "other.sqlite3"))
+    assert read_connection() is not first
+
+
+def test_repo_reads_share_the_pooled_connection_and_see_writes(isolated_db):
+    from storage.db_core import _conn_ro
+    from storage.repo_entries import list_recent_entries
+
+    with _conn_ro() as first:
+        pass
+    with _conn_ro() as second:
+        assert second is first is read_connection()
+
+    assert list_recent_entries(5) == []
+    insert_entry(raw_text="written after the reader was cached", source="test")
+    assert [r["raw_text"] for r in list_recent_entries(5)] == ["written after the reader was cached"]
+
+
+def test_read_snapshot_ends_its_transaction(isolated_db):
+    from storage.db_core import read_snapshot
+
+    with read_snapshot() as conn:
+        assert conn.in_transaction
+        assert _count_entries() == 0
+    assert not read_connection().in_transaction
+
+    insert_entry(raw_text="visible after the snapshot closed", source="test")
+    with read_snapshot():
+        assert _count_entries() == 1
+
+
+_INSERT_SQL = "INSERT INTO entries(created_at, raw_text, source, sha256) VALUES(?, ?, ?, ?)"
+
+
+def test_write_transactions_reuse_thread_connection_and_nest_safely(isolated_db):
+    from storage.db_core import _conn_txn, transaction
+
+    with transaction() as first:
+        first.execute(_INSERT_SQL, ("2026-01-01T00:00:00+00:00", "a", "t", "h1"))
+        with _conn_txn() as nested:
+            assert nested is not first  # already inside a transaction: fresh connection
+            nested.execute("SELECT COUNT(*) FROM entries").fetchone()
+    with _conn_txn() as again:
+        assert again is first
+
+    with pytest.raises(RuntimeError):
+        with transaction() as failing:
+            failing.execute(_INSERT_SQL, ("2026-01-02T00:00:00+00:00", "b", "t", "h2"))
+            raise RuntimeError("boom")
+    with transaction() as after:
+        assert after is not failing  # a failed transaction's connection is not reused
+
+    assert _count_entries() == 1
+
+
+def test_base_exception_in_transaction_releases_write_lock(isolated_db):
+    from storage.db_core import connect, transaction
+
+    class _Abort(BaseException):
+        pass
+
+    with pytest.raises(_Abort):
+        with transaction() as aborted:
+            aborted.execute(_INSERT_SQL, ("2026-01-03T00:00:00+00:00", "c", "t", "h3"))
+            raise _Abort()
+
+    other = connect(isolated_db)
+    try:
+        other.execute("BEGIN IMMEDIATE;")  # would raise "database is locked" if still held
+        other.rollback()
+    finally:
+        other.close()
+    with transaction() as after:
+        assert after is not aborted  # the aborted connection was dropped from the pool
+    assert _count_entries() == 0
+
+
+def test_close_thread_connections_closes_other_threads_pools(isolated_db, tmp_path):
+    import threading
+
+    from storage.db_core import close_thread_connections, transaction
+
+    held = {}
+    ready, done = threading.Event(), threading.Event()
+
+    def _worker():
+        held["read"] = read_connection()
+        with transaction() as conn:
+            held["write"] = conn
+        ready.set()
+        done.wait(5)  # keep the thread (and its cache) alive while closing
+
+    t = threading.Thread(target=_worker)
+    t.start()
+    ready.wait(5)
+    other = read_connection(tmp_path / "other.sqlite3")
+
+    close_thread_connections(isolated_db)
+    done.set()
+    t.join()
+
+    for conn in (held["read"], held["write"]):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert other.execute("SELECT 1").fetchone()[0] == 1  # other paths are left alone
+    assert read_connection() is not held["read"]
+    assert _count_entries() == 0
@@ -128,3 +128,18 @@ def test_prioritize_entry_jobs_clears_lease_fields_on_reset(isolated_db):
     assert row["leased_by"] is None
     assert row["leased_until"] is None
     assert row["last_error"] is None
+
+
+def test_block_job_status_counts_totals_in_one_query(isolated_db):
+    assert db.block_job_status_counts() == {
+        "pending": 0, "running": 0, "done": 0, "failed": 0, "skipped": 0, "total": 0,
+    }
+
+    entry_id = db.insert_entry(raw_text="x" * 200, source="test")
+    for idx, status in enumerate(["pending", "pending", "failed", "done"]):
+        block_id = db.insert_entry_block(entry_id=entry_id, idx=idx, title="t", raw_text="x" * 200)
+        db.insert_block_job(block_id=block_id, status=status, attempts=0)
+
+    assert db.block_job_status_counts() == {
+        "pending": 2, "running": 0, "done": 1, "failed": 1, "skipped": 0, "total": 4,
+    }
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+
+from llm.request_store import _redact_sensitive, hash_request, store_call, store_request
+
+
+def test_redact_copies_only_the_path_to_secrets():
+    msgs = [{"role": "user", "content": "hi"}]
+    clean = {"messages": msgs, "params": {"temperature": 0}}
+    assert _redact_sensitive(clean) is clean
+
+    dirty = {"messages": msgs, "params": {"api_key": "sk-1", "nested": [{"token": "t"}]}}
+    out = _redact_sensitive(dirty)
+    assert out == {"messages": msgs, "params": {"api_key": "***REDACTED***", "nested": [{"token": "***REDACTED***"}]}}
+    assert out["messages"] is msgs
+    assert dirty["params"]["api_key"] == "sk-1"
+
+
+def test_hash_request_ignores_secret_values_and_key_order():
+    base = dict(provider="deepseek", model="m", messages=[{"role": "user", "content": "hi"}], prompt_version="v1")
+    a = hash_request(params={"temperature": 0, "api_key": "one"}, **base)
+    b = hash_request(params={"api_key": "two", "temperature": 0}, **base)
+    assert a == b
+    assert a != hash_request(params={"temperature": 1}, **base)
+
+
+def test_store_call_writes_only_given_parts_with_redaction(tmp_path):
+    d = store_call("abc", request={"messages": [], "api_key": "sk-1"}, meta={"ok": False}, data_dir=tmp_path)
+
+    assert d == tmp_path / "requests" / "abc"
+    assert sorted(p.name for p in d.iterdir()) == ["meta.json", "request.json"]
+    assert json.loads((d / "request.json").read_text(encoding="utf-8")) == {"messages": [], "api_key": "***REDACTED***"}
+    assert (d / "request.json").read_text(encoding="utf-8") == store_request(
+        "same", {"messages": [], "api_key": "sk-1"}, data_dir=tmp_path
+    ).read_text(encoding="utf-8")
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pipeline.rollup_entry import _merge_signals
+
+
+def test_merge_signals_latest_non_null_wins_per_key():
+    blocks = [
+        {"signals": {"mood": 3, "stress": 9, "sleep": 4, "exercise": None, "social": 2, "work": 7}},
+        {"signals": "bad"},
+        {"signals": {"mood": 6, "stress": None, "sleep": 11, "exercise": None, "social": None, "work": 5}},
+        {},
+    ]
+
+    assert _merge_signals(blocks) == {"mood": 6, "stress": 9, "sleep": 4, "exercise": None, "social": 2, "work": 5}
+    assert _merge_signals([]) == dict.fromkeys(("mood", "stress", "sleep", "exercise", "social", "work"))
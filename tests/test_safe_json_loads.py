@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from storage import db_core
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_safe_json_loads_with_and_without_orjson(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(db_core, "orjson", None)
+    assert db_core._safe_json_loads('{"topics": ["工作"], "n": 1}') == {"topics": ["工作"], "n": 1}
+    assert db_core._safe_json_loads('{"x": NaN}')["x"] != 0
+    assert db_core._safe_json_loads("not json") is None
+    assert db_core._safe_json_loads("") is None
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson  # type: ignore  # optional: faster decoding
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def extract_json_span(text: str) -> str:
+    """Widest `{ ... }` span (first '{' to last '}'); input for the repair passes."""
+    if not text:
+        return text
+    s = text.find("{")
+    e = text.rfind("}")
+    if s == -1 or e == -1 or e <= s:
+        return text.strip()
+    return text[s : e + 1].strip()
+
+
+# Only these characters change scanner state; everything between them is skipped at C speed.
+_STRUCT_RE = re.compile(r'[{}"\\]')
+
+
+def first_json_object(text: str) -> Optional[str]:
+    """
+    First brace-balanced `{ ... }` in `text`, scanning once and skipping braces inside strings.
+    Returns None when no object closes (e.g. truncated output).
+    """
+    start = (text or "").find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    skip_to = start  # position after an escaped character
+    for m in _STRUCT_RE.finditer(text, start):
+        i = m.start()
+        if i < skip_to:
+            continue
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                skip_to = i + 2
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    return None
+
+
+def loads_json(s: Union[str, bytes]) -> Any:
+    """
+    json.loads, via orjson when installed. Raises ValueError on invalid input.
+    Raw UTF-8 bytes (e.g. an HTTP body) are parsed without decoding to str first;
+    on the fallback path invalid bytes are replaced, like decode(errors="replace").
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except Exception:
+            pass  # NaN/Infinity, bad UTF-8 etc.: let the stdlib parser decide
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode("utf-8", errors="replace")
+    return json.loads(s)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _orjson_dumps(obj: Any, option: int) -> Optional[bytes]:
+    """orjson bytes, or None when the stdlib must decide (big ints, non-serialisable types, NaN/Infinity)."""
+    try:
+        out = orjson.dumps(obj, option=option)
+    except Exception:
+        return None
+    # orjson writes NaN/Infinity as null instead of raising; only scan when a null is present.
+    if b"null" in out and _has_non_finite(obj):
+        return None
+    return out
+
+
+def dumps_json(obj: Any, *, pretty: bool = False) -> str:
+    """Compact (or 2-space indented) UTF-8 JSON text, no ASCII escaping.
+
+    NaN/Infinity are written as by the stdlib with or without orjson. With orjson some floats
+    are spelled differently (1e16 vs 1e+16) but parse back to the same value.
+    """
+    if orjson is not None:
+        out = _orjson_dumps(obj, orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        if out is not None:
+            return out.decode("utf-8")
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """dumps_json(obj).encode("utf-8") without the intermediate str when orjson is installed (HTTP bodies)."""
+    if orjson is not None:
+        out = _orjson_dumps(obj, orjson.OPT_NON_STR_KEYS)
+        if out is not None:
+            return out
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_first_json_object(text: str) -> Any:
+    """
+    Decode the JSON object in model output.
+    Tries the first balanced object (robust to trailing prose with braces), then the widest span.
+    """
+    cand = first_json_object(text)
+    if cand is not None:
+        try:
+            return loads_json(cand)
+        except ValueError:
+            pass
+    return loads_json(extract_json_span(text))
@@ -36,6 +36,8 @@ def redact_messages(
     Supports keys:
       - {"role": "...", "content": "..."}
       - {"idx": 1, "text": "..."}
+
+    Every returned dict is a fresh shallow copy, so callers may mutate them freely.
     """
     out: List[Dict[str, Any]] = []
     for m in messages:
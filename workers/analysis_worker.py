@@ -61,10 +61,7 @@ def _mark_job_failed(job_id: int, err: str) -> None:
 
 
 def _job_stats() -> dict:
-    statuses = ["pending", "running", "done", "failed", "skipped"]
-    out = {s: int(db.count_block_jobs_by_status(s)) for s in statuses}
-    out["total"] = sum(out.values())
-    return out
+    return db.block_job_status_counts()
 
 
 def _has_any_signal_value(signals: Any) -> bool: